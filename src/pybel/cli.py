@@ -18,12 +18,12 @@ import logging
 import os
 import sys
 import time
+from itertools import islice
 from typing import List, Optional
 
 import click
 from click_plugins import with_plugins
 from pkg_resources import iter_entry_points
-from tqdm import tqdm
 
 from .canonicalize import to_bel_script
 from .constants import get_cache_connection
@@ -36,7 +36,7 @@ from .io import (
 from .io.bel_commons_client import _get_host, _get_password, _get_user
 from .manager import Manager
 from .manager.database_io import to_database
-from .manager.models import Edge, Namespace, Node
+from .manager.models import Namespace
 from .struct import get_unused_annotations, get_unused_list_annotation_values, get_unused_namespaces
 from .struct.graph import BELGraph, WarningTuple
 from .utils import get_corresponding_pickle_path
@@ -135,13 +135,14 @@ def parse(text: str, pprint: bool):
 @click.option('--no-citation-clearing', is_flag=True, help='Turn off citation clearing')
 @click.option('-r', '--required-annotations', multiple=True, help='Specify multiple required annotations')
 @click.option('--upgrade-urls', is_flag=True)
+@click.option('-p', '--processes', type=int, help='Parse statements in this many worker processes')
 @click.option('--skip-tqdm', is_flag=True)
 @click.option('-v', '--verbose', is_flag=True)
 @click.pass_obj
 def compile(
     manager, path, allow_naked_names, disallow_nested, disallow_unqualified_translocations,
     no_identifier_validation, no_citation_clearing, required_annotations, upgrade_urls,
-    skip_tqdm, verbose,
+    processes, skip_tqdm, verbose,
 ):
     """Compile a BEL script to a graph."""
     if verbose:
@@ -164,6 +165,7 @@ def compile(
         no_identifier_validation=no_identifier_validation,
         allow_definition_failures=True,
         upgrade_urls=upgrade_urls,
+        processes=processes,
     )
     if skip_tqdm:
         click.echo('```')
@@ -438,10 +440,10 @@ def ls(manager: Manager):
 def drop(manager: Manager, network_id: Optional[int], yes):
     """Drop a network by its identifier or drop all networks."""
     if network_id:
-        manager.drop_network_by_id(network_id)
+        click.echo('Dropped {}'.format(manager.drop_network_by_id(network_id)))
 
     elif yes or click.confirm('Drop all networks?'):
-        manager.drop_networks()
+        click.echo('Dropped {}'.format(manager.drop_networks()))
 
 
 @manage.group()
@@ -451,20 +453,20 @@ def edges():
 
 @edges.command()  # noqa:F811
 @click.option('--offset', type=int)
+@click.option('--after', type=int, help='Only list edges whose identifiers are greater than this')
 @click.option('--limit', type=int, default=10)
+@click.option('--ids', is_flag=True, help='Show the identifiers of the edges')
 @click.pass_obj
-def ls(manager: Manager, offset: Optional[int], limit: Optional[int]):
+def ls(manager: Manager, offset: Optional[int], after: Optional[int], limit: Optional[int], ids: bool):
     """List edges."""
-    q = manager.session.query(Edge)
+    edges = manager.iterate_edges(after=after)
 
-    if offset:
-        q = q.offset(offset)
+    if offset or limit > 0:
+        start = offset or 0
+        edges = islice(edges, start, start + limit if limit > 0 else None)
 
-    if limit > 0:
-        q = q.limit(limit)
-
-    for e in q:
-        click.echo(e.bel)
+    for e in edges:
+        click.echo('{}\t{}'.format(e.id, e.bel) if ids else e.bel)
 
 
 @manage.group()
@@ -475,14 +477,8 @@ def nodes():
 @nodes.command()
 @click.pass_obj
 def prune(manager: Manager):
-    """Prune nodes not belonging to any edges."""
-    nodes_to_delete = [
-        node
-        for node in tqdm(manager.session.query(Node), total=manager.count_nodes())
-        if not node.networks
-    ]
-    manager.session.delete(nodes_to_delete)
-    manager.session.commit()
+    """Prune nodes not belonging to any networks or edges, and edges and evidences not belonging to any networks."""
+    click.echo('Pruned {}'.format(manager.prune()))
 
 
 @manage.command()  # noqa:F811
@@ -20,6 +20,8 @@ logger = logging.getLogger(__name__)
 #: The last PyBEL version where the graph data definition changed
 PYBEL_MINIMUM_IMPORT_VERSION = 0, 14, 0
 
+#: The options from the ``pybel`` section of the configuration file. :class:`configparser.ConfigParser` makes their
+#: names lowercase, so they're looked up in lowercase, like ``connection`` and ``edge_digest``.
 config = {}
 
 PYBEL_CACHE_DIRECTORY = 'PYBEL_CACHE_DIRECTORY'
@@ -63,3 +65,24 @@ else:  # This means that there will have to be a cache directory created
     os.makedirs(CACHE_DIRECTORY, exist_ok=True)
     connection = DEFAULT_CACHE_CONNECTION
     logger.info('no configuration found, using default sqlite connection %s', connection)
+
+#: The environment variable that contains the directory where memory-mapped namespace term indexes are stored
+PYBEL_TERM_INDEX_DIRECTORY = 'PYBEL_TERM_INDEX_DIRECTORY'
+
+#: The directory where namespace term indexes are stored, or None if they aren't used.
+#: See :class:`pybel.parser.term_index.TermIndex`.
+term_index_directory = os.environ.get(PYBEL_TERM_INDEX_DIRECTORY) or config.get('term_index_directory')
+
+#: The environment variable that contains the directory where merged query universes are stored
+PYBEL_UNIVERSE_CACHE_DIRECTORY = 'PYBEL_UNIVERSE_CACHE_DIRECTORY'
+
+#: The directory where merged query universes are stored between processes, or None if they're only kept in memory.
+#: See :meth:`pybel.manager.NetworkManager.get_universe_by_ids`.
+universe_cache_directory = os.environ.get(PYBEL_UNIVERSE_CACHE_DIRECTORY) or config.get('universe_cache_directory')
+
+#: The environment variable that contains the directory where responses from PubMed E-Utils are stored
+PYBEL_PUBMED_CACHE_DIRECTORY = 'PYBEL_PUBMED_CACHE_DIRECTORY'
+
+#: The directory where responses from PubMed E-Utils are stored so PubMed identifiers are only looked up once, or
+#: None if they aren't stored. See :func:`pybel.manager.citation_utils.get_citations_by_pmids`.
+pubmed_cache_directory = os.environ.get(PYBEL_PUBMED_CACHE_DIRECTORY) or config.get('pubmed_cache_directory')
@@ -13,9 +13,19 @@ the :class:`pybel.BELGraph`, the nodes are instances of subclasses
 of :class:`pybel.dsl.BaseEntity`.
 """
 
+from .compact import (
+    CompactAbundance, CompactEntity, CompactFragment, CompactFusion, CompactGeneModification, CompactHgvs,
+    CompactListAbundance, CompactProteinModification, CompactReaction, compact_from_json, to_compact,
+)
 from .constants import FUNC_TO_DSL, FUNC_TO_FUSION_DSL, FUNC_TO_LIST_DSL
 from .edges import activity, cell_surface_expression, degradation, location, secretion, translocation
-from .exc import InferCentralDogmaException, ListAbundanceEmptyException, PyBELDSLException, ReactionEmptyException
+from .exc import (
+    FrozenEntityException, InferCentralDogmaException, ListAbundanceEmptyException, PyBELDSLException,
+    ReactionEmptyException,
+)
+from .interning import (
+    NodeInternTable, get_intern_table, intern_node, interning, is_interning_enabled, set_interning,
+)
 from .namespaces import chebi, hgnc, mirbase
 from .node_classes import (
     Abundance, BaseAbundance, BaseConcept, BaseEntity, BiologicalProcess, CentralDogma, ComplexAbundance,
@@ -0,0 +1,480 @@
+# -*- coding: utf-8 -*-
+
+"""A compact representation of nodes using ``__slots__`` and named tuples.
+
+In the dictionary-based DSL, each node, its concept, each of its variants, and each
+of their concepts are separate dictionaries. For graphs with millions of nodes,
+this overhead dominates the memory usage. The classes in this module store the same
+information in slotted objects and tuples, while keeping the accessors from
+:class:`pybel.dsl.BaseConcept` (``namespace``, ``name``, ``identifier``, ``variants``, etc.)
+
+Compact nodes hash and compare equal to the dictionary-based nodes with the same
+canonical BEL and can be losslessly converted back and forth.
+
+>>> from pybel.dsl import Protein, Fragment, to_compact
+>>> node = Protein(namespace='HGNC', name='APP', variants=[Fragment(start=672, stop=713)])
+>>> compact_node = to_compact(node)
+>>> assert compact_node == node
+>>> assert compact_node.to_dsl() == node
+"""
+
+import hashlib
+from abc import ABCMeta, abstractmethod
+from typing import Any, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from .constants import FUNC_TO_DSL, FUNC_TO_FUSION_DSL, FUNC_TO_LIST_DSL
+from .node_classes import (
+    BaseAbundance, BaseEntity, CentralDogma, ComplexAbundance, EnumeratedFusionRange, Fragment, FusionBase,
+    FusionRangeBase, GeneModification, Hgvs, ListAbundance, ProteinModification, Reaction, Variant,
+)
+from ..constants import (
+    CONCEPT, FRAGMENT, FRAGMENT_DESCRIPTION, FRAGMENT_START, FRAGMENT_STOP, FUSION_MISSING, FUSION_REFERENCE,
+    FUSION_START, FUSION_STOP, GMOD, HGVS, IDENTIFIER, KIND, NAME, NAMESPACE, PMOD, PMOD_CODE, PMOD_POSITION,
+    VARIANTS, XREFS,
+)
+from ..language import Entity
+
+__all__ = [
+    'CompactEntity',
+    'CompactAbundance',
+    'CompactListAbundance',
+    'CompactReaction',
+    'CompactFusion',
+    'CompactHgvs',
+    'CompactFragment',
+    'CompactProteinModification',
+    'CompactGeneModification',
+    'to_compact',
+    'compact_from_json',
+]
+
+#: A compact cross-reference as a triple of (namespace, name, identifier)
+CompactXref = Tuple[str, Optional[str], Optional[str]]
+
+
+def _xrefs_to_compact(xrefs: Optional[List[Mapping[str, str]]]) -> Optional[Tuple[CompactXref, ...]]:
+    if not xrefs:
+        return None
+    return tuple(
+        (xref[NAMESPACE], xref.get(NAME), xref.get(IDENTIFIER))
+        for xref in xrefs
+    )
+
+
+def _xrefs_to_dsl(xrefs: Optional[Tuple[CompactXref, ...]]) -> Optional[List[Entity]]:
+    if not xrefs:
+        return None
+    return [
+        Entity(namespace=namespace, name=name, identifier=identifier)
+        for namespace, name, identifier in xrefs
+    ]
+
+
+class CompactHgvs(NamedTuple):
+    """A compact HGVS variant."""
+
+    variant: str
+
+    def to_dsl(self) -> Hgvs:
+        """Convert this variant to the dictionary-based DSL."""
+        return Hgvs(self.variant)
+
+
+class CompactFragment(NamedTuple):
+    """A compact fragment variant."""
+
+    start: Union[None, int, str] = None
+    stop: Union[None, int, str] = None
+    description: Optional[str] = None
+
+    def to_dsl(self) -> Fragment:
+        """Convert this variant to the dictionary-based DSL."""
+        return Fragment(start=self.start, stop=self.stop, description=self.description)
+
+
+class CompactProteinModification(NamedTuple):
+    """A compact protein modification variant."""
+
+    namespace: str
+    name: Optional[str] = None
+    identifier: Optional[str] = None
+    code: Optional[str] = None
+    position: Optional[int] = None
+    xrefs: Optional[Tuple[CompactXref, ...]] = None
+
+    def to_dsl(self) -> ProteinModification:
+        """Convert this variant to the dictionary-based DSL."""
+        return ProteinModification(
+            namespace=self.namespace,
+            name=self.name,
+            identifier=self.identifier,
+            code=self.code,
+            position=self.position,
+            xrefs=_xrefs_to_dsl(self.xrefs),
+        )
+
+
+class CompactGeneModification(NamedTuple):
+    """A compact gene modification variant."""
+
+    namespace: str
+    name: Optional[str] = None
+    identifier: Optional[str] = None
+    xrefs: Optional[Tuple[CompactXref, ...]] = None
+
+    def to_dsl(self) -> GeneModification:
+        """Convert this variant to the dictionary-based DSL."""
+        return GeneModification(
+            namespace=self.namespace,
+            name=self.name,
+            identifier=self.identifier,
+            xrefs=_xrefs_to_dsl(self.xrefs),
+        )
+
+
+CompactVariant = Union[CompactHgvs, CompactFragment, CompactProteinModification, CompactGeneModification]
+
+#: A compact fusion range as a triple of (reference, start, stop). Missing ranges are represented with None.
+CompactFusionRange = Optional[Tuple[str, Union[int, str], Union[int, str]]]
+
+
+def _variant_to_compact(variant: Variant) -> CompactVariant:
+    kind = variant[KIND]
+    if kind == HGVS:
+        return CompactHgvs(variant[HGVS])
+    if kind == FRAGMENT:
+        return CompactFragment(
+            start=variant.get(FRAGMENT_START),
+            stop=variant.get(FRAGMENT_STOP),
+            description=variant.get(FRAGMENT_DESCRIPTION),
+        )
+    if kind == PMOD:
+        concept = variant[CONCEPT]
+        return CompactProteinModification(
+            namespace=concept[NAMESPACE],
+            name=concept.get(NAME),
+            identifier=concept.get(IDENTIFIER),
+            code=variant.get(PMOD_CODE),
+            position=variant.get(PMOD_POSITION),
+            xrefs=_xrefs_to_compact(variant.get(XREFS)),
+        )
+    if kind == GMOD:
+        concept = variant[CONCEPT]
+        return CompactGeneModification(
+            namespace=concept[NAMESPACE],
+            name=concept.get(NAME),
+            identifier=concept.get(IDENTIFIER),
+            xrefs=_xrefs_to_compact(variant.get(XREFS)),
+        )
+    raise ValueError('invalid variant kind: {}'.format(kind))
+
+
+def _fusion_range_to_compact(fusion_range: FusionRangeBase) -> CompactFusionRange:
+    if FUSION_MISSING in fusion_range:
+        return None
+    return fusion_range[FUSION_REFERENCE], fusion_range[FUSION_START], fusion_range[FUSION_STOP]
+
+
+def _fusion_range_to_dsl(fusion_range: CompactFusionRange) -> Optional[EnumeratedFusionRange]:
+    if fusion_range is None:
+        return None
+    reference, start, stop = fusion_range
+    return EnumeratedFusionRange(reference=reference, start=start, stop=stop)
+
+
+class CompactEntity(metaclass=ABCMeta):
+    """The superclass for compact nodes."""
+
+    __slots__ = ('function', '_bel', '_hash', '__weakref__')
+
+    def __init__(self, function: str) -> None:
+        """Build a compact node.
+
+        :param function: The BEL function of the node
+        """
+        self.function = function
+        self._bel = None
+        self._hash = None
+
+    @abstractmethod
+    def to_dsl(self) -> BaseEntity:
+        """Convert this node to the dictionary-based DSL."""
+
+    def to_json(self) -> BaseEntity:
+        """Convert this node to its JSON form, which is the same as the dictionary-based DSL."""
+        return self.to_dsl()
+
+    def as_bel(self, use_identifiers: bool = True) -> str:
+        """Return this node as a BEL string."""
+        return self.to_dsl().as_bel(use_identifiers=use_identifiers)
+
+    @property
+    def bel(self) -> str:
+        """Get the canonical BEL string for this node, which is cached."""
+        if self._bel is None:
+            self._bel = self.as_bel()
+        return self._bel
+
+    @property
+    def md5(self) -> str:
+        """Get the MD5 hash of this node."""
+        return hashlib.md5(self.bel.encode('utf8')).hexdigest()  # noqa: S303
+
+    def __hash__(self):  # noqa: D105
+        if self._hash is None:
+            self._hash = hash(self.bel)
+        return self._hash
+
+    def __getstate__(self):  # noqa: D105
+        # The hash of a string is salted differently in each process, so it's reset
+        # and recalculated after unpickling
+        state = {
+            slot: getattr(self, slot)
+            for cls in type(self).__mro__
+            for slot in getattr(cls, '__slots__', ())
+            if slot != '__weakref__' and hasattr(self, slot)
+        }
+        state['_hash'] = None
+        return None, state
+
+    def __eq__(self, other):  # noqa: D105
+        if self is other:
+            return True
+        if not isinstance(other, (CompactEntity, BaseEntity)):
+            return NotImplemented
+        return self.bel == other.bel
+
+    def __repr__(self):  # noqa: D105
+        return '<CompactBEL {bel}>'.format(bel=self.bel)
+
+    def __str__(self):  # noqa: D105
+        return self.bel
+
+
+class _CompactConcept(CompactEntity):
+    """A compact node that might be named by a concept."""
+
+    __slots__ = ('namespace', 'name', 'identifier', 'xrefs')
+
+    def __init__(
+        self,
+        function: str,
+        namespace: Optional[str] = None,
+        name: Optional[str] = None,
+        identifier: Optional[str] = None,
+        xrefs: Optional[Tuple[CompactXref, ...]] = None,
+    ) -> None:
+        super().__init__(function)
+        self.namespace = namespace
+        self.name = name
+        self.identifier = identifier
+        self.xrefs = xrefs
+
+    @property
+    def entity(self) -> Optional[Entity]:  # noqa:D401
+        """This node's concept."""
+        if self.namespace is None:
+            return None
+        return Entity(namespace=self.namespace, name=self.name, identifier=self.identifier)
+
+    @property
+    def curie(self) -> str:  # noqa: D401
+        """The CURIE-style identifier for this node."""
+        return self.entity.curie
+
+    @property
+    def obo(self) -> str:  # noqa: D401
+        """The OBO-style identifier for this node."""
+        return self.entity.obo
+
+
+class CompactAbundance(_CompactConcept):
+    """A compact named node, optionally with variants."""
+
+    __slots__ = ('variants',)
+
+    def __init__(
+        self,
+        function: str,
+        namespace: str,
+        name: Optional[str] = None,
+        identifier: Optional[str] = None,
+        xrefs: Optional[Tuple[CompactXref, ...]] = None,
+        variants: Optional[Tuple[CompactVariant, ...]] = None,
+    ) -> None:
+        """Build a compact named node.
+
+        :param function: The BEL function of the node
+        :param namespace: The namespace of the node's concept
+        :param name: The name of the node's concept
+        :param identifier: The identifier of the node's concept
+        :param xrefs: Alternative identifiers as (namespace, name, identifier) triples
+        :param variants: An optional tuple of compact variants
+        """
+        super().__init__(function, namespace=namespace, name=name, identifier=identifier, xrefs=xrefs)
+        self.variants = variants
+
+    def to_dsl(self) -> BaseAbundance:
+        """Convert this node to the dictionary-based DSL."""
+        dsl = FUNC_TO_DSL[self.function]
+        kwargs = dict(
+            namespace=self.namespace,
+            name=self.name,
+            identifier=self.identifier,
+            xrefs=_xrefs_to_dsl(self.xrefs),
+        )
+        if self.variants is not None:
+            kwargs['variants'] = [variant.to_dsl() for variant in self.variants]
+        return dsl(**kwargs)
+
+
+class CompactListAbundance(_CompactConcept):
+    """A compact list abundance, i.e., a complex or composite, with an optional name for complexes."""
+
+    __slots__ = ('members',)
+
+    def __init__(
+        self,
+        function: str,
+        members: Tuple[CompactEntity, ...],
+        namespace: Optional[str] = None,
+        name: Optional[str] = None,
+        identifier: Optional[str] = None,
+        xrefs: Optional[Tuple[CompactXref, ...]] = None,
+    ) -> None:
+        """Build a compact list abundance.
+
+        :param function: The BEL function of the node
+        :param members: A tuple of compact nodes
+        :param namespace: The namespace of the complex's concept, if it has been named
+        :param name: The name of the complex's concept, if it has been named
+        :param identifier: The identifier of the complex's concept, if it has been named
+        :param xrefs: Alternative identifiers as (namespace, name, identifier) triples
+        """
+        super().__init__(function, namespace=namespace, name=name, identifier=identifier, xrefs=xrefs)
+        self.members = members
+
+    def to_dsl(self) -> ListAbundance:
+        """Convert this node to the dictionary-based DSL."""
+        dsl = FUNC_TO_LIST_DSL[self.function]
+        members = [member.to_dsl() for member in self.members]
+        if self.namespace is None:
+            return dsl(members)
+        return dsl(
+            members,
+            namespace=self.namespace,
+            name=self.name,
+            identifier=self.identifier,
+            xrefs=_xrefs_to_dsl(self.xrefs),
+        )
+
+
+class CompactReaction(CompactEntity):
+    """A compact reaction."""
+
+    __slots__ = ('reactants', 'products')
+
+    def __init__(self, reactants: Tuple[CompactEntity, ...], products: Tuple[CompactEntity, ...]) -> None:
+        """Build a compact reaction.
+
+        :param reactants: A tuple of compact nodes
+        :param products: A tuple of compact nodes
+        """
+        super().__init__(Reaction.function)
+        self.reactants = reactants
+        self.products = products
+
+    def to_dsl(self) -> Reaction:
+        """Convert this node to the dictionary-based DSL."""
+        return Reaction(
+            reactants=[reactant.to_dsl() for reactant in self.reactants],
+            products=[product.to_dsl() for product in self.products],
+        )
+
+
+class CompactFusion(CompactEntity):
+    """A compact fusion."""
+
+    __slots__ = ('partner_5p', 'partner_3p', 'range_5p', 'range_3p')
+
+    def __init__(
+        self,
+        function: str,
+        partner_5p: CompactAbundance,
+        partner_3p: CompactAbundance,
+        range_5p: CompactFusionRange = None,
+        range_3p: CompactFusionRange = None,
+    ) -> None:
+        """Build a compact fusion.
+
+        :param function: The BEL function of the node
+        :param partner_5p: The compact node for the 5-prime partner
+        :param partner_3p: The compact node for the 3-prime partner
+        :param range_5p: The 5-prime partner's range as a (reference, start, stop) triple or None if missing
+        :param range_3p: The 3-prime partner's range as a (reference, start, stop) triple or None if missing
+        """
+        super().__init__(function)
+        self.partner_5p = partner_5p
+        self.partner_3p = partner_3p
+        self.range_5p = range_5p
+        self.range_3p = range_3p
+
+    def to_dsl(self) -> FusionBase:
+        """Convert this node to the dictionary-based DSL."""
+        return FUNC_TO_FUSION_DSL[self.function](
+            partner_5p=self.partner_5p.to_dsl(),
+            partner_3p=self.partner_3p.to_dsl(),
+            range_5p=_fusion_range_to_dsl(self.range_5p),
+            range_3p=_fusion_range_to_dsl(self.range_3p),
+        )
+
+
+def _concept_kwargs(node: Mapping[str, Any]):
+    concept = node[CONCEPT]
+    return dict(
+        namespace=concept[NAMESPACE],
+        name=concept.get(NAME),
+        identifier=concept.get(IDENTIFIER),
+        xrefs=_xrefs_to_compact(node.get(XREFS)),
+    )
+
+
+def to_compact(node: BaseEntity) -> CompactEntity:
+    """Convert a node from the dictionary-based DSL to its compact representation.
+
+    :raises TypeError: if the node is not a recognized DSL object
+    """
+    if isinstance(node, FusionBase):
+        return CompactFusion(
+            node.function,
+            partner_5p=to_compact(node.partner_5p),
+            partner_3p=to_compact(node.partner_3p),
+            range_5p=_fusion_range_to_compact(node.range_5p),
+            range_3p=_fusion_range_to_compact(node.range_3p),
+        )
+
+    if isinstance(node, Reaction):
+        return CompactReaction(
+            reactants=tuple(to_compact(reactant) for reactant in node.reactants),
+            products=tuple(to_compact(product) for product in node.products),
+        )
+
+    if isinstance(node, ListAbundance):
+        members = tuple(to_compact(member) for member in node.members)
+        if isinstance(node, ComplexAbundance) and CONCEPT in node:
+            return CompactListAbundance(node.function, members, **_concept_kwargs(node))
+        return CompactListAbundance(node.function, members)
+
+    if isinstance(node, BaseAbundance):
+        variants = None
+        if isinstance(node, CentralDogma) and VARIANTS in node:
+            variants = tuple(_variant_to_compact(variant) for variant in node[VARIANTS])
+        return CompactAbundance(node.function, variants=variants, **_concept_kwargs(node))
+
+    raise TypeError('can not convert to compact node: {}'.format(node))
+
+
+def compact_from_json(data: Mapping[str, Any]) -> CompactEntity:
+    """Build a compact node from its JSON form, like in node-link or SBEL files."""
+    from ..tokens import parse_result_to_dsl
+    return to_compact(parse_result_to_dsl(data))
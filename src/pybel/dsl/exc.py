@@ -6,6 +6,7 @@ from ..exceptions import PyBELWarning
 
 __all__ = [
     'PyBELDSLException',
+    'FrozenEntityException',
     'InferCentralDogmaException',
     'ListAbundanceEmptyException',
     'ReactionEmptyException',
@@ -16,6 +17,10 @@ class PyBELDSLException(PyBELWarning, ValueError):
     """Raised when problems with the DSL."""
 
 
+class FrozenEntityException(PyBELDSLException):
+    """Raised when trying to modify a frozen node."""
+
+
 class InferCentralDogmaException(PyBELDSLException):
     """Raised when unable to infer central dogma."""
 
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""An opt-in intern table for DSL nodes.
+
+Large graphs often contain many copies of the same node, since each parse of a
+BEL term (or each line of a node-link or SBEL file) builds a new object. When
+interning is enabled, :func:`pybel.tokens.parse_result_to_dsl` returns a single,
+frozen instance for each canonical BEL string.
+
+>>> from pybel.dsl import Protein, intern_node
+>>> a = intern_node(Protein(namespace='HGNC', name='AKT1'))
+>>> b = intern_node(Protein(namespace='HGNC', name='AKT1'))
+>>> assert a is b
+
+The table only holds weak references, so nodes are dropped from it as soon as
+they aren't used anywhere else. Since nodes are keyed by their canonical BEL,
+the first instance wins and properties not included in the BEL (like xrefs)
+are taken from it.
+"""
+
+import weakref
+from contextlib import contextmanager
+from typing import Iterator, TypeVar
+
+from .node_classes import BaseEntity
+
+__all__ = [
+    'NodeInternTable',
+    'intern_node',
+    'get_intern_table',
+    'is_interning_enabled',
+    'set_interning',
+    'interning',
+]
+
+X = TypeVar('X', bound=BaseEntity)
+
+
+class NodeInternTable:
+    """A table of frozen nodes keyed by their canonical BEL strings."""
+
+    def __init__(self) -> None:
+        """Build an empty intern table."""
+        self._table = weakref.WeakValueDictionary()
+
+    def intern(self, node: X) -> X:
+        """Get the shared instance for the node, freezing and storing it if it's new."""
+        rv = self._table.get(node.bel)
+        if rv is not None:
+            return rv
+        node.freeze()
+        self._table[node.bel] = node
+        return node
+
+    def clear(self) -> None:
+        """Remove all nodes from the table."""
+        self._table.clear()
+
+    def __contains__(self, node: BaseEntity) -> bool:  # noqa: D105
+        return node.bel in self._table
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._table)
+
+
+_intern_table = NodeInternTable()
+_interning_enabled = False
+
+
+def get_intern_table() -> NodeInternTable:
+    """Get the global intern table."""
+    return _intern_table
+
+
+def intern_node(node: X) -> X:
+    """Get the shared, frozen instance for the node from the global intern table."""
+    return _intern_table.intern(node)
+
+
+def is_interning_enabled() -> bool:
+    """Return if nodes should be interned while they're constructed from parse results."""
+    return _interning_enabled
+
+
+def set_interning(enabled: bool) -> None:
+    """Enable or disable interning of nodes constructed from parse results."""
+    global _interning_enabled
+    _interning_enabled = enabled
+
+
+@contextmanager
+def interning(enabled: bool = True) -> Iterator[NodeInternTable]:
+    """Enable (or disable) interning of nodes constructed from parse results inside a context.
+
+    >>> from pybel import from_nodelink_file
+    >>> with interning():
+    ...     graph = from_nodelink_file('graph.bel.nodelink.json')
+    """
+    previous = _interning_enabled
+    set_interning(enabled)
+    try:
+        yield _intern_table
+    finally:
+        set_interning(previous)
@@ -4,10 +4,12 @@
 
 import hashlib
 from abc import ABCMeta, abstractmethod
-from operator import methodcaller
+from operator import attrgetter, methodcaller
 from typing import Iterable, List, Optional, Set, Union
 
-from .exc import InferCentralDogmaException, ListAbundanceEmptyException, ReactionEmptyException
+from .exc import (
+    FrozenEntityException, InferCentralDogmaException, ListAbundanceEmptyException, ReactionEmptyException,
+)
 from ..constants import (
     ABUNDANCE, BIOPROCESS, COMPLEX, COMPOSITE, CONCEPT, FRAGMENT, FRAGMENT_DESCRIPTION, FRAGMENT_MISSING,
     FRAGMENT_START, FRAGMENT_STOP, FUNCTION, FUSION, FUSION_MISSING, FUSION_REFERENCE, FUSION_START, FUSION_STOP, GENE,
@@ -68,6 +70,8 @@ __all__ = [
 
 # A methodcaller for the key argument of sorted()
 _as_bel = methodcaller('as_bel')
+# An attrgetter for the key argument of sorted() that uses the cached canonical BEL of entities
+_canonical_bel = attrgetter('bel')
 
 
 class BaseEntity(dict, metaclass=ABCMeta):
@@ -84,9 +88,16 @@ class BaseEntity(dict, metaclass=ABCMeta):
 
     function = ...
 
+    # The canonical BEL string, its hash, and its MD5 are computed lazily and cached.
+    # They're declared at the class level so instances unpickled from before they
+    # existed fall back to recalculating them.
+    _bel = None
+    _hash = None
+    _md5 = None
+    _frozen = False
+
     def __init__(self) -> None:
         super().__init__(**{FUNCTION: self.function})
-        self._md5 = None
 
     @property
     def _bel_function(self) -> str:
@@ -96,24 +107,113 @@ class BaseEntity(dict, metaclass=ABCMeta):
     def as_bel(self, use_identifiers: bool = True) -> str:
         """Return this entity as a BEL string."""
 
+    @property
+    def bel(self) -> str:
+        """Get the canonical BEL string for this node, i.e., ``as_bel(use_identifiers=True)``.
+
+        This value is cached, so it can be used instead of :meth:`as_bel` in hot loops. The
+        cache is reset whenever the node's dictionary is modified. If one of its nested
+        data structures (e.g., the list of variants) is modified in place, call
+        :meth:`reset_cache` afterwards.
+        """
+        if self._bel is None:
+            self._bel = self.as_bel()
+        return self._bel
+
     @property
     def md5(self) -> str:
         """Get the MD5 hash of this node."""
         if self._md5 is None:
-            self._md5 = hashlib.md5(self.as_bel().encode('utf8')).hexdigest()  # noqa: S303
+            self._md5 = hashlib.md5(self.bel.encode('utf8')).hexdigest()  # noqa: S303
         return self._md5
 
+    def reset_cache(self) -> None:
+        """Reset the cached canonical BEL string, hash, and MD5 for this node."""
+        self._bel = None
+        self._hash = None
+        self._md5 = None
+
+    @property
+    def frozen(self) -> bool:
+        """Return if this node has been frozen and can no longer be modified."""
+        return self._frozen
+
+    def freeze(self) -> 'BaseEntity':
+        """Freeze this node so modifying its dictionary raises a :class:`FrozenEntityException`.
+
+        This is used by :func:`pybel.dsl.intern_node` so a single instance can be safely
+        shared. The canonical BEL string is calculated eagerly. Returns itself for chaining.
+        """
+        _ = self.bel
+        self._frozen = True
+        return self
+
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise FrozenEntityException('can not modify frozen node: {}'.format(self.bel))
+
+    def __setitem__(self, key, value):  # noqa: D105
+        self._check_mutable()
+        super().__setitem__(key, value)
+        self.reset_cache()
+
+    def __delitem__(self, key):  # noqa: D105
+        self._check_mutable()
+        super().__delitem__(key)
+        self.reset_cache()
+
+    def update(self, *args, **kwargs):  # noqa: D102
+        self._check_mutable()
+        super().update(*args, **kwargs)
+        self.reset_cache()
+
+    def setdefault(self, key, default=None):  # noqa: D102
+        self._check_mutable()
+        rv = super().setdefault(key, default)
+        self.reset_cache()
+        return rv
+
+    def pop(self, *args):  # noqa: D102
+        self._check_mutable()
+        rv = super().pop(*args)
+        self.reset_cache()
+        return rv
+
+    def popitem(self):  # noqa: D102
+        self._check_mutable()
+        rv = super().popitem()
+        self.reset_cache()
+        return rv
+
+    def clear(self):  # noqa: D102
+        self._check_mutable()
+        super().clear()
+        self.reset_cache()
+
     def __hash__(self):  # noqa: D105
-        return hash(self.as_bel())
+        if self._hash is None:
+            self._hash = hash(self.bel)
+        return self._hash
+
+    def __getstate__(self):  # noqa: D105
+        # The hash of a string is salted differently in each process, so it's left out
+        # and recalculated after unpickling
+        state = self.__dict__.copy()
+        state.pop('_hash', None)
+        return state
 
     def __eq__(self, other):
-        return isinstance(other, BaseEntity) and self.as_bel() == other.as_bel()
+        if self is other:
+            return True
+        if not isinstance(other, BaseEntity):
+            return NotImplemented
+        return self.bel == other.bel
 
     def __repr__(self):
-        return '<BEL {bel}>'.format(bel=self.as_bel(use_identifiers=True))
+        return '<BEL {bel}>'.format(bel=self.bel)
 
     def __str__(self):  # noqa: D105
-        return self.as_bel()
+        return self.bel
 
 
 class BaseConcept(dict):
@@ -730,6 +830,8 @@ class Protein(CentralDogma):
 
 def _entity_list_as_bel(entities: Iterable[BaseEntity], use_identifiers: bool = True) -> str:
     """Stringify a list of BEL entities."""
+    if use_identifiers:
+        return ', '.join(e.bel for e in entities)
     return ', '.join(
         e.as_bel(use_identifiers=use_identifiers)
         for e in entities
@@ -760,12 +862,12 @@ class Reaction(BaseEntity):
         if isinstance(reactants, BaseEntity):
             reactants = [reactants]
         else:
-            reactants = sorted(reactants, key=_as_bel)
+            reactants = sorted(reactants, key=_canonical_bel)
 
         if isinstance(products, BaseEntity):
             products = [products]
         else:
-            products = sorted(products, key=_as_bel)
+            products = sorted(products, key=_canonical_bel)
 
         if not reactants and not products:
             raise ReactionEmptyException('Reaction can not be instantiated with an empty members list.')
@@ -810,7 +912,7 @@ class ListAbundance(BaseEntity):
         if isinstance(members, BaseEntity):
             self[MEMBERS] = [members]
         else:
-            self[MEMBERS] = sorted(members, key=_as_bel)
+            self[MEMBERS] = sorted(members, key=_canonical_bel)
 
         if not self[MEMBERS]:
             raise ListAbundanceEmptyException('List abundance can not be instantiated with an empty members list.')
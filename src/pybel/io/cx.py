@@ -537,6 +537,8 @@ def from_cx(cx: List[Dict]) -> BELGraph:  # noqa: C901
     for eid, data in edge_object.items():
         edge_data_pp[eid][TARGET_MODIFIER] = expand_dict(data)
 
+    qualified_edges = []
+    unqualified_edges = []
     for eid in edge_relation:
         if eid in edge_annotations:  # FIXME stick this in edge_data.items() iteration
             edge_data_pp[eid][ANNOTATIONS] = {
@@ -545,25 +547,30 @@ def from_cx(cx: List[Dict]) -> BELGraph:  # noqa: C901
             }
 
         if eid in edge_citation:
-            graph.add_qualified_edge(
+            qualified_edges.append((
                 nid_node_tuple[eid_source_nid[eid]],
                 nid_node_tuple[eid_target_nid[eid]],
-                relation=edge_relation[eid],
-                citation=edge_data_pp[eid][CITATION],
-                evidence=edge_data_pp[eid][EVIDENCE],
-                source_modifier=edge_data_pp[eid].get(SOURCE_MODIFIER),
-                target_modifier=edge_data_pp[eid].get(TARGET_MODIFIER),
-                annotations=edge_data_pp[eid].get(ANNOTATIONS),
-            )
+                dict(
+                    relation=edge_relation[eid],
+                    citation=edge_data_pp[eid][CITATION],
+                    evidence=edge_data_pp[eid][EVIDENCE],
+                    source_modifier=edge_data_pp[eid].get(SOURCE_MODIFIER),
+                    target_modifier=edge_data_pp[eid].get(TARGET_MODIFIER),
+                    annotations=edge_data_pp[eid].get(ANNOTATIONS),
+                ),
+            ))
         elif edge_relation[eid] in UNQUALIFIED_EDGES:
-            graph.add_unqualified_edge(
+            unqualified_edges.append((
                 nid_node_tuple[eid_source_nid[eid]],
                 nid_node_tuple[eid_target_nid[eid]],
                 edge_relation[eid],
-            )
+            ))
         else:
             raise ValueError('problem adding edge: {}'.format(eid))
 
+    graph.add_qualified_edges(qualified_edges)
+    graph.add_unqualified_edges(unqualified_edges)
+
     return graph
 
 
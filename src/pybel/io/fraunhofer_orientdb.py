@@ -19,7 +19,7 @@ import requests
 from pyparsing import ParseException
 
 from .. import constants as pc
-from ..parser import BELParser
+from ..parser import BELParser, get_bel_parser
 from ..struct import BELGraph
 
 __all__ = [
@@ -91,10 +91,10 @@ def from_fraunhofer_orientdb(  # noqa:S107
            <https://doi.org/10.1101/2020.04.14.040667>`_. *bioRxiv* 2020.04.14.040667.
     """
     graph = BELGraph(name='Fraunhofer OrientDB: {}'.format(database))
-    parser = BELParser(graph, skip_validation=True)
     results = _request_graphstore(database, user, password, select_query_template=query)
-    for result in results:
-        _parse_result(parser, result)
+    with get_bel_parser(graph, skip_validation=True) as parser:
+        for result in results:
+            _parse_result(parser, result)
     return graph
 
 
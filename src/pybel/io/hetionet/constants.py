@@ -2,8 +2,11 @@
 
 """Constants for Hetionet."""
 
+from ...constants import (
+    ASSOCIATION, BINDS, CORRELATION, DECREASES, INCREASES, NEGATIVE_CORRELATION, PART_OF, POSITIVE_CORRELATION,
+    REGULATES,
+)
 from ...dsl import Abundance, BiologicalProcess, Pathology, Population, Protein, Rna
-from ...struct import BELGraph
 
 HETIONET_PUBMED = '28936969'
 
@@ -36,28 +39,28 @@ DSL_MAP = {
 TYPE_BLACKLIST = {'Molecular Function', 'Cellular Component'}
 
 QUALIFIED_MAPPING = {
-    (ANATOMY, Population, 'upregulates', GENE, Rna, BELGraph.add_positive_correlation),
-    (ANATOMY, Population, 'downregulates', GENE, Rna, BELGraph.add_negative_correlation),
-    (ANATOMY, Population, 'expresses', GENE, Rna, BELGraph.add_correlation),
-    (COMPOUND, Abundance, 'resembles', COMPOUND, Abundance, BELGraph.add_association),
-    (COMPOUND, Abundance, 'upregulates', GENE, Protein, BELGraph.add_increases),
-    (COMPOUND, Abundance, 'downregulates', GENE, Protein, BELGraph.add_decreases),
-    (COMPOUND, Abundance, 'treats', DISEASE, Pathology, BELGraph.add_decreases),
-    (COMPOUND, Abundance, 'palliates', DISEASE, Pathology, BELGraph.add_decreases),
-    (COMPOUND, Abundance, 'causes', SIDE_EFFECT, Pathology, BELGraph.add_increases),
-    (GENE, Protein, 'interacts', GENE, Protein, BELGraph.add_binds),  # FIXME look into this
-    (GENE, Protein, 'regulates', GENE, Protein, BELGraph.add_regulates),
-    (GENE, Rna, 'covaries', GENE, Rna, BELGraph.add_correlation),
-    (DISEASE, Pathology, 'localizes', ANATOMY, Population, BELGraph.add_association),
-    (DISEASE, Pathology, 'associates', GENE, Protein, BELGraph.add_association),
-    (DISEASE, Pathology, 'upregulates', GENE, Rna, BELGraph.add_positive_correlation),
-    (DISEASE, Pathology, 'downregulates', GENE, Rna, BELGraph.add_negative_correlation),
-    (DISEASE, Pathology, 'presents', SYMPTOM, Pathology, BELGraph.add_association),
-    (DISEASE, Pathology, 'resembles', DISEASE, Pathology, BELGraph.add_association),
+    (ANATOMY, Population, 'upregulates', GENE, Rna, POSITIVE_CORRELATION),
+    (ANATOMY, Population, 'downregulates', GENE, Rna, NEGATIVE_CORRELATION),
+    (ANATOMY, Population, 'expresses', GENE, Rna, CORRELATION),
+    (COMPOUND, Abundance, 'resembles', COMPOUND, Abundance, ASSOCIATION),
+    (COMPOUND, Abundance, 'upregulates', GENE, Protein, INCREASES),
+    (COMPOUND, Abundance, 'downregulates', GENE, Protein, DECREASES),
+    (COMPOUND, Abundance, 'treats', DISEASE, Pathology, DECREASES),
+    (COMPOUND, Abundance, 'palliates', DISEASE, Pathology, DECREASES),
+    (COMPOUND, Abundance, 'causes', SIDE_EFFECT, Pathology, INCREASES),
+    (GENE, Protein, 'interacts', GENE, Protein, BINDS),  # FIXME look into this
+    (GENE, Protein, 'regulates', GENE, Protein, REGULATES),
+    (GENE, Rna, 'covaries', GENE, Rna, CORRELATION),
+    (DISEASE, Pathology, 'localizes', ANATOMY, Population, ASSOCIATION),
+    (DISEASE, Pathology, 'associates', GENE, Protein, ASSOCIATION),
+    (DISEASE, Pathology, 'upregulates', GENE, Rna, POSITIVE_CORRELATION),
+    (DISEASE, Pathology, 'downregulates', GENE, Rna, NEGATIVE_CORRELATION),
+    (DISEASE, Pathology, 'presents', SYMPTOM, Pathology, ASSOCIATION),
+    (DISEASE, Pathology, 'resembles', DISEASE, Pathology, ASSOCIATION),
 }
 UNQUALIFIED_MAPPING = {
-    (GENE, Protein, 'participates', PATHWAY, BiologicalProcess, BELGraph.add_part_of),
-    (GENE, Protein, 'participates', BIOPROCESS, BiologicalProcess, BELGraph.add_part_of),
+    (GENE, Protein, 'participates', PATHWAY, BiologicalProcess, PART_OF),
+    (GENE, Protein, 'participates', BIOPROCESS, BiologicalProcess, PART_OF),
 }
 
 ####################
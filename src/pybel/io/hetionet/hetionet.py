@@ -6,7 +6,7 @@ import bz2
 import json
 import logging
 import os
-from typing import Any, Mapping, Set, Tuple, Union
+from typing import Any, List, Mapping, Tuple, Union
 from urllib.request import urlretrieve
 
 from tqdm import tqdm
@@ -16,7 +16,10 @@ from .constants import (
     QUALIFIED_MAPPING, REGULATES_ACTIONS, UNQUALIFIED_MAPPING,
 )
 from ...config import CACHE_DIRECTORY
-from ...dsl import Abundance, Protein
+from ...constants import (
+    BINDS, DIRECTLY_DECREASES, DIRECTLY_INCREASES, IS_A, REGULATES, TWO_WAY_RELATIONS,
+)
+from ...dsl import Abundance, BaseEntity, ComplexAbundance, Protein, activity
 from ...struct import BELGraph
 
 __all__ = [
@@ -81,8 +84,12 @@ def from_hetionet_json(
     else:
         it_logger = logger.info
 
+    qualified_edges, unqualified_edges = [], []
     for edge in edges:
-        _add_edge(graph, edge, kind_identifier_to_name, it_logger)
+        _add_edge(qualified_edges, unqualified_edges, edge, kind_identifier_to_name, it_logger)
+
+    graph.add_qualified_edges(qualified_edges)
+    graph.add_unqualified_edges(unqualified_edges)
 
     return graph
 
@@ -101,12 +108,36 @@ def _get_node(edge, key, kind_identifier_to_name) -> Union[Tuple[None, None, Non
     return node_type, namespace, node_identifier, node_name
 
 
+QualifiedEdges = List[Tuple[BaseEntity, BaseEntity, Mapping[str, Any]]]
+UnqualifiedEdges = List[Tuple[BaseEntity, BaseEntity, str]]
+
+
+def _add_qualified_edge(
+    qualified_edges: QualifiedEdges,
+    source: BaseEntity,
+    target: BaseEntity,
+    relation: str,
+    **kwargs
+) -> None:
+    """Add a qualified edge to the list, expanding binding and two-way relations like :class:`BELGraph` does."""
+    if relation == BINDS:
+        qualified_edges.append((source, ComplexAbundance([source, target]), dict(
+            relation=DIRECTLY_INCREASES, **kwargs,
+        )))
+    elif relation in TWO_WAY_RELATIONS:
+        qualified_edges.append((target, source, dict(relation=relation, **kwargs)))
+        qualified_edges.append((source, target, dict(relation=relation, **kwargs)))
+    else:
+        qualified_edges.append((source, target, dict(relation=relation, **kwargs)))
+
+
 def _add_edge(  # noqa: C901
-    graph,
+    qualified_edges: QualifiedEdges,
+    unqualified_edges: UnqualifiedEdges,
     edge,
     kind_identifier_to_name,
     it_logger,
-) -> Union[None, str, Set[str]]:
+) -> None:
     source_type, source_ns, source_identifier, source_name = _get_node(edge, 'source_id', kind_identifier_to_name)
     target_type, target_ns, target_identifier, target_name = _get_node(edge, 'target_id', kind_identifier_to_name)
     if source_type is None or target_type is None:
@@ -148,27 +179,27 @@ def _add_edge(  # noqa: C901
             continue
         annotations[k] = {v: True}
 
-    for _h_type, h_dsl, _r, _t_type, t_dsl, f in QUALIFIED_MAPPING:
+    for _h_type, h_dsl, _r, _t_type, t_dsl, relation in QUALIFIED_MAPPING:
         if source_type != _h_type or kind != _r or target_type != _t_type:
             continue
-        rv = set()
         for citation in citations:
-            key = f(
-                graph,
+            _add_qualified_edge(
+                qualified_edges,
                 h_dsl(namespace=source_ns, identifier=source_identifier, name=source_name),
                 t_dsl(namespace=target_ns, identifier=target_identifier, name=target_name),
+                relation,
                 citation=citation, evidence='', annotations=annotations,
             )
-            rv.add(key)
-        return rv
+        return
 
-    for _h_type, h_dsl, _r, _t_type, t_dsl, f in UNQUALIFIED_MAPPING:
+    for _h_type, h_dsl, _r, _t_type, t_dsl, relation in UNQUALIFIED_MAPPING:
         if source_type == _h_type and kind == _r and target_type == _t_type:
-            return f(
-                graph,
+            unqualified_edges.append((
                 h_dsl(namespace=source_ns, identifier=source_identifier, name=source_name),
                 t_dsl(namespace=target_ns, identifier=target_identifier, name=target_name),
-            )
+                relation,
+            ))
+            return
 
     def _check(_source_type: str, _kind: str, _target_type: str) -> bool:
         """Check the metaedge."""
@@ -178,33 +209,33 @@ def _add_edge(  # noqa: C901
         drug = Abundance(namespace='drugbank', name=source_name, identifier=source_identifier)
         protein = Protein(namespace='ncbigene', name=target_name, identifier=target_identifier)
 
-        rv = set()
         for action in data.get('actions', []):
             action = action.lower()
             if action in ACTIVATES_ACTIONS:
-                key = graph.add_directly_activates(
-                    drug, protein, citation=HETIONET_PUBMED, evidence='', annotations=annotations,
-                )
+                relation, target_modifier = DIRECTLY_INCREASES, activity()
             elif action in INHIBITS_ACTIONS:
-                key = graph.add_directly_inhibits(
-                    drug, protein, citation=HETIONET_PUBMED, evidence='', annotations=annotations,
-                )
+                relation, target_modifier = DIRECTLY_DECREASES, activity()
             elif action in REGULATES_ACTIONS:
-                key = graph.add_regulates(drug, protein, citation=HETIONET_PUBMED, evidence='', annotations=annotations)
+                relation, target_modifier = REGULATES, None
             elif action in BINDS_ACTIONS:
-                key = graph.add_binds(drug, protein, citation=HETIONET_PUBMED, evidence='', annotations=annotations)
+                relation, target_modifier = BINDS, None
             else:
-                key = graph.add_binds(drug, protein, citation=HETIONET_PUBMED, evidence='', annotations=annotations)
+                relation, target_modifier = BINDS, None
                 it_logger('Unhandled action for {source_identifier}-{kind}-{target_identifier}: {action}'.format(
                     source_identifier=source_identifier, kind=kind, target_identifier=target_identifier, action=action,
                 ))
-            rv.add(key)
-        return rv
+            _add_qualified_edge(
+                qualified_edges, drug, protein, relation,
+                citation=HETIONET_PUBMED, evidence='', annotations=annotations, target_modifier=target_modifier,
+            )
+        return
 
     if _check(PHARMACOLOGICAL_CLASS, 'includes', COMPOUND):
-        return graph.add_is_a(
+        unqualified_edges.append((
             Abundance(namespace='drugbank', name=target_name, identifier=target_identifier),
             Abundance(namespace='drugcentral', name=source_name, identifier=source_identifier),
-        )
+            IS_A,
+        ))
+        return
 
     it_logger('missed: {edge}'.format(edge=edge))
@@ -24,7 +24,7 @@ from ..constants import (
     METADATA_INSERT_KEYS, METADATA_LICENSES, RELATION, UNQUALIFIED_EDGES,
 )
 from ..exceptions import NakedNameWarning, UndefinedNamespaceWarning
-from ..parser import BELParser
+from ..parser import get_bel_parser
 from ..struct import BELGraph
 from ..version import get_version
 
@@ -246,76 +246,74 @@ def from_jgif(graph_jgif_dict, parser_kwargs: Optional[Mapping[str, Any]] = None
             if key in metadata:
                 graph.document[key] = metadata[key]
 
-    parser = BELParser(graph, namespace_to_pattern=NAMESPACE_TO_PATTERN)
-    parser.bel_term.addParseAction(parser.handle_term)
+    with get_bel_parser(graph, namespace_to_pattern=NAMESPACE_TO_PATTERN) as parser:
+        for node in root['nodes']:
+            node_label = node.get('label')
 
-    for node in root['nodes']:
-        node_label = node.get('label')
-
-        if node_label is None:
-            logger.warning('node missing label: %s', node)
-            continue
+            if node_label is None:
+                logger.warning('node missing label: %s', node)
+                continue
 
-        try:
-            parser.bel_term.parseString(node_label)
-        except NakedNameWarning as e:
-            logger.info('Naked name: %s', e)
-        except UndefinedNamespaceWarning as e:
-            logger.info('Undefined namespace: %s', e)
-        except ParseException:
-            logger.info('Parse exception for %s', node_label)
-
-    for i, edge in enumerate(root['edges']):
-        relation = edge.get('relation')
-        if relation is None:
-            logger.warning('no relation for edge: %s', edge)
-
-        if relation in {'actsIn', 'translocates'}:
-            continue  # don't need legacy BEL format
-
-        edge_metadata = edge.get('metadata')
-        if edge_metadata is None:
-            logger.warning('no metadata for edge: %s', edge)
-            continue
+            try:
+                parser.ensure_node(parser.bel_term.parseString(node_label))
+            except NakedNameWarning as e:
+                logger.info('Naked name: %s', e)
+            except UndefinedNamespaceWarning as e:
+                logger.info('Undefined namespace: %s', e)
+            except ParseException:
+                logger.info('Parse exception for %s', node_label)
+
+        for i, edge in enumerate(root['edges']):
+            relation = edge.get('relation')
+            if relation is None:
+                logger.warning('no relation for edge: %s', edge)
+
+            if relation in {'actsIn', 'translocates'}:
+                continue  # don't need legacy BEL format
+
+            edge_metadata = edge.get('metadata')
+            if edge_metadata is None:
+                logger.warning('no metadata for edge: %s', edge)
+                continue
 
-        bel_statement = edge.get('label')
-        if bel_statement is None:
-            logger.debug('No BEL statement for edge %s', edge)
+            bel_statement = edge.get('label')
+            if bel_statement is None:
+                logger.debug('No BEL statement for edge %s', edge)
 
-        evidences = edge_metadata.get('evidences')
+            evidences = edge_metadata.get('evidences')
 
-        if relation in UNQUALIFIED_EDGES:
-            pass  # FIXME?
+            if relation in UNQUALIFIED_EDGES:
+                pass  # FIXME?
 
-        else:
-            if not evidences:  # is none or is empty list
-                logger.debug('No evidence for edge %s', edge)
-                continue
+            else:
+                if not evidences:  # is none or is empty list
+                    logger.debug('No evidence for edge %s', edge)
+                    continue
 
-            for evidence in evidences:
-                citation = evidence.get('citation')
+                for evidence in evidences:
+                    citation = evidence.get('citation')
 
-                if not citation:
-                    continue
+                    if not citation:
+                        continue
 
-                if 'type' not in citation or 'id' not in citation:
-                    continue
+                    if 'type' not in citation or 'id' not in citation:
+                        continue
 
-                summary_text = evidence['summary_text'].strip()
+                    summary_text = evidence['summary_text'].strip()
 
-                if not summary_text or summary_text == placeholder_evidence:
-                    continue
+                    if not summary_text or summary_text == placeholder_evidence:
+                        continue
 
-                parser.control_parser.clear()
-                parser.control_parser.citation_db = citation['type'].strip()
-                parser.control_parser.citation_db_id = citation['id'].strip()
-                parser.control_parser.evidence = summary_text
-                parser.control_parser.annotations.update(evidence[EXPERIMENT_CONTEXT])
+                    parser.control_parser.clear()
+                    parser.control_parser.citation_db = citation['type'].strip()
+                    parser.control_parser.citation_db_id = citation['id'].strip()
+                    parser.control_parser.evidence = summary_text
+                    parser.control_parser.annotations.update(evidence[EXPERIMENT_CONTEXT])
 
-                try:
-                    parser.parseString(bel_statement, line_number=i)
-                except Exception as e:
-                    logger.warning('JGIF relation parse error: %s for %s', e, bel_statement)
+                    try:
+                        parser.parseString(bel_statement, line_number=i)
+                    except Exception as e:
+                        logger.warning('JGIF relation parse error: %s for %s', e, bel_statement)
 
     return graph
 
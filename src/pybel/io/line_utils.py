@@ -3,9 +3,10 @@
 """This module contains helper functions for reading BEL scripts."""
 
 import logging
+import multiprocessing
 import re
 import time
-from typing import Any, Iterable, List, Mapping, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from pyparsing import ParseException
 from sqlalchemy.exc import OperationalError
@@ -13,16 +14,22 @@ from tqdm import tqdm
 
 from bel_resources import ResourceError, split_file_to_annotations_and_definitions
 from ..constants import INVERSE_DOCUMENT_KEYS, REQUIRED_METADATA
+from ..dsl import BaseEntity, CompactEntity, intern_node, is_interning_enabled, to_compact
 from ..exceptions import (
     BELParserWarning, BELSyntaxError, InconsistentDefinitionError, MalformedMetadataException, MissingMetadataException,
     PlaceholderAminoAcidWarning, VersionFormatWarning,
 )
 from ..manager import Manager
-from ..parser import BELParser, MetadataParser
+from ..parser import BELParser, MetadataParser, get_bel_parser
 from ..struct.graph import BELGraph
+from ..typing import EdgeData
+from ..utils import get_default_edge_digest, set_default_edge_digest
 
 __all__ = [
     'parse_lines',
+    'iterate_lines',
+    'EdgeTuple',
+    'EdgeSink',
 ]
 
 logger = logging.getLogger(__name__)
@@ -32,6 +39,23 @@ METADATA_LINE_RE = re.compile(r"(SET\s+DOCUMENT|DEFINE\s+NAMESPACE|DEFINE\s+ANNO
 LOG_FMT = '%d:%d %s %s'
 LOG_FMT_PATH = '%s:%d:%d %s %s'
 
+#: Matches the definition of a namespace or annotation by URL, which needs to be downloaded
+DEFINE_URL_RE = re.compile(r'^DEFINE\s+(NAMESPACE|ANNOTATION)\s+(\w+)\s+AS\s+URL\s+"([^"]+)"\s*$')
+
+#: Matches a well-formed ``SET Citation`` statement. When citation clearing is enabled, these reset the evidence
+#: and annotations, so the statements section can be split in front of them and the parts parsed independently.
+CITATION_LINE_RE = re.compile(r'^SET\s+Citation\s*=\s*{\s*"[^"\\]*"(\s*,\s*"[^"\\]*")*\s*}\s*$')
+SET_STATEMENT_GROUP_RE = re.compile(r'^SET\s+STATEMENT_GROUP\b')
+UNSET_STATEMENT_GROUP_RE = re.compile(r'^UNSET\s+(STATEMENT_GROUP|ALL)\s*$')
+
+#: An edge as it's yielded by :func:`iterate_lines`
+EdgeTuple = Tuple[BaseEntity, BaseEntity, str, EdgeData]
+#: A function that is given each edge while parsing in streaming mode
+EdgeSink = Callable[[BaseEntity, BaseEntity, str, EdgeData], Any]
+
+#: The default minimum number of lines in each chunk of the statements section when parsing in parallel
+DEFAULT_CHUNKSIZE = 1000
+
 
 def parse_lines(
     graph: BELGraph,
@@ -48,6 +72,9 @@ def parse_lines(
     allow_naked_names: bool = False,
     required_annotations: Optional[List[str]] = None,
     upgrade_urls: bool = False,
+    processes: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    sink: Optional[EdgeSink] = None,
 ) -> None:
     """Parse an iterable of lines into this graph.
 
@@ -64,6 +91,11 @@ def parse_lines(
     :param disallow_unqualified_translocations: If true, allow translocations without TO and FROM clauses.
     :param required_annotations: Annotations that are required for all statements
     :param upgrade_urls: Automatically upgrade old namespace URLs. Defaults to false.
+    :param processes: If given, parse the statements section in this many worker processes. See
+     :func:`parse_statements`.
+    :param chunksize: The minimum number of lines in each chunk of statements given to a worker process
+    :param sink: If given, each edge is passed to this function as ``(u, v, key, data)`` as soon as its statement
+     is parsed instead of being added to the graph. See :func:`iterate_lines`.
 
     .. warning::
 
@@ -75,6 +107,118 @@ def parse_lines(
     :param allow_redefinition: If true, doesn't fail on second definition of same name or annotation
     :param allow_definition_failures: If true, allows parsing to continue if a terminology file download/parse fails
     """
+    if sink is not None:
+        if processes is not None:
+            logger.warning('can not parse statements in parallel while streaming edges. Parsing serially.')
+        edges = iterate_lines(
+            graph,
+            lines,
+            manager=manager,
+            disallow_nested=disallow_nested,
+            citation_clearing=citation_clearing,
+            use_tqdm=use_tqdm,
+            tqdm_kwargs=tqdm_kwargs,
+            no_identifier_validation=no_identifier_validation,
+            disallow_unqualified_translocations=disallow_unqualified_translocations,
+            allow_redefinition=allow_redefinition,
+            allow_definition_failures=allow_definition_failures,
+            allow_naked_names=allow_naked_names,
+            required_annotations=required_annotations,
+            upgrade_urls=upgrade_urls,
+        )
+        for u, v, key, data in edges:
+            sink(u, v, key, data)
+        return
+
+    statements, bel_parser_kwargs = _parse_head(
+        graph,
+        lines,
+        manager=manager,
+        disallow_nested=disallow_nested,
+        citation_clearing=citation_clearing,
+        use_tqdm=use_tqdm,
+        tqdm_kwargs=tqdm_kwargs,
+        no_identifier_validation=no_identifier_validation,
+        disallow_unqualified_translocations=disallow_unqualified_translocations,
+        allow_redefinition=allow_redefinition,
+        allow_definition_failures=allow_definition_failures,
+        allow_naked_names=allow_naked_names,
+        required_annotations=required_annotations,
+        upgrade_urls=upgrade_urls,
+    )
+
+    with get_bel_parser(graph, **bel_parser_kwargs) as bel_parser:
+        parse_statements(
+            graph,
+            statements,
+            bel_parser,
+            use_tqdm=use_tqdm,
+            tqdm_kwargs=tqdm_kwargs,
+            processes=processes,
+            chunksize=chunksize,
+        )
+
+    logger.info('Network has %d nodes and %d edges', graph.number_of_nodes(), graph.number_of_edges())
+
+
+def iterate_lines(
+    graph: BELGraph,
+    lines: Iterable[str],
+    use_tqdm: bool = False,
+    tqdm_kwargs: Optional[Mapping[str, Any]] = None,
+    **kwargs
+) -> Iterable[EdgeTuple]:
+    """Parse an iterable of lines, yielding the edges of each statement instead of keeping them in the graph.
+
+    The document and definitions sections are parsed into the graph before this function returns, so its
+    metadata and terminologies can be used (e.g., for writing a header) before the edges are consumed. The
+    statements section is parsed lazily while the returned iterable is consumed, and the warnings are added
+    to the graph as usual.
+
+    Each statement is parsed into a scratch graph that is emptied after its edges are yielded, so memory
+    use doesn't grow with the size of the document. Edges that appear more than once in the document are
+    yielded each time, and nodes that aren't part of any edge are not yielded.
+
+    :param graph: A BEL graph that receives the document metadata, terminologies, and warnings
+    :param lines: An iterable over lines of BEL script
+    :param use_tqdm: Use :mod:`tqdm` to show a progress bar?
+    :param tqdm_kwargs: Keywords to pass to ``tqdm``
+
+    The remaining keyword arguments are the same as :func:`parse_lines`, except for parallelization.
+
+    >>> from pybel import BELGraph, to_sbel_file
+    >>> from pybel.io.line_utils import iterate_lines
+    >>> graph = BELGraph()
+    >>> with open('my_document.bel') as file:
+    ...     to_sbel_file(graph, 'my_document.bel.jsonl', edges=iterate_lines(graph, file))
+    """
+    statements, bel_parser_kwargs = _parse_head(
+        graph,
+        lines,
+        use_tqdm=use_tqdm,
+        tqdm_kwargs=tqdm_kwargs,
+        **kwargs
+    )
+    return _iterate_statements(graph, statements, bel_parser_kwargs, use_tqdm=use_tqdm, tqdm_kwargs=tqdm_kwargs)
+
+
+def _parse_head(
+    graph: BELGraph,
+    lines: Iterable[str],
+    manager: Optional[Manager] = None,
+    disallow_nested: bool = False,
+    citation_clearing: bool = True,
+    use_tqdm: bool = False,
+    tqdm_kwargs: Optional[Mapping[str, Any]] = None,
+    no_identifier_validation: bool = False,
+    disallow_unqualified_translocations: bool = False,
+    allow_redefinition: bool = False,
+    allow_definition_failures: bool = False,
+    allow_naked_names: bool = False,
+    required_annotations: Optional[List[str]] = None,
+    upgrade_urls: bool = False,
+) -> Tuple[Iterable[Tuple[int, str]], Dict[str, Any]]:
+    """Parse the document and definitions sections, then get the keyword arguments for :func:`get_bel_parser`."""
     docs, definitions, statements = split_file_to_annotations_and_definitions(lines)
 
     if manager is None:
@@ -102,8 +246,7 @@ def parse_lines(
         tqdm_kwargs=tqdm_kwargs,
     )
 
-    bel_parser = BELParser(
-        graph=graph,
+    bel_parser_kwargs = dict(
         # terminologies
         namespace_to_term_to_encoding=metadata_parser.namespace_to_term_to_encoding,
         namespace_to_pattern=metadata_parser.namespace_to_pattern,
@@ -119,15 +262,7 @@ def parse_lines(
         required_annotations=required_annotations,
     )
 
-    parse_statements(
-        graph,
-        statements,
-        bel_parser,
-        use_tqdm=use_tqdm,
-        tqdm_kwargs=tqdm_kwargs,
-    )
-
-    logger.info('Network has %d nodes and %d edges', graph.number_of_nodes(), graph.number_of_edges())
+    return statements, bel_parser_kwargs
 
 
 def parse_document(
@@ -172,26 +307,37 @@ def parse_definitions(
     allow_failures: bool = False,
     use_tqdm: bool = False,
     tqdm_kwargs: Optional[Mapping[str, Any]] = None,
+    max_workers: Optional[int] = None,
 ) -> None:
     """Parse the lines in the definitions section of a BEL script.
 
+    Before parsing, the namespaces and annotations defined by URL that aren't already in the database are
+    downloaded in a thread pool and inserted together with :meth:`pybel.manager.Manager.ensure_resources`.
+    Resources that fail to download are tried again while parsing their line, so errors are reported the same
+    way as before.
+
     :param graph: A BEL graph
     :param enumerated_lines: An enumerated iterable over the lines in the definitions section of a BEL script
     :param metadata_parser: A metadata parser
     :param allow_failures: If true, allows parser to continue past strange failures
     :param use_tqdm: Use :mod:`tqdm` to show a progress bar?
     :param tqdm_kwargs: Keywords to pass to ``tqdm``
+    :param max_workers: The number of threads used to download resources
     :raises: pybel.parser.parse_exceptions.InconsistentDefinitionError
     :raises: pybel.resources.exc.ResourceError
     :raises: sqlalchemy.exc.OperationalError
     """
     parse_definitions_start_time = time.time()
 
+    enumerated_lines = list(enumerated_lines)
+    if not metadata_parser.skip_validation:
+        _prefetch_definitions(enumerated_lines, metadata_parser, max_workers=max_workers)
+
     if use_tqdm:
         _tqdm_kwargs = dict(desc='Definitions', leave=False)
         if tqdm_kwargs:
             _tqdm_kwargs.update(tqdm_kwargs)
-        enumerated_lines = tqdm(list(enumerated_lines), **_tqdm_kwargs)
+        enumerated_lines = tqdm(enumerated_lines, **_tqdm_kwargs)
 
     for line_number, line in enumerated_lines:
         try:
@@ -226,12 +372,38 @@ def parse_definitions(
     logger.info('Finished parsing definitions section in %.02f seconds', time.time() - parse_definitions_start_time)
 
 
+def _prefetch_definitions(
+    enumerated_lines: Iterable[Tuple[int, str]],
+    metadata_parser: MetadataParser,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Download and insert all of the resources defined by URL in the definitions section at once."""
+    namespace_urls, annotation_urls = [], []
+    for _, line in enumerated_lines:
+        match = DEFINE_URL_RE.match(line)
+        if match is None:
+            continue
+        kind, keyword, url = match.groups()
+        if kind == 'NAMESPACE':
+            namespace_urls.append(metadata_parser.get_namespace_url(keyword, url))
+        else:
+            annotation_urls.append(url)
+
+    try:
+        metadata_parser.manager.ensure_resources(namespace_urls, annotation_urls, max_workers=max_workers)
+    except OperationalError:
+        metadata_parser.manager.session.rollback()
+        logger.warning('could not prefetch definitions. Falling back to loading them one at a time.')
+
+
 def parse_statements(
     graph: BELGraph,
     enumerated_lines: Iterable[Tuple[int, str]],
     bel_parser: BELParser,
     use_tqdm: bool = False,
     tqdm_kwargs: Optional[Mapping[str, Any]] = None,
+    processes: Optional[int] = None,
+    chunksize: Optional[int] = None,
 ) -> None:
     """Parse a list of statements from a BEL Script.
 
@@ -240,32 +412,44 @@ def parse_statements(
     :param bel_parser: A BEL parser
     :param use_tqdm: Use :mod:`tqdm` to show a progress bar? Requires reading whole file to memory.
     :param tqdm_kwargs: Keywords to pass to ``tqdm``
+    :param processes: If given, parse in this many worker processes, each with its own copy of the BEL parser.
+     The statements are split in front of ``SET Citation`` statements outside of statement groups, so this
+     requires citation clearing. The resulting graph and warnings are the same as parsing serially.
+    :param chunksize: The minimum number of lines in each chunk of statements given to a worker process.
+     Defaults to :data:`DEFAULT_CHUNKSIZE`.
     """
     parse_statements_start_time = time.time()
 
+    if processes is not None and not bel_parser.control_parser.citation_clearing:
+        logger.warning('can not parse statements in parallel without citation clearing. Parsing serially.')
+        processes = None
+
+    progress = None
     if use_tqdm:
         _tqdm_kwargs = dict(desc='Statements')
         if tqdm_kwargs:
             _tqdm_kwargs.update(tqdm_kwargs)
-        enumerated_lines = tqdm(list(enumerated_lines), **_tqdm_kwargs)
-
-    for line_number, line in enumerated_lines:
-        try:
-            bel_parser.parseString(line, line_number=line_number)
-        except ParseException as e:
-            exc = BELSyntaxError(line_number, line, e.loc)
-            _log_parse_exception(graph, exc)
-            graph.add_warning(exc, bel_parser.get_annotations())
-        except PlaceholderAminoAcidWarning as exc:
-            exc.line_number = line_number
-            _log_parse_exception(graph, exc)
-            graph.add_warning(exc, bel_parser.get_annotations())
-        except BELParserWarning as exc:
-            _log_parse_exception(graph, exc)
-            graph.add_warning(exc, bel_parser.get_annotations())
-        except Exception:
-            parser_logger.exception(LOG_FMT, line_number, 0, 'General Failure', line)
-            raise
+        if processes is None:
+            enumerated_lines = tqdm(list(enumerated_lines), **_tqdm_kwargs)
+        else:
+            enumerated_lines = list(enumerated_lines)
+            progress = tqdm(total=len(enumerated_lines), **_tqdm_kwargs)
+
+    if processes is None:
+        for line_number, line in enumerated_lines:
+            exc = _parse_statement(bel_parser, line_number, line)
+            if exc is not None:
+                _log_parse_exception(graph, exc)
+                graph.add_warning(exc, bel_parser.get_annotations())
+    else:
+        _parse_statements_parallel(
+            graph,
+            enumerated_lines,
+            bel_parser,
+            processes=processes,
+            chunksize=chunksize or DEFAULT_CHUNKSIZE,
+            progress=progress,
+        )
 
     logger.info(
         'Parsed statements section in %.02f seconds with %d warnings',
@@ -274,6 +458,172 @@ def parse_statements(
     )
 
 
+def _iterate_statements(
+    graph: BELGraph,
+    enumerated_lines: Iterable[Tuple[int, str]],
+    bel_parser_kwargs: Mapping[str, Any],
+    use_tqdm: bool = False,
+    tqdm_kwargs: Optional[Mapping[str, Any]] = None,
+) -> Iterable[EdgeTuple]:
+    """Parse the statements section, yielding the edges from each statement then removing them from the parser's graph.
+
+    The BEL parser is borrowed for as long as the edges are being consumed, so lazily consuming several of these
+    in the same thread doesn't mix up their parsers' citations, evidences, and annotations.
+
+    :param graph: The BEL graph that receives the warnings
+    :param enumerated_lines: An enumerated iterable over the lines in the statements section of a BEL script
+    :param bel_parser_kwargs: The keyword arguments for :func:`get_bel_parser`
+    """
+    parse_statements_start_time = time.time()
+
+    if use_tqdm:
+        _tqdm_kwargs = dict(desc='Statements')
+        if tqdm_kwargs:
+            _tqdm_kwargs.update(tqdm_kwargs)
+        enumerated_lines = tqdm(enumerated_lines, **_tqdm_kwargs)
+
+    statement_graph = BELGraph(path=graph.path)
+    number_edges = 0
+    with get_bel_parser(statement_graph, **bel_parser_kwargs) as bel_parser:
+        for line_number, line in enumerated_lines:
+            exc = _parse_statement(bel_parser, line_number, line)
+            if exc is not None:
+                _log_parse_exception(graph, exc)
+                graph.add_warning(exc, bel_parser.get_annotations())
+
+            if statement_graph:
+                edges = list(statement_graph.edges(keys=True, data=True))
+                statement_graph.remove_nodes_from(list(statement_graph))
+                number_edges += len(edges)
+                yield from edges
+
+    logger.info(
+        'Streamed %d edges from statements section in %.02f seconds with %d warnings',
+        number_edges,
+        time.time() - parse_statements_start_time,
+        len(graph.warnings),
+    )
+
+
+def _parse_statement(bel_parser: BELParser, line_number: int, line: str) -> Optional[BELParserWarning]:
+    """Parse a line from the statements section, then return its warning if one was raised."""
+    try:
+        bel_parser.parseString(line, line_number=line_number)
+    except ParseException as e:
+        return BELSyntaxError(line_number, line, e.loc)
+    except PlaceholderAminoAcidWarning as exc:
+        exc.line_number = line_number
+        return exc
+    except BELParserWarning as exc:
+        return exc
+    except Exception:
+        parser_logger.exception(LOG_FMT, line_number, 0, 'General Failure', line)
+        raise
+
+
+def _split_statements(
+    enumerated_lines: Iterable[Tuple[int, str]],
+    chunksize: int,
+) -> Iterable[List[Tuple[int, str]]]:
+    """Split the lines of the statements section into chunks that can be parsed independently.
+
+    A chunk is only ended in front of a well-formed ``SET Citation`` statement that is not inside a statement
+    group, since the control parser's state after it doesn't depend on any previous lines.
+    """
+    chunk = []
+    in_statement_group = False
+    for line_number, line in enumerated_lines:
+        if chunksize <= len(chunk) and not in_statement_group and CITATION_LINE_RE.match(line):
+            yield chunk
+            chunk = []
+
+        chunk.append((line_number, line))
+
+        if SET_STATEMENT_GROUP_RE.match(line):
+            in_statement_group = True
+        elif UNSET_STATEMENT_GROUP_RE.match(line):
+            in_statement_group = False
+
+    if chunk:
+        yield chunk
+
+
+#: The number of lines, the compact nodes in insertion order, the edges as (source index, target index, key, data),
+#: and the warnings with their contexts that result from parsing a chunk of statements
+_ChunkResult = Tuple[
+    int,
+    List[CompactEntity],
+    List[Tuple[int, int, str, Mapping[str, Any]]],
+    List[Tuple[BELParserWarning, Mapping[str, Any]]],
+]
+
+_worker_parser: Optional[BELParser] = None
+
+
+def _initialize_worker(parser_kwargs: Mapping[str, Any], edge_digest: str) -> None:
+    """Build the BEL parser used in a worker process."""
+    global _worker_parser
+    set_default_edge_digest(edge_digest)
+    _worker_parser = BELParser(graph=BELGraph(), **parser_kwargs)
+
+
+def _parse_chunk(chunk: List[Tuple[int, str]]) -> _ChunkResult:
+    """Parse a chunk of the statements section in a worker process."""
+    graph = _worker_parser.graph = BELGraph()
+    _worker_parser.control_parser.clear()
+
+    warnings = []
+    for line_number, line in chunk:
+        exc = _parse_statement(_worker_parser, line_number, line)
+        if exc is not None:
+            warnings.append((exc, _worker_parser.get_annotations()))
+
+    nodes = list(graph)
+    node_to_index = {node: index for index, node in enumerate(nodes)}
+    edges = [
+        (node_to_index[u], node_to_index[v], key, data)
+        for u, v, key, data in graph.edges(keys=True, data=True)
+    ]
+    return len(chunk), [to_compact(node) for node in nodes], edges, warnings
+
+
+def _parse_statements_parallel(
+    graph: BELGraph,
+    enumerated_lines: Iterable[Tuple[int, str]],
+    bel_parser: BELParser,
+    processes: int,
+    chunksize: int,
+    progress: Optional[tqdm] = None,
+) -> None:
+    """Parse chunks of the statements section in a process pool and merge the results in order."""
+    chunks = _split_statements(enumerated_lines, chunksize)
+    compact_to_node = {}
+
+    def _get_node(compact_node: CompactEntity) -> BaseEntity:
+        node = compact_to_node.get(compact_node)
+        if node is None:
+            node = compact_node.to_dsl()
+            if is_interning_enabled():
+                node = intern_node(node)
+            compact_to_node[compact_node] = node
+            graph.add_node(node)
+        return node
+
+    initargs = (bel_parser.parser_kwargs, get_default_edge_digest())
+    with multiprocessing.Pool(processes, initializer=_initialize_worker, initargs=initargs) as pool:
+        for number_lines, compact_nodes, edges, warnings in pool.imap(_parse_chunk, chunks):
+            nodes = [_get_node(compact_node) for compact_node in compact_nodes]
+            graph._help_add_keyed_edges(
+                (nodes[u], nodes[v], key, data)
+                for u, v, key, data in edges
+            )
+            for exc, context in warnings:
+                _log_parse_exception(graph, exc)
+                graph.add_warning(exc, context)
+            if progress is not None:
+                progress.update(number_lines)
+
+
 def _log_parse_exception(graph: BELGraph, exc: BELParserWarning):
     if graph.path:
         parser_logger.error(LOG_FMT_PATH, graph.path, exc.line_number, exc.position, exc.__class__.__name__, exc)
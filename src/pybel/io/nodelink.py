@@ -140,11 +140,16 @@ def _augment_node(node: BaseEntity) -> BaseEntity:
     rv = node.copy()
     rv['id'] = node.md5
     rv['bel'] = node.as_bel()
-    for m in chain(node.get(MEMBERS, []), node.get(REACTANTS, []), node.get(PRODUCTS, [])):
-        m.update(_augment_node(m))
+    # Build augmented copies of the nested nodes so the graph's nodes aren't modified
+    for key in (MEMBERS, REACTANTS, PRODUCTS):
+        if key in node:
+            rv[key] = [_augment_node(m) for m in node[key]]
     if FUSION in node:
-        node[FUSION][PARTNER_3P].update(_augment_node(node[FUSION][PARTNER_3P]))
-        node[FUSION][PARTNER_5P].update(_augment_node(node[FUSION][PARTNER_5P]))
+        rv[FUSION] = {
+            **node[FUSION],
+            PARTNER_3P: _augment_node(node[FUSION][PARTNER_3P]),
+            PARTNER_5P: _augment_node(node[FUSION][PARTNER_5P]),
+        }
     return rv
 
 
@@ -4,15 +4,17 @@
 
 import gzip
 import json
-from typing import Any, Iterable, List, TextIO, Union
+from typing import Any, Iterable, List, Optional, TextIO, Tuple, Union
 
 from networkx.utils import open_file
 
 from .nodelink import _augment_node, _fix_annotation_list
-from ..constants import CITATION, SOURCE_MODIFIER, TARGET_MODIFIER
+from ..constants import CITATION, GRAPH_ANNOTATION_LIST, SOURCE_MODIFIER, TARGET_MODIFIER
+from ..dsl import BaseEntity
 from ..language import CitationDict
 from ..struct.graph import BELGraph, _handle_modifier
 from ..tokens import parse_result_to_dsl
+from ..typing import EdgeData
 from ..utils import hash_edge
 
 __all__ = [
@@ -28,26 +30,41 @@ SBEL = Any
 
 
 @open_file(1, mode='w')
-def to_sbel_file(graph: BELGraph, path: Union[str, TextIO], separators=(',', ':'), **kwargs) -> None:
+def to_sbel_file(
+    graph: BELGraph,
+    path: Union[str, TextIO],
+    separators=(',', ':'),
+    edges: Optional[Iterable[Tuple[BaseEntity, BaseEntity, str, EdgeData]]] = None,
+    **kwargs
+) -> None:
     """Write this graph as BEL JSONL to a file.
 
     :param graph: A BEL graph
     :param separators: The separators used in :func:`json.dumps`
     :param path: A path or file-like
+    :param edges: If given, write these ``(u, v, key, data)`` edges instead of the graph's, e.g., as they're
+     streamed from :func:`pybel.io.line_utils.iterate_lines`. The graph is still used for the metadata line.
     """
-    for i in iterate_sbel(graph):
+    for i in iterate_sbel(graph, edges=edges):
         print(json.dumps(i, ensure_ascii=False, separators=separators, **kwargs), file=path)
 
 
-def to_sbel_gz(graph: BELGraph, path: str, separators=(',', ':'), **kwargs) -> None:
+def to_sbel_gz(
+    graph: BELGraph,
+    path: str,
+    separators=(',', ':'),
+    edges: Optional[Iterable[Tuple[BaseEntity, BaseEntity, str, EdgeData]]] = None,
+    **kwargs
+) -> None:
     """Write a graph as BEL JSONL to a gzip file.
 
     :param graph: A BEL graph
     :param separators: The separators used in :func:`json.dumps`
     :param path: A path for a gzip file
+    :param edges: If given, write these edges instead of the graph's. See :func:`to_sbel_file`.
     """
     with gzip.open(path, 'wt') as file:
-        to_sbel_file(graph, file, separators=separators, **kwargs)
+        to_sbel_file(graph, file, separators=separators, edges=edges, **kwargs)
 
 
 def to_sbel(graph: BELGraph) -> List[SBEL]:
@@ -55,10 +72,25 @@ def to_sbel(graph: BELGraph) -> List[SBEL]:
     return list(iterate_sbel(graph))
 
 
-def iterate_sbel(graph: BELGraph) -> Iterable[SBEL]:
-    """Iterate over JSON dictionaries corresponding to lines in BEL JSONL."""
-    yield graph.graph.copy()
-    for u, v, k, d in graph.edges(data=True, keys=True):
+def iterate_sbel(
+    graph: BELGraph,
+    edges: Optional[Iterable[Tuple[BaseEntity, BaseEntity, str, EdgeData]]] = None,
+) -> Iterable[SBEL]:
+    """Iterate over JSON dictionaries corresponding to lines in BEL JSONL.
+
+    :param graph: A BEL graph
+    :param edges: If given, iterate over these edges instead of the graph's
+    """
+    header = graph.graph.copy()
+    # Convert annotation list definitions (which are sets) to canonicalized/sorted lists
+    header[GRAPH_ANNOTATION_LIST] = {
+        keyword: list(sorted(values))
+        for keyword, values in header.get(GRAPH_ANNOTATION_LIST, {}).items()
+    }
+    yield header
+    if edges is None:
+        edges = graph.edges(data=True, keys=True)
+    for u, v, k, d in edges:
         yield {
             'source': _augment_node(u),
             'target': _augment_node(v),
@@ -4,7 +4,7 @@
 
 import json
 import logging
-from typing import List, Optional, TextIO, Tuple, Union
+from typing import Iterable, List, Optional, TextIO, Tuple, Union
 
 from networkx.utils import open_file
 from tqdm import tqdm
@@ -12,6 +12,7 @@ from tqdm import tqdm
 from . import converters
 from ...dsl import BaseEntity
 from ...struct import BELGraph
+from ...typing import EdgeData
 
 __all__ = [
     'to_triples_file',
@@ -34,7 +35,8 @@ def to_triples_file(
     *,
     use_tqdm: bool = False,
     sep='\t',
-    raise_on_none: bool = False
+    raise_on_none: bool = False,
+    edges: Optional[Iterable[Tuple[BaseEntity, BaseEntity, str, EdgeData]]] = None
 ) -> None:
     """Write the graph as a TSV.
 
@@ -43,9 +45,16 @@ def to_triples_file(
     :param use_tqdm: Should a progress bar be shown?
     :param sep: The separator to use
     :param raise_on_none: Should an exception be raised if no triples are returned?
+    :param edges: If given, write the triples for these ``(u, v, key, data)`` edges as they're iterated instead
+     of the graph's, e.g., as they're streamed from :func:`pybel.io.line_utils.iterate_lines`. The triples are
+     written in the order of the edges, only skipping repeats of the previous triple.
     :raises: NoTriplesValueError
     """
-    for h, r, t in to_triples(graph, use_tqdm=use_tqdm, raise_on_none=raise_on_none):
+    if edges is None:
+        triples = to_triples(graph, use_tqdm=use_tqdm, raise_on_none=raise_on_none)
+    else:
+        triples = _iterate_triples(edges, raise_on_none=raise_on_none)
+    for h, r, t in triples:
         print(h, r, t, sep=sep, file=path)
 
 
@@ -108,15 +117,39 @@ def to_triples(graph: BELGraph, use_tqdm: bool = False, raise_on_none: bool = Fa
     return rv
 
 
+def _iterate_triples(
+    edges: Iterable[Tuple[BaseEntity, BaseEntity, str, EdgeData]],
+    raise_on_none: bool = False,
+) -> Iterable[Tuple[str, str, str]]:
+    """Iterate over the triples for a stream of edges, skipping Nones and repeats of the previous triple."""
+    previous = None
+    for u, v, key, data in edges:
+        triple = _edge_to_triple(u, v, key, data)
+        if triple is None or triple == previous:
+            continue
+        previous = triple
+        yield triple
+    if raise_on_none and previous is None:
+        raise NoTriplesValueError('Could not convert any triples')
+
+
 def to_triple(
     graph: BELGraph,
     u: BaseEntity,
     v: BaseEntity,
     key: str,
-) -> Optional[Tuple[str, str, str]]:  # noqa: C901
+) -> Optional[Tuple[str, str, str]]:
     """Get the triples' strings that should be written to the file."""
-    data = graph[u][v][key]
+    return _edge_to_triple(u, v, key, graph[u][v][key])
 
+
+def _edge_to_triple(
+    u: BaseEntity,
+    v: BaseEntity,
+    key: str,
+    data: EdgeData,
+) -> Optional[Tuple[str, str, str]]:  # noqa: C901
+    """Get the triples' strings for an edge."""
     # order is important
     _converters = [
         converters.ListComplexHasComponentConverter,
@@ -163,4 +196,4 @@ def to_triple(
         if converter.predicate(u, v, key, data):
             return converter.convert(u, v, key, data)
 
-    logger.warning('unhandled: {}'.format(graph.edge_to_bel(u, v, data)))
+    logger.warning('unhandled: {}'.format(BELGraph.edge_to_bel(u, v, data)))
@@ -7,7 +7,11 @@ databases. Its inclusion allows for the caching of namespaces and annotations fo
 downloading and parsing upon each compilation.
 """
 
-from . import base_manager, cache_manager, citation_utils, database_io, make_json_serializable, models, query_manager
+from . import (
+    async_manager, base_manager, cache_manager, citation_utils, database_io, make_json_serializable, models,
+    query_manager,
+)
+from .async_manager import *
 from .base_manager import *
 from .cache_manager import *
 from .citation_utils import *
@@ -16,7 +20,8 @@ from .models import *
 from .query_manager import *
 
 __all__ = (
-    base_manager.__all__
+    async_manager.__all__
+    + base_manager.__all__
     + cache_manager.__all__
     + citation_utils.__all__
     + database_io.__all__
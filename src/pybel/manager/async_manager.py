@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""An asynchronous facade for the database manager, for use in :mod:`asyncio` applications like web services.
+
+SQLAlchemy's ORM is synchronous, so :class:`AsyncManager` runs the manager's lookups and queries in a bounded pool of
+worker threads and awaits them, so they don't block the event loop. Each worker thread gets its own session from the
+manager's :class:`sqlalchemy.orm.scoped_session`, which is removed after every call so its connection goes back to the
+engine's pool. Set the pool size and overflow with :func:`pybel.manager.build_engine_session` or
+:class:`pybel.manager.Manager` so there are enough connections for the workers:
+
+.. code-block:: python
+
+    manager = Manager(pool_size=8, max_overflow=2)
+    async_manager = AsyncManager(manager, max_workers=10)
+    graph = await async_manager.get_graph_by_ids([1, 2])
+
+Models are returned detached from their session, so only the attributes that were loaded in the worker thread can be
+used. Use :meth:`AsyncManager.run` to do more work with them in the worker thread, like serializing them.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import GeneratorType
+from typing import Any, Callable, Optional, TypeVar
+
+from sqlalchemy.orm import Query, scoped_session
+
+from .cache_manager import Manager
+from ..config import config
+
+__all__ = [
+    'AsyncManager',
+]
+
+logger = logging.getLogger(__name__)
+
+X = TypeVar('X')
+
+#: The default number of worker threads used by :class:`AsyncManager`. Can be set with the configuration option
+#: ``manager_async_workers``. It should be at most the engine's pool size plus its overflow.
+DEFAULT_ASYNC_WORKERS = int(config.get('manager_async_workers', 5))
+
+#: The methods of :class:`pybel.manager.LookupManager` that get asynchronous versions
+LOOKUP_METHODS = [
+    'get_dsl_by_hash',
+    'get_node_by_hash',
+    'get_nodes_by_hashes',
+    'get_node_by_dsl',
+    'get_edge_by_hash',
+    'get_edges_by_hashes',
+    'get_citation_by_pmid',
+    'get_citation_by_reference',
+    'get_citation_by_curie',
+    'get_author_by_name',
+    'get_evidence_by_hash',
+    'get_evidence_by_reference_text',
+    'get_evidence_by_citation_text',
+]
+
+#: The methods of :class:`pybel.manager.QueryManager` that get asynchronous versions
+QUERY_METHODS = [
+    'has_search_index',
+    'search_evidences',
+    'search_edges',
+    'search_nodes',
+    'search_namespace_entries',
+    'count_nodes',
+    'query_nodes',
+    'count_edges',
+    'get_edges_with_citation',
+    'get_edges_with_citations',
+    'search_edges_with_evidence',
+    'search_edges_with_bel',
+    'get_edges_with_annotation',
+    'query_edges',
+    'query_citations',
+    'query_edges_by_pubmed_identifiers',
+    'query_induction',
+    'query_neighbors',
+    'can_push_down',
+    'get_subgraph_by_seeding',
+]
+
+#: The methods of :class:`pybel.manager.NetworkManager` that get asynchronous versions
+NETWORK_METHODS = [
+    'count_networks',
+    'list_networks',
+    'list_recent_networks',
+    'get_network_versions',
+    'get_network_by_name_version',
+    'get_graph_by_name_version',
+    'get_networks_by_name',
+    'get_graph_by_most_recent',
+    'get_network_by_id',
+    'get_graph_by_id',
+    'get_networks_by_ids',
+    'get_graphs_by_ids',
+    'get_graph_by_ids',
+    'get_universe_by_ids',
+]
+
+
+def _materialize(result):
+    """Load the results of lazy queries and generators, since they can't be used outside of the worker thread."""
+    if isinstance(result, Query):
+        return result.all()
+    if isinstance(result, GeneratorType):
+        return list(result)
+    return result
+
+
+class AsyncManager:
+    """Run the lookups and queries of a :class:`pybel.manager.Manager` in a pool of worker threads.
+
+    Has an asynchronous version of each of the methods in :data:`LOOKUP_METHODS`, :data:`QUERY_METHODS`, and
+    :data:`NETWORK_METHODS` with the same name and arguments. Queries and generators are loaded into lists before
+    they're returned.
+    """
+
+    def __init__(self, manager: Manager, max_workers: Optional[int] = None) -> None:
+        """Wrap a manager.
+
+        :param manager: A manager whose session is a :class:`sqlalchemy.orm.scoped_session`, like the ones built by
+         :func:`pybel.manager.build_engine_session`, so each worker thread gets its own session
+        :param max_workers: The number of worker threads. Defaults to :data:`DEFAULT_ASYNC_WORKERS`.
+        :raises ValueError: if the manager's session isn't scoped
+        """
+        if not isinstance(manager.session, scoped_session):
+            raise ValueError('manager session must be a scoped_session so it can be used from several threads')
+
+        self.manager = manager
+        self.max_workers = max_workers or DEFAULT_ASYNC_WORKERS
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='pybel-manager')
+
+    def _call(self, func: Callable[..., X], *args, **kwargs) -> X:
+        """Call a function in a worker thread, then remove the thread's session so its connection is released."""
+        try:
+            return _materialize(func(*args, **kwargs))
+        finally:
+            self.manager.session.remove()
+
+    async def _run_in_executor(self, func: Callable[..., X], *args, **kwargs) -> X:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, partial(self._call, func, *args, **kwargs))
+
+    async def run(self, func: Callable[..., X], *args, **kwargs) -> X:
+        """Call a function with the manager and the given arguments in a worker thread.
+
+        .. code-block:: python
+
+            def get_edge_bels(manager, network_id):
+                return [edge.bel for edge in manager.get_network_by_id(network_id).edges]
+
+            bels = await async_manager.run(get_edge_bels, 1)
+        """
+        return await self._run_in_executor(func, self.manager, *args, **kwargs)
+
+    def close(self) -> None:
+        """Wait for the running calls to finish, then stop the worker threads."""
+        self.executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncManager':  # noqa: D105
+        return self
+
+    async def __aexit__(self, *args) -> None:  # noqa: D105
+        self.close()
+
+    def __repr__(self):
+        return '<{} manager={!r} max_workers={}>'.format(self.__class__.__name__, self.manager, self.max_workers)
+
+
+def _make_async_method(name: str) -> Callable[..., Any]:
+    async def method(self, *args, **kwargs):
+        return await self._run_in_executor(getattr(self.manager, name), *args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = 'AsyncManager.{}'.format(name)
+    method.__doc__ = 'Run :meth:`pybel.manager.Manager.{}` in a worker thread.'.format(name)
+    return method
+
+
+for _name in LOOKUP_METHODS + QUERY_METHODS + NETWORK_METHODS:
+    setattr(AsyncManager, _name, _make_async_method(_name))
@@ -3,10 +3,12 @@
 """This module contains the base class for connection managers in SQLAlchemy."""
 
 import logging
-from typing import List, Optional, Tuple, Type, TypeVar
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Type, TypeVar
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from .models import Base
 from ..config import config
@@ -21,6 +23,127 @@ logger = logging.getLogger(__name__)
 X = TypeVar('X')
 
 
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in {'true', 'yes', 'on', '1'}
+    return bool(value)
+
+
+def _get_option(value: Optional[X], key: str, cast: Callable[[Any], X]) -> Optional[X]:
+    """Get an option, loading it from the configuration if it's None."""
+    if value is not None:
+        return value
+    value = config.get(key)
+    if value is None:
+        return
+    return cast(value)
+
+
+def _get_pool_options(
+    connection: str,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    pool_timeout: Optional[float] = None,
+    pool_recycle: Optional[int] = None,
+    pool_pre_ping: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """Get the keyword arguments for :func:`sqlalchemy.create_engine` that configure its connection pool."""
+    rv = dict(
+        pool_size=_get_option(pool_size, 'manager_pool_size', int),
+        max_overflow=_get_option(max_overflow, 'manager_max_overflow', int),
+        pool_timeout=_get_option(pool_timeout, 'manager_pool_timeout', float),
+        pool_recycle=_get_option(pool_recycle, 'manager_pool_recycle', int),
+        pool_pre_ping=_get_option(pool_pre_ping, 'manager_pool_pre_ping', _to_bool),
+    )
+    rv = {key: value for key, value in rv.items() if value is not None}
+
+    url = make_url(connection)
+    queue_options = rv.keys() & {'pool_size', 'max_overflow', 'pool_timeout'}
+    if url.get_backend_name() != 'sqlite' or not queue_options:
+        return rv
+
+    if url.database in {None, '', ':memory:'}:
+        # Every connection to an in-memory database gets its own database, so they can't be pooled
+        logger.warning('ignoring connection pool options for in-memory SQLite: %s', sorted(queue_options))
+        for key in queue_options:
+            del rv[key]
+        return rv
+
+    # SQLite files don't have a pool by default. Pooled connections are used by one thread at a time, but not always
+    # by the thread that opened them.
+    rv['poolclass'] = QueuePool
+    rv['connect_args'] = {'check_same_thread': False}
+    return rv
+
+
+#: The journal mode set on SQLite databases. Write-ahead logging lets readers and a writer work at the same time and
+#: makes commits cheaper. Can be set with the configuration option ``sqlite_journal_mode``.
+DEFAULT_SQLITE_JOURNAL_MODE = 'WAL'
+#: How often SQLite waits for writes to reach the disk. ``NORMAL`` is safe from corruption with write-ahead logging.
+#: Can be set with the configuration option ``sqlite_synchronous``.
+DEFAULT_SQLITE_SYNCHRONOUS = 'NORMAL'
+#: The size of SQLite's page cache. Negative numbers are in KiB, so this is 64 MiB. Can be set with the configuration
+#: option ``sqlite_cache_size``.
+DEFAULT_SQLITE_CACHE_SIZE = -65536
+#: The number of bytes of SQLite databases that are memory-mapped, here 256 MiB. Can be set with the configuration
+#: option ``sqlite_mmap_size``.
+DEFAULT_SQLITE_MMAP_SIZE = 268435456
+#: How psycopg2 runs ``executemany``, like the bulk inserts in :meth:`pybel.manager.Manager.insert_graph`. ``values``
+#: inserts many rows with each statement, and ``default`` runs one statement per row. Can be set with the
+#: configuration option ``postgresql_executemany_mode``.
+DEFAULT_POSTGRESQL_EXECUTEMANY_MODE = 'values'
+
+SQLITE_JOURNAL_MODES = {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'}
+SQLITE_SYNCHRONOUS = {'OFF', 'NORMAL', 'FULL', 'EXTRA'}
+POSTGRESQL_EXECUTEMANY_MODES = {'default', 'batch', 'values'}
+
+
+def _get_choice(value: Optional[str], key: str, default: str, choices: Set[str]) -> str:
+    """Get an option that's one of a few choices, loading it from the configuration if it's None."""
+    value = _get_option(value, key, str) or default
+    if value.upper() in choices:
+        return value.upper()
+    if value.lower() in choices:
+        return value.lower()
+    raise ValueError('invalid value for {}: {}. Should be one of: {}'.format(key, value, ', '.join(sorted(choices))))
+
+
+def _get_sqlite_pragmas(
+    journal_mode: Optional[str] = None,
+    synchronous: Optional[str] = None,
+    cache_size: Optional[int] = None,
+    mmap_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Get the pragmas set on each connection to an SQLite database."""
+    cache_size = _get_option(cache_size, 'sqlite_cache_size', int)
+    mmap_size = _get_option(mmap_size, 'sqlite_mmap_size', int)
+    return dict(
+        journal_mode=_get_choice(
+            journal_mode, 'sqlite_journal_mode', DEFAULT_SQLITE_JOURNAL_MODE, SQLITE_JOURNAL_MODES,
+        ),
+        synchronous=_get_choice(
+            synchronous, 'sqlite_synchronous', DEFAULT_SQLITE_SYNCHRONOUS, SQLITE_SYNCHRONOUS,
+        ),
+        cache_size=DEFAULT_SQLITE_CACHE_SIZE if cache_size is None else cache_size,
+        mmap_size=DEFAULT_SQLITE_MMAP_SIZE if mmap_size is None else mmap_size,
+    )
+
+
+def _set_sqlite_pragmas(engine, pragmas: Mapping[str, Any]) -> None:
+    """Set the pragmas on each new connection to an SQLite database."""
+    # The values were checked against their choices or cast to integers, so they're safe to format into the statements
+    statements = ['PRAGMA {} = {}'.format(key, value) for key, value in pragmas.items()]
+
+    @event.listens_for(engine, 'connect')
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
 def build_engine_session(
     connection: str,
     echo: bool = False,
@@ -28,6 +151,16 @@ def build_engine_session(
     autocommit: Optional[bool] = None,
     expire_on_commit: Optional[bool] = None,
     scopefunc=None,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    pool_timeout: Optional[float] = None,
+    pool_recycle: Optional[int] = None,
+    pool_pre_ping: Optional[bool] = None,
+    sqlite_journal_mode: Optional[str] = None,
+    sqlite_synchronous: Optional[str] = None,
+    sqlite_cache_size: Optional[int] = None,
+    sqlite_mmap_size: Optional[int] = None,
+    executemany_mode: Optional[str] = None,
 ) -> Tuple:
     """Build an engine and a session.
 
@@ -37,7 +170,28 @@ def build_engine_session(
     :param autocommit: Defaults to False if not specified in kwargs or configuration.
     :param expire_on_commit: Defaults to False if not specified in kwargs or configuration.
     :param scopefunc: Scoped function to pass to :func:`sqlalchemy.orm.scoped_session`
+    :param pool_size: The number of connections kept open in the pool. Defaults to the configuration option
+     ``manager_pool_size``, then to SQLAlchemy's default for the database.
+    :param max_overflow: The number of connections that can be opened beyond the pool size when it's busy. Defaults
+     to the configuration option ``manager_max_overflow``.
+    :param pool_timeout: The number of seconds to wait for a connection when the pool is exhausted. Defaults to the
+     configuration option ``manager_pool_timeout``.
+    :param pool_recycle: The number of seconds after which connections are replaced. Defaults to the configuration
+     option ``manager_pool_recycle``.
+    :param pool_pre_ping: Check connections are alive before using them. Defaults to the configuration option
+     ``manager_pool_pre_ping``.
+    :param sqlite_journal_mode: SQLite's ``journal_mode`` pragma. Defaults to :data:`DEFAULT_SQLITE_JOURNAL_MODE`.
+    :param sqlite_synchronous: SQLite's ``synchronous`` pragma. Defaults to :data:`DEFAULT_SQLITE_SYNCHRONOUS`.
+    :param sqlite_cache_size: SQLite's ``cache_size`` pragma. Defaults to :data:`DEFAULT_SQLITE_CACHE_SIZE`.
+    :param sqlite_mmap_size: SQLite's ``mmap_size`` pragma. Defaults to :data:`DEFAULT_SQLITE_MMAP_SIZE`.
+    :param executemany_mode: psycopg2's ``executemany`` mode for PostgreSQL, one of ``default``, ``batch``, or
+     ``values``. Defaults to :data:`DEFAULT_POSTGRESQL_EXECUTEMANY_MODE`.
     :rtype: tuple[Engine,Session]
+    :raises ValueError: if the journal mode, synchronous setting, or ``executemany`` mode isn't a valid choice
+
+    SQLite files don't use a connection pool by default. If a pool size, overflow, or timeout is given for one, a
+    :class:`sqlalchemy.pool.QueuePool` is used, whose connections can be shared by threads, like the ones used by
+    :class:`pybel.manager.AsyncManager`. They're ignored for in-memory SQLite databases.
 
     From the Flask-SQLAlchemy documentation:
 
@@ -50,7 +204,35 @@ def build_engine_session(
     if connection is None:
         raise ValueError('can not build engine when connection is None')
 
-    engine = create_engine(connection, echo=echo)
+    pool_options = _get_pool_options(
+        connection,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+    )
+    url = make_url(connection)
+    settings = dict(pool_options)
+    if url.get_backend_name() == 'postgresql' and url.get_driver_name() == 'psycopg2':
+        executemany_mode = _get_choice(
+            executemany_mode, 'postgresql_executemany_mode', DEFAULT_POSTGRESQL_EXECUTEMANY_MODE,
+            POSTGRESQL_EXECUTEMANY_MODES,
+        )
+        # SQLAlchemy's psycopg2 dialect calls the default mode None
+        settings['executemany_mode'] = None if executemany_mode == 'default' else executemany_mode
+
+    engine = create_engine(url, echo=echo, **settings)
+
+    if url.get_backend_name() == 'sqlite':
+        pragmas = _get_sqlite_pragmas(
+            journal_mode=sqlite_journal_mode,
+            synchronous=sqlite_synchronous,
+            cache_size=sqlite_cache_size,
+            mmap_size=sqlite_mmap_size,
+        )
+        _set_sqlite_pragmas(engine, pragmas)
+        settings.update(('pragma_' + key, value) for key, value in pragmas.items())
 
     if autoflush is None:
         autoflush = config.get('PYBEL_MANAGER_AUTOFLUSH', True)
@@ -61,7 +243,17 @@ def build_engine_session(
     if expire_on_commit is None:
         expire_on_commit = config.get('PYBEL_MANAGER_AUTOEXPIRE', True)
 
-    logger.debug('auto flush: %s, auto commit: %s, expire on commmit: %s', autoflush, autocommit, expire_on_commit)
+    settings.update(
+        poolclass=type(engine.pool).__name__,
+        autoflush=autoflush,
+        autocommit=autocommit,
+        expire_on_commit=expire_on_commit,
+    )
+    settings.pop('connect_args', None)
+    logger.info('building engine for %r with %s', url, ', '.join(
+        '{}={}'.format(key, value.__name__ if isinstance(value, type) else value)
+        for key, value in sorted(settings.items())
+    ))
 
     #: A SQLAlchemy session maker
     session_maker = sessionmaker(
@@ -97,6 +289,36 @@ class BaseManager(object):
         :param checkfirst: Check if the database exists before trying to re-make it
         """
         self.base.metadata.create_all(bind=self.engine, checkfirst=checkfirst)
+        self.upgrade()
+
+    def upgrade(self) -> None:
+        """Add the columns that were added to the models after the database's tables were created.
+
+        Creating the tables doesn't change the ones that already exist, so this runs after :meth:`create_all`. For
+        example, it adds :data:`pybel.manager.models.Network.blob_codec` to databases made by older versions of
+        PyBEL. The existing rows get null values, which mean the same as before the column was added. Columns that
+        can't be null can't be added, so a warning is logged instead.
+        """
+        inspector = inspect(self.engine)
+        table_names = set(inspector.get_table_names())
+        quote = self.engine.dialect.identifier_preparer.quote
+        for table in self.base.metadata.sorted_tables:
+            if table.name not in table_names:
+                continue
+            column_names = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in column_names:
+                    continue
+                if not column.nullable:
+                    logger.warning('can not add non-nullable column %s.%s. Rebuild the database', table, column.name)
+                    continue
+                logger.info('adding column %s.%s', table.name, column.name)
+                with self.engine.begin() as connection:
+                    connection.execute('ALTER TABLE {} ADD COLUMN {} {}'.format(
+                        quote(table.name),
+                        quote(column.name),
+                        column.type.compile(dialect=self.engine.dialect),
+                    ))
 
     def drop_all(self, checkfirst: bool = True) -> None:
         """Drop all data, tables, and databases for the PyBEL cache.
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+"""Codecs for the blobs of BEL graphs stored with :class:`pybel.manager.models.Network`.
+
+The name of the codec used for a network's blob is stored in the same row, so blobs stored with different codecs can
+be read side by side. Blobs stored before codecs were recorded are plain pickles. More codecs can be added to
+:data:`BLOB_CODECS`.
+
+The default codec, :data:`CHUNKED_PICKLE_GZIP`, writes a gzipped stream of pickles. The first is the graph without its
+edges, so it has the metadata, the terminologies, the warnings, and the nodes in order. The rest are chunks of the
+edges, where the source and target of each are given by their positions in the nodes of the first pickle. This means
+the edges can be iterated without building the whole graph with :func:`iterate_blob_edges`. Blobs with this codec can
+also be written from a stream of edges with :class:`ChunkedBlobWriter`.
+"""
+
+import gzip
+import pickle
+import shutil
+import tempfile
+from io import BytesIO
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from more_itertools import chunked
+
+from ..config import config
+from ..dsl import BaseEntity
+from ..io.gpickle import from_bytes, to_bytes
+from ..io.utils import raise_for_not_bel, raise_for_old_graph
+from ..struct.graph import BELGraph
+from ..typing import EdgeData
+
+__all__ = [
+    'BlobCodec',
+    'BLOB_CODECS',
+    'PICKLE',
+    'PICKLE_GZIP',
+    'CHUNKED_PICKLE_GZIP',
+    'DEFAULT_BLOB_CODEC',
+    'ChunkedBlobWriter',
+    'to_blob',
+    'from_blob',
+    'from_blob_header',
+    'iterate_blob_edges',
+]
+
+EdgeTuple = Tuple[BaseEntity, BaseEntity, str, EdgeData]
+
+#: The number of edges in each pickle written by :data:`CHUNKED_PICKLE_GZIP`
+EDGE_CHUNK_SIZE = 10000
+
+#: The compression level used by the gzip codecs. Lower is faster but bigger.
+GZIP_COMPRESS_LEVEL = 6
+
+
+class BlobCodec(NamedTuple):
+    """Functions to write a graph to a blob, read it back, and read the edges or the graph's metadata from the blob."""
+
+    to_bytes: Callable[[BELGraph], bytes]
+    from_bytes: Callable[[bytes], BELGraph]
+    iterate_edges: Callable[[bytes], Iterable[EdgeTuple]]
+    read_header: Callable[[bytes], BELGraph]
+
+
+def _iterate_graph_edges(graph: BELGraph) -> Iterable[EdgeTuple]:
+    return graph.edges(keys=True, data=True)
+
+
+def _get_graph_header(graph: BELGraph) -> BELGraph:
+    """Get a graph with the given graph's metadata and terminologies, but no nodes, edges, or warnings."""
+    rv = BELGraph()
+    rv.graph = graph.graph
+    return rv
+
+
+def _to_pickle_gzip(graph: BELGraph) -> bytes:
+    return gzip.compress(to_bytes(graph), compresslevel=GZIP_COMPRESS_LEVEL)
+
+
+def _from_pickle_gzip(blob: bytes) -> BELGraph:
+    return from_bytes(gzip.decompress(blob))
+
+
+def _get_chunked_header(graph: BELGraph, nodes: Iterable) -> BELGraph:
+    """Get the first pickle of a :data:`CHUNKED_PICKLE_GZIP` blob, which has the graph's metadata but no edges."""
+    header = BELGraph()
+    header.graph = graph.graph
+    header._warnings = graph._warnings
+    header.add_nodes_from(nodes)
+    return header
+
+
+def _to_chunked_pickle_gzip(graph: BELGraph) -> bytes:
+    raise_for_not_bel(graph)
+
+    header = _get_chunked_header(graph, graph.nodes(data=True))
+    node_to_index = {node: index for index, node in enumerate(header)}
+
+    rv = BytesIO()
+    with gzip.GzipFile(fileobj=rv, mode='wb', compresslevel=GZIP_COMPRESS_LEVEL) as file:
+        pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+        for edges in chunked(graph.edges(keys=True, data=True), EDGE_CHUNK_SIZE):
+            chunk = [
+                (node_to_index[u], node_to_index[v], key, data)
+                for u, v, key, data in edges
+            ]
+            pickle.dump(chunk, file, protocol=pickle.HIGHEST_PROTOCOL)
+    return rv.getvalue()
+
+
+def _iterate_chunked_pickle_gzip(blob: bytes) -> Tuple[BELGraph, Iterable[List[EdgeTuple]]]:
+    """Read the graph without its edges from a blob, then lazily read its chunks of edges."""
+    file = gzip.GzipFile(fileobj=BytesIO(blob), mode='rb')
+    header = pickle.load(file)
+    raise_for_not_bel(header)
+    raise_for_old_graph(header)
+    nodes = list(header)
+
+    def _iterate_chunks() -> Iterable[List[EdgeTuple]]:
+        with file:
+            while True:
+                try:
+                    chunk = pickle.load(file)
+                except EOFError:
+                    return
+                yield [
+                    (nodes[u], nodes[v], key, data)
+                    for u, v, key, data in chunk
+                ]
+
+    return header, _iterate_chunks()
+
+
+def _from_chunked_pickle_gzip(blob: bytes) -> BELGraph:
+    graph, chunks = _iterate_chunked_pickle_gzip(blob)
+    for chunk in chunks:
+        graph._help_add_keyed_edges(chunk)
+    return graph
+
+
+def _iterate_chunked_pickle_gzip_edges(blob: bytes) -> Iterable[EdgeTuple]:
+    _, chunks = _iterate_chunked_pickle_gzip(blob)
+    for chunk in chunks:
+        yield from chunk
+
+
+def _read_chunked_pickle_gzip_header(blob: bytes) -> BELGraph:
+    with gzip.GzipFile(fileobj=BytesIO(blob), mode='rb') as file:
+        header = pickle.load(file)
+    raise_for_not_bel(header)
+    raise_for_old_graph(header)
+    return _get_graph_header(header)
+
+
+#: The codec of blobs stored before codecs were recorded. It's a plain pickle of the graph.
+PICKLE = 'pickle'
+#: A gzipped pickle of the graph
+PICKLE_GZIP = 'pickle+gzip'
+#: A gzipped stream of pickles of the graph without its edges followed by chunks of its edges
+CHUNKED_PICKLE_GZIP = 'chunked-pickle+gzip'
+
+#: The codecs that can be used for blobs, by name
+BLOB_CODECS: Dict[str, BlobCodec] = {
+    PICKLE: BlobCodec(
+        to_bytes=to_bytes,
+        from_bytes=from_bytes,
+        iterate_edges=lambda blob: _iterate_graph_edges(from_bytes(blob)),
+        read_header=lambda blob: _get_graph_header(from_bytes(blob)),
+    ),
+    PICKLE_GZIP: BlobCodec(
+        to_bytes=_to_pickle_gzip,
+        from_bytes=_from_pickle_gzip,
+        iterate_edges=lambda blob: _iterate_graph_edges(_from_pickle_gzip(blob)),
+        read_header=lambda blob: _get_graph_header(_from_pickle_gzip(blob)),
+    ),
+    CHUNKED_PICKLE_GZIP: BlobCodec(
+        to_bytes=_to_chunked_pickle_gzip,
+        from_bytes=_from_chunked_pickle_gzip,
+        iterate_edges=_iterate_chunked_pickle_gzip_edges,
+        read_header=_read_chunked_pickle_gzip_header,
+    ),
+}
+
+#: The codec used to store new blobs. Can be set with the configuration option ``network_blob_codec``.
+DEFAULT_BLOB_CODEC = config.get('network_blob_codec', CHUNKED_PICKLE_GZIP)
+
+
+def _get_codec(codec: Optional[str]) -> BlobCodec:
+    try:
+        return BLOB_CODECS[codec or PICKLE]
+    except KeyError:
+        raise ValueError('unknown blob codec: {}'.format(codec)) from None
+
+
+def to_blob(graph: BELGraph, codec: Optional[str] = None) -> Tuple[bytes, str]:
+    """Write a graph to a blob.
+
+    :param graph: A BEL graph
+    :param codec: The name of the codec to use. Defaults to :data:`DEFAULT_BLOB_CODEC`.
+    :returns: The blob and the name of the codec that was used
+    """
+    codec = codec or DEFAULT_BLOB_CODEC
+    return _get_codec(codec).to_bytes(graph), codec
+
+
+def from_blob(blob: bytes, codec: Optional[str] = None) -> BELGraph:
+    """Read a graph from a blob.
+
+    :param blob: A blob written by :func:`to_blob`
+    :param codec: The name of the codec that was used. If None, the blob is a plain pickle.
+    """
+    return _get_codec(codec).from_bytes(blob)
+
+
+def from_blob_header(blob: bytes, codec: Optional[str] = None) -> BELGraph:
+    """Read a graph's metadata and terminologies from a blob, without its nodes, edges, or warnings.
+
+    With :data:`CHUNKED_PICKLE_GZIP`, only the first pickle is decompressed and unpickled. The other codecs have to
+    read the whole graph first.
+
+    :param blob: A blob written by :func:`to_blob`
+    :param codec: The name of the codec that was used. If None, the blob is a plain pickle.
+    """
+    return _get_codec(codec).read_header(blob)
+
+
+def iterate_blob_edges(blob: bytes, codec: Optional[str] = None) -> Iterable[EdgeTuple]:
+    """Iterate over the ``(u, v, key, data)`` edges in a blob.
+
+    With :data:`CHUNKED_PICKLE_GZIP`, only one chunk of edges is decompressed and unpickled at a time. The other codecs
+    have to read the whole graph first.
+
+    :param blob: A blob written by :func:`to_blob`
+    :param codec: The name of the codec that was used. If None, the blob is a plain pickle.
+    """
+    return _get_codec(codec).iterate_edges(blob)
+
+
+class ChunkedBlobWriter:
+    """Write a :data:`CHUNKED_PICKLE_GZIP` blob from a stream of edges.
+
+    This is used for networks whose edges are inserted as they're streamed, e.g., from
+    :func:`pybel.io.line_utils.iterate_lines`. The chunks of edges are pickled to a temporary file as they're added,
+    so only the nodes and the keys of the edges are kept in memory. The header can only be written once all of the
+    nodes are known, so it's put in front of the chunks by :meth:`to_blob`. Edges that are added more than once are
+    only written the first time.
+    """
+
+    def __init__(self) -> None:
+        """Open the temporary file for the chunks of edges."""
+        self._node_to_index: Dict[BaseEntity, int] = {}
+        self._keys = set()
+        self._file = tempfile.TemporaryFile()
+
+    def _get_index(self, node: BaseEntity) -> int:
+        index = self._node_to_index.get(node)
+        if index is None:
+            index = self._node_to_index[node] = len(self._node_to_index)
+        return index
+
+    def add_edges(self, edges: Iterable[EdgeTuple]) -> None:
+        """Write a chunk of ``(u, v, key, data)`` edges."""
+        chunk = []
+        for u, v, key, data in edges:
+            if key in self._keys:
+                continue
+            self._keys.add(key)
+            chunk.append((self._get_index(u), self._get_index(v), key, data))
+        if chunk:
+            pickle.dump(chunk, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def to_blob(self, graph: BELGraph) -> Tuple[bytes, str]:
+        """Write the blob, then close the temporary file.
+
+        :param graph: The graph with the metadata, terminologies, and warnings of the streamed edges
+        :returns: The blob and the name of its codec, like :func:`to_blob`
+        """
+        raise_for_not_bel(graph)
+        header = _get_chunked_header(graph, self._node_to_index)
+
+        rv = BytesIO()
+        with self._file, gzip.GzipFile(fileobj=rv, mode='wb', compresslevel=GZIP_COMPRESS_LEVEL) as file:
+            pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._file.seek(0)
+            shutil.copyfileobj(self._file, file)
+        return rv.getvalue(), CHUNKED_PICKLE_GZIP
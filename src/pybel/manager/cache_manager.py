@@ -6,36 +6,53 @@ Under the hood, PyBEL caches namespace and annotation files for quick recall on
 enable this option, but can specify a database location if they choose.
 """
 
+import hashlib
 import logging
+import os
+import tempfile
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from itertools import chain
-from typing import Any, Iterable, List, Mapping, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple, Type
 
 import requests
 import sqlalchemy
+from more_itertools import chunked
 from sqlalchemy import and_, exists, func
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm.util import identity_key
 from tqdm import tqdm
 
 from bel_resources import get_bel_resource
 from .base_manager import BaseManager, build_engine_session
+from .blob import CHUNKED_PICKLE_GZIP, ChunkedBlobWriter, from_blob, to_blob
 from .exc import EdgeAddError
 from .lookup_manager import LookupManager
 from .models import (
-    Author, Citation, Edge, Evidence, Namespace, NamespaceEntry, Network, Node, edge_annotation, network_edge,
+    Author, Base, Citation, Edge, Evidence, Namespace, NamespaceEntry, Network, Node, edge_annotation, network_edge,
     network_node,
 )
 from .query_manager import QueryManager
-from .utils import extract_shared_optional, extract_shared_required, update_insert_values
+from .utils import (
+    ObjectCache, ObjectCacheInfo, extract_shared_optional, extract_shared_required, update_insert_values,
+)
 from ..constants import (
     ANNOTATIONS, BEL_DEFAULT_NAMESPACE, CITATION, CITATION_TYPE_PUBMED, EVIDENCE, IDENTIFIER, METADATA_INSERT_KEYS,
     NAMESPACE, RELATION, SOURCE_MODIFIER, TARGET_MODIFIER, UNQUALIFIED_EDGES, belns_encodings, get_cache_connection,
 )
+from ..config import (
+    config, term_index_directory as default_term_index_directory,
+    universe_cache_directory as default_universe_cache_directory,
+)
 from ..dsl import BaseConcept, BaseEntity
 from ..language import (
     BEL_DEFAULT_NAMESPACE_URL, BEL_DEFAULT_NAMESPACE_VERSION, Entity, activity_mapping, compartment_mapping,
     gmod_mappings, pmod_mappings,
 )
+from ..parser.constants import TermEncodingMapping
+from ..parser.term_index import get_term_index
 from ..struct.graph import AnnotationsDict, BELGraph
 from ..struct.operations import union
 from ..typing import EdgeData
@@ -43,12 +60,31 @@ from ..typing import EdgeData
 __all__ = [
     'Manager',
     'NetworkManager',
+    'DropSummary',
 ]
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_BELNS_ENCODING = ''.join(sorted(belns_encodings))
 
+#: The number of rows, like namespace entries, inserted at a time with ``executemany``
+DEFAULT_ENTRY_BATCH_SIZE = 10000
+
+#: The number of values in each ``IN`` clause used to look up existing rows in bulk
+DEFAULT_IN_CLAUSE_SIZE = 500
+
+#: The default maximum number of models kept in each of the :class:`InsertManager`'s caches
+DEFAULT_OBJECT_CACHE_SIZE = 100000
+
+#: The default number of merged graphs kept by :meth:`NetworkManager.get_universe_by_ids`
+DEFAULT_UNIVERSE_CACHE_SIZE = 8
+
+#: The default number of threads used by :meth:`NamespaceManager.ensure_resources` to download resources
+DEFAULT_DOWNLOAD_WORKERS = 8
+
+#: The default number of rows deleted at a time by :meth:`NetworkManager.drop_networks_by_ids`
+DEFAULT_DELETE_CHUNK_SIZE = DEFAULT_IN_CLAUSE_SIZE
+
 _optional_namespace_entries_mapping = {
     'species': ('Namespace', 'SpeciesString'),
     'query_url': ('Namespace', 'QueryValueURL'),
@@ -56,6 +92,26 @@ _optional_namespace_entries_mapping = {
 }
 
 
+class DropSummary(NamedTuple):
+    """The numbers of rows deleted by :meth:`NetworkManager.drop_networks_by_ids` and :meth:`NetworkManager.prune`."""
+
+    networks: int
+    edges: int
+    nodes: int
+    evidences: int
+
+    def __str__(self) -> str:  # noqa: D105
+        return '{} networks, {} edges, {} nodes, and {} evidences'.format(*self)
+
+
+def _get_evidence_key(data: EdgeData) -> Optional[Tuple[str, str, str]]:
+    """Get the citation's namespace and identifier and the evidence text from an edge's data, if it has them all."""
+    citation = data.get(CITATION)
+    if citation is None or EVIDENCE not in data or NAMESPACE not in citation or IDENTIFIER not in citation:
+        return
+    return citation[NAMESPACE], citation[IDENTIFIER], data[EVIDENCE]
+
+
 def _get_namespace_insert_values(bel_resource):
     namespace_insert_values = {
         'name': bel_resource['Namespace']['NameString'],
@@ -101,6 +157,40 @@ def _clean_bel_namespace_values(bel_resource):
     }
 
 
+def _download_namespace(url: str) -> Tuple[Mapping[str, Any], Mapping[str, str]]:
+    """Download a namespace and, if it has one, the mapping from its names to identifiers.
+
+    This doesn't touch the database, so it can be run in a thread pool.
+
+    :raises: pybel.resources.exc.ResourceError
+    """
+    bel_resource = get_bel_resource(url)
+    _clean_bel_namespace_values(bel_resource)
+
+    name_to_id = {}
+    if url.endswith('-names.belns'):
+        mapping_url = url[:-len('-names.belns')] + '.belns.mapping'
+        try:
+            res = requests.get(mapping_url)
+            res.raise_for_status()
+        except requests.exceptions.HTTPError:
+            logger.warning('No mappings found for %s', url)
+        else:
+            mappings = res.json()
+            logger.debug('got %d mappings', len(mappings))
+            name_to_id.update({v: k for k, v in mappings.items()})
+
+    return bel_resource, name_to_id
+
+
+def _download_annotation(url: str) -> Mapping[str, Any]:
+    """Download an annotation. This doesn't touch the database, so it can be run in a thread pool.
+
+    :raises: pybel.resources.exc.ResourceError
+    """
+    return get_bel_resource(url)
+
+
 def _normalize_url(graph: BELGraph, keyword: str) -> Optional[str]:  # FIXME move to utilities and unit test
     """Normalize a URL for the BEL graph."""
     if keyword == BEL_DEFAULT_NAMESPACE and BEL_DEFAULT_NAMESPACE not in graph.namespace_url:
@@ -112,6 +202,10 @@ def _normalize_url(graph: BELGraph, keyword: str) -> Optional[str]:  # FIXME mov
 class NamespaceManager(BaseManager):
     """Manages BEL namespaces."""
 
+    #: The directory where memory-mapped term indexes for namespaces are stored. If None, the terms are loaded
+    #: from the database each time they're needed.
+    term_index_directory: Optional[str] = None
+
     def list_namespaces(self) -> List[Namespace]:
         """List all namespaces."""
         return self._list_model(Namespace)
@@ -185,46 +279,118 @@ class NamespaceManager(BaseManager):
             return result
 
         t = time.time()
+        bel_resource, name_to_id = _download_namespace(url)
+        namespace = self._insert_namespace(url, bel_resource, name_to_id)
 
-        bel_resource = get_bel_resource(url)
+        logger.debug('committing namespace')
+        self.session.commit()
 
-        _clean_bel_namespace_values(bel_resource)
+        logger.info(
+            'inserted namespace: %s (%d terms in %.2f seconds)', url, len(bel_resource['Values']), time.time() - t,
+        )
+        return namespace
 
-        values = bel_resource['Values']
+    def get_namespace_terms(self, namespace: Namespace) -> TermEncodingMapping:
+        """Get a mapping from the (identifier, name) pairs in a namespace to their encodings.
 
-        namespace_insert_values = _get_namespace_insert_values(bel_resource)
+        If :attr:`term_index_directory` is set, this is a :class:`pybel.parser.term_index.TermIndex` that's built
+        the first time the namespace is used, then shared by all of the parsers on this machine.
+        """
+        if self.term_index_directory is None:
+            return namespace.get_term_to_encodings()
 
-        name_to_id = {}
-        if url.endswith('-names.belns'):
-            mapping_url = url[:-len('-names.belns')] + '.belns.mapping'
-            try:
-                res = requests.get(mapping_url)
-                res.raise_for_status()
-            except requests.exceptions.HTTPError:
-                logger.warning('No mappings found for %s', url)
-            else:
-                mappings = res.json()
-                logger.debug('got %d mappings', len(mappings))
-                name_to_id.update({v: k for k, v in res.json().items()})
+        key = '{}\t{}\t{}'.format(namespace.url, namespace.id, namespace.uploaded).encode('utf-8')
+        path = os.path.join(self.term_index_directory, '{}.terms'.format(hashlib.sha256(key).hexdigest()))
+        return get_term_index(path, namespace.get_term_to_encodings)
 
+    def _insert_namespace(self, url: str, bel_resource, name_to_id: Mapping[str, str]) -> Namespace:
+        """Add a namespace from a downloaded resource to the session without committing."""
         namespace = Namespace(
             url=url,
-            **namespace_insert_values,
+            **_get_namespace_insert_values(bel_resource),
         )
+        self._bulk_insert_entries(namespace, (
+            dict(name=name, encoding=encoding, identifier=name_to_id.get(name))
+            for name, encoding in bel_resource['Values'].items()
+        ))
+        return namespace
 
-        logger.debug('building NamespaceEntry instances')
-        namespace.entries = [
-            NamespaceEntry(name=name, encoding=encoding, identifier=name_to_id.get(name))
-            for name, encoding in values.items()
-        ]
+    def _bulk_insert_entries(self, namespace: Namespace, entries: Iterable[Mapping[str, Any]]) -> None:
+        """Add a namespace to the session and insert its entries in batches without building ORM objects.
 
+        The entries are inserted with SQLAlchemy Core using ``executemany`` in the session's transaction, so they're
+        committed or rolled back along with the namespace.
+
+        :param namespace: A namespace that hasn't been added to the session yet
+        :param entries: Dictionaries with the name, identifier, and encoding of each entry
+        """
         self.session.add(namespace)
+        self.session.flush()
 
-        logger.debug('committing namespace')
-        self.session.commit()
+        logger.debug('inserting namespace entries in batches of %d', DEFAULT_ENTRY_BATCH_SIZE)
+        insert = NamespaceEntry.__table__.insert()
+        for batch in chunked(entries, DEFAULT_ENTRY_BATCH_SIZE):
+            for entry in batch:
+                entry['namespace_id'] = namespace.id
+            self.session.execute(insert, batch)
 
-        logger.info('inserted namespace: %s (%d terms in %.2f seconds)', url, len(values), time.time() - t)
-        return namespace
+    def ensure_resources(
+        self,
+        namespace_urls: Iterable[str] = (),
+        annotation_urls: Iterable[str] = (),
+        max_workers: Optional[int] = None,
+    ) -> Mapping[str, Exception]:
+        """Get or create many namespaces and annotations at once.
+
+        The resources that aren't already in the database are downloaded in a thread pool, then inserted in a
+        single transaction.
+
+        :param namespace_urls: The URLs of BEL namespaces
+        :param annotation_urls: The URLs of BEL annotations
+        :param max_workers: The number of threads to download with. Defaults to
+         :data:`DEFAULT_DOWNLOAD_WORKERS`.
+        :returns: A dictionary from the URLs of the resources that couldn't be downloaded to their exceptions.
+         They can be retried with :meth:`get_or_create_namespace` or :meth:`get_or_create_annotation`.
+        """
+        url_to_download = dict.fromkeys(namespace_urls, _download_namespace)
+        url_to_download.update(dict.fromkeys(annotation_urls, _download_annotation))
+        if not url_to_download:
+            return {}
+
+        existing_urls = {
+            url
+            for url, in self.session.query(Namespace.url).filter(Namespace.url.in_(url_to_download))
+        }
+        missing_urls = [url for url in url_to_download if url not in existing_urls]
+        if not missing_urls:
+            return {}
+
+        t = time.time()
+        url_to_result, url_to_exception = {}, {}
+        with ThreadPoolExecutor(max_workers=max_workers or DEFAULT_DOWNLOAD_WORKERS) as executor:
+            future_to_url = {
+                executor.submit(url_to_download[url], url): url
+                for url in missing_urls
+            }
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    url_to_result[url] = future.result()
+                except Exception as e:
+                    logger.warning('could not download %s: %s', url, e)
+                    url_to_exception[url] = e
+
+        for url in missing_urls:  # insert in a deterministic order
+            if url not in url_to_result:
+                continue
+            if url_to_download[url] is _download_namespace:
+                self._insert_namespace(url, *url_to_result[url])
+            else:
+                self._insert_annotation(url, url_to_result[url])
+
+        self.session.commit()
+        logger.info('inserted %d resources in %.2f seconds', len(url_to_result), time.time() - t)
+        return url_to_exception
 
     def get_namespace_by_keyword_pattern(self, keyword: str, pattern: str) -> Optional[Namespace]:
         """Get a namespace with a given keyword and pattern."""
@@ -325,28 +491,29 @@ class NamespaceManager(BaseManager):
             return result
 
         t = time.time()
+        bel_resource = _download_annotation(url)
+        result = self._insert_annotation(url, bel_resource)
+        self.session.commit()
+
+        logger.info(
+            'inserted annotation: %s (%d terms in %.2f seconds)', url, len(bel_resource['Values']),
+            time.time() - t,
+        )
 
-        bel_resource = get_bel_resource(url)
+        return result
 
+    def _insert_annotation(self, url: str, bel_resource) -> Namespace:
+        """Add an annotation from a downloaded resource to the session without committing."""
         result = Namespace(
             url=url,
             is_annotation=True,
             **_get_annotation_insert_values(bel_resource),
         )
-        result.entries = [
-            NamespaceEntry(name=name, identifier=label)
+        self._bulk_insert_entries(result, (
+            dict(name=name, identifier=label, encoding=None, is_annotation=True)
             for name, label in bel_resource['Values'].items()
             if name
-        ]
-
-        self.session.add(result)
-        self.session.commit()
-
-        logger.info(
-            'inserted annotation: %s (%d terms in %.2f seconds)', url, len(bel_resource['Values']),
-            time.time() - t,
-        )
-
+        ))
         return result
 
     def get_annotation_entry_names(self, url: str) -> Set[str]:
@@ -378,6 +545,32 @@ class NamespaceManager(BaseManager):
 class NetworkManager(NamespaceManager):
     """Groups functions for inserting and querying networks in the database's network store."""
 
+    def __init__(
+        self,
+        *args,
+        universe_cache_size: Optional[int] = None,
+        universe_cache_directory: Optional[str] = None,
+        **kwargs
+    ):
+        """Build the cache of merged graphs used by :meth:`get_universe_by_ids`.
+
+        :param universe_cache_size: The maximum number of merged graphs kept in memory. If None, tries to load from
+         the configuration option ``manager_universe_cache_size``, then defaults to
+         :data:`DEFAULT_UNIVERSE_CACHE_SIZE`.
+        :param universe_cache_directory: The directory where merged graphs are stored so other processes can read
+         them. If None, they're only kept in memory.
+        """
+        super(NetworkManager, self).__init__(*args, **kwargs)
+
+        if universe_cache_size is None:
+            universe_cache_size = int(config.get('manager_universe_cache_size', DEFAULT_UNIVERSE_CACHE_SIZE))
+
+        #: A cache from the identifiers and creation times of networks to the union of their graphs
+        self.universe_cache = ObjectCache(universe_cache_size)
+        # Guards the cache when graphs are looked up from several threads, like by :class:`AsyncManager`
+        self._universe_cache_lock = threading.Lock()
+        self.universe_cache_directory = universe_cache_directory
+
     def count_networks(self) -> int:
         """Count the networks in the database."""
         return self._count_model(Network)
@@ -408,45 +601,183 @@ class NetworkManager(NamespaceManager):
         """Check if there exists a network with the name/version combination in the database."""
         return self.session.query(exists().where(and_(Network.name == name, Network.version == version))).scalar()
 
-    def drop_networks(self) -> None:
-        """Drop all networks."""
-        for network in self.session.query(Network).all():
-            self.drop_network(network)
+    def drop_networks(self, chunk_size: Optional[int] = None) -> DropSummary:
+        """Drop all networks, while also cleaning up the edges, nodes, and evidences that aren't used anymore."""
+        network_ids = [network_id for network_id, in self.session.query(Network.id)]
+        return self.drop_networks_by_ids(network_ids, chunk_size=chunk_size)
 
-    def drop_network_by_id(self, network_id: int) -> None:
+    def drop_network_by_id(self, network_id: int) -> DropSummary:
         """Drop a network by its database identifier."""
-        network = self.session.query(Network).get(network_id)
-        self.drop_network(network)
+        return self.drop_networks_by_ids([network_id])
 
-    def drop_network(self, network: Network) -> None:
+    def drop_network(self, network: Network) -> DropSummary:
         """Drop a network, while also cleaning up any edges that are no longer part of any network."""
-        # get the IDs of the edges that will be orphaned by deleting this network
-        # FIXME: this list could be a problem if it becomes very large; possible optimization is a temporary table in DB
-        edge_ids = [result.edge_id for result in self.query_singleton_edges_from_network(network)]
+        return self.drop_networks_by_ids([network.id])
 
-        # delete the network-to-node mappings for this network
-        self.session.query(network_node).filter(network_node.c.network_id == network.id).delete(
-            synchronize_session=False,
-        )
+    def drop_networks_by_ids(self, network_ids: Iterable[int], chunk_size: Optional[int] = None) -> DropSummary:
+        """Drop networks, while also cleaning up the edges, nodes, and evidences that aren't used anymore, in bulk.
 
-        # delete the edge-to-annotation mappings for the to-be-orphaned edges
-        self.session.query(edge_annotation).filter(edge_annotation.c.edge_id.in_(edge_ids)).delete(
-            synchronize_session=False,
-        )
+        The networks' links to their edges and nodes are deleted in chunks with set-based statements, committing after
+        each so the database isn't locked for long, then the networks themselves are deleted. After that, their edges
+        that aren't part of other networks are deleted with their annotations, then their nodes that aren't part of
+        other networks or edges, then the evidences that aren't used by other edges. Citations and authors are kept.
+
+        If this is interrupted, calling it again finishes dropping the networks, and :meth:`prune` deletes the rows
+        that weren't cleaned up.
+
+        :param network_ids: The database identifiers of the networks
+        :param chunk_size: The number of rows deleted at a time. Defaults to :data:`DEFAULT_DELETE_CHUNK_SIZE`.
+        :returns: The numbers of networks, edges, nodes, and evidences that were deleted
+        """
+        chunk_size = chunk_size or DEFAULT_DELETE_CHUNK_SIZE
+        network_ids = sorted(set(network_ids))
+        t = time.time()
 
-        # delete the edge-to-network mappings for this network
-        self.session.query(network_edge).filter(network_edge.c.network_id == network.id).delete(
-            synchronize_session=False,
+        edge_ids = self._select_network_links(network_edge.c.edge_id, network_ids)
+        node_ids = self._select_network_links(network_node.c.node_id, network_ids)
+
+        for table, column, ids in ((network_edge, network_edge.c.edge_id, edge_ids),
+                                   (network_node, network_node.c.node_id, node_ids)):
+            for batch in chunked(ids, chunk_size):
+                self.session.execute(table.delete().where(and_(
+                    table.c.network_id.in_(network_ids),
+                    column.in_(batch),
+                )))
+                self.session.commit()
+
+        networks = 0
+        network_table = Network.__table__
+        for batch in chunked(network_ids, chunk_size):
+            networks += self.session.execute(network_table.delete().where(network_table.c.id.in_(batch))).rowcount
+        self.session.commit()
+        self._expunge_deleted(Network, network_ids)
+
+        for network_id in network_ids:
+            self._evict_universes(network_id)
+
+        rv = DropSummary(networks, *self._drop_orphans(edge_ids=edge_ids, node_ids=node_ids, chunk_size=chunk_size))
+        logger.info('dropped %s in %.2f seconds', rv, time.time() - t)
+        return rv
+
+    def prune(self, chunk_size: Optional[int] = None) -> DropSummary:
+        """Delete the edges that aren't part of any network, then the nodes and evidences that aren't used anymore.
+
+        :param chunk_size: The number of rows deleted at a time. Defaults to :data:`DEFAULT_DELETE_CHUNK_SIZE`.
+        :returns: The numbers of edges, nodes, and evidences that were deleted
+        """
+        t = time.time()
+        rv = DropSummary(0, *self._drop_orphans(chunk_size=chunk_size or DEFAULT_DELETE_CHUNK_SIZE))
+        logger.info('pruned %s in %.2f seconds', rv, time.time() - t)
+        return rv
+
+    def _select_network_links(self, column, network_ids: List[int]) -> List[int]:
+        """Get the identifiers of the edges or nodes linked to the given networks."""
+        rv = set()
+        for batch in chunked(network_ids, DEFAULT_IN_CLAUSE_SIZE):
+            query = sqlalchemy.select([column]).where(column.table.c.network_id.in_(batch))
+            rv.update(row_id for row_id, in self.session.execute(query))
+        return sorted(rv)
+
+    def _drop_orphans(
+        self,
+        chunk_size: int,
+        edge_ids: Optional[Iterable[int]] = None,
+        node_ids: Optional[Iterable[int]] = None,
+    ) -> Tuple[int, int, int]:
+        """Delete the edges that aren't part of a network, then the nodes and evidences that aren't used anymore.
+
+        :param chunk_size: The number of rows deleted at a time
+        :param edge_ids: The identifiers of the edges to check. If None, checks all of them.
+        :param node_ids: The identifiers of the nodes to check. If None, checks all of them.
+        :returns: The numbers of edges, nodes, and evidences that were deleted
+        """
+        edge_table, node_table = Edge.__table__, Node.__table__
+        evidence_ids = None if edge_ids is None else set()
+
+        def _delete_edge_annotations(batch: List[int]) -> None:
+            if evidence_ids is not None:
+                query = sqlalchemy.select([edge_table.c.evidence_id]).where(edge_table.c.id.in_(batch))
+                evidence_ids.update(evidence_id for evidence_id, in self.session.execute(query) if evidence_id)
+            self.session.execute(edge_annotation.delete().where(edge_annotation.c.edge_id.in_(batch)))
+
+        edges = self._delete_orphan_rows(
+            Edge,
+            ~exists().where(network_edge.c.edge_id == edge_table.c.id),
+            ids=edge_ids,
+            chunk_size=chunk_size,
+            before_delete=_delete_edge_annotations,
+        )
+        nodes = self._delete_orphan_rows(
+            Node,
+            and_(
+                ~exists().where(network_node.c.node_id == node_table.c.id),
+                ~exists().where(edge_table.c.source_id == node_table.c.id),
+                ~exists().where(edge_table.c.target_id == node_table.c.id),
+            ),
+            ids=node_ids,
+            chunk_size=chunk_size,
+        )
+        evidences = self._delete_orphan_rows(
+            Evidence,
+            ~exists().where(edge_table.c.evidence_id == Evidence.__table__.c.id),
+            ids=evidence_ids,
+            chunk_size=chunk_size,
         )
+        return edges, nodes, evidences
 
-        # delete the now-orphaned edges
-        self.session.query(Edge).filter(Edge.id.in_(edge_ids)).delete(synchronize_session=False)
+    def _delete_orphan_rows(
+        self,
+        model: Type[Base],
+        orphan_filter,
+        chunk_size: int,
+        ids: Optional[Iterable[int]] = None,
+        before_delete: Optional[Callable[[List[int]], None]] = None,
+    ) -> int:
+        """Delete the rows of a model's table that match a filter in chunks, committing after each.
+
+        :param model: The model
+        :param orphan_filter: A filter for the rows to delete
+        :param chunk_size: The number of rows deleted at a time
+        :param ids: The identifiers of the rows to check. If None, checks all of them in order of their identifiers.
+        :param before_delete: A function called with the identifiers of each chunk of rows before they're deleted
+        :returns: The number of rows that were deleted
+        """
+        table = model.__table__
+        select_orphans = sqlalchemy.select([table.c.id]).where(orphan_filter)
 
-        # delete the network
-        self.session.query(Network).filter(Network.id == network.id).delete(synchronize_session=False)
+        def _iterate_orphan_ids() -> Iterable[List[int]]:
+            if ids is not None:
+                for batch in chunked(sorted(ids), chunk_size):
+                    yield [row_id for row_id, in self.session.execute(select_orphans.where(table.c.id.in_(batch)))]
+                return
 
-        # commit it!
-        self.session.commit()
+            # The orphans in each chunk are deleted before the next is selected, so this pages by identifier
+            after = 0
+            while True:
+                query = select_orphans.where(table.c.id > after).order_by(table.c.id).limit(chunk_size)
+                batch = [row_id for row_id, in self.session.execute(query)]
+                if not batch:
+                    return
+                after = batch[-1]
+                yield batch
+
+        rv = 0
+        for orphan_ids in _iterate_orphan_ids():
+            if not orphan_ids:
+                continue
+            if before_delete is not None:
+                before_delete(orphan_ids)
+            rv += self.session.execute(table.delete().where(table.c.id.in_(orphan_ids))).rowcount
+            self.session.commit()
+            self._expunge_deleted(model, orphan_ids)
+        return rv
+
+    def _expunge_deleted(self, model: Type[Base], ids: Iterable[int]) -> None:
+        """Remove the models that were deleted in bulk from the session, so their identifiers can be reused."""
+        for row_id in ids:
+            instance = self.session.identity_map.get(identity_key(model, row_id))
+            if instance is not None:
+                self.session.expunge(instance)
 
     def query_singleton_edges_from_network(self, network: Network) -> sqlalchemy.orm.query.Query:
         """Return a query selecting all edge ids that only belong to the given network."""
@@ -549,30 +880,187 @@ class NetworkManager(NamespaceManager):
 
         return rv
 
+    def get_universe_by_ids(self, network_ids: Iterable[int]) -> BELGraph:
+        """Get the union of the graphs for the given network identifiers, reusing it for later calls if possible.
+
+        Merged graphs are kept in :attr:`universe_cache` by the identifiers and creation times of their networks,
+        so a network that's dropped then inserted again, even if it gets the same identifier, never gives a stale
+        graph. If :attr:`universe_cache_directory` is set, they're also stored there so other processes don't have to
+        build them again.
+
+        The same graph is returned every time, so it must not be modified. Use :meth:`get_graph_by_ids` for a graph
+        that can be.
+        """
+        key = self._get_universe_key(network_ids)
+        if key is None:  # some of the networks don't exist, so let get_graph_by_ids fail the same way as before
+            return self.get_graph_by_ids(list(network_ids))
+
+        with self._universe_cache_lock:
+            rv = self.universe_cache.get(key)
+        if rv is not None:
+            logger.debug('using cached universe for networks: %s', key)
+            return rv
+
+        path = self._get_universe_path(key)
+        if path is not None and os.path.exists(path):
+            logger.debug('reading universe for networks %s from %s', key, path)
+            with open(path, 'rb') as file:
+                rv = from_blob(file.read(), CHUNKED_PICKLE_GZIP)
+        else:
+            rv = self.get_graph_by_ids([network_id for network_id, _ in key])
+            if path is not None:
+                self._write_universe(path, rv)
+
+        with self._universe_cache_lock:
+            self.universe_cache[key] = rv
+        return rv
+
+    def _get_universe_key(self, network_ids: Iterable[int]) -> Optional[Tuple[Tuple[int, str], ...]]:
+        """Get the sorted identifiers and creation times of the given networks, or None if any are missing."""
+        network_ids = set(network_ids)
+        rv = tuple(
+            (network_id, created.isoformat())
+            for network_id, created in (
+                self.session
+                    .query(Network.id, Network.created)
+                    .filter(Network.id_in(network_ids))
+                    .order_by(Network.id)
+            )
+        )
+        if len(rv) != len(network_ids):
+            return
+        return rv
+
+    def _get_universe_path(self, key: Tuple[Tuple[int, str], ...]) -> Optional[str]:
+        if self.universe_cache_directory is None:
+            return
+        name = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.universe_cache_directory, '{}.universe'.format(name))
+
+    def _write_universe(self, path: str, graph: BELGraph) -> None:
+        """Write a merged graph to a temporary file that's moved into place, so other processes never see part of it."""
+        blob, _ = to_blob(graph, CHUNKED_PICKLE_GZIP)
+        os.makedirs(self.universe_cache_directory, exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(dir=self.universe_cache_directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(blob)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def _evict_universes(self, network_id: int) -> None:
+        """Remove the merged graphs that include the given network from memory and from the cache directory."""
+        with self._universe_cache_lock:
+            keys = [
+                key
+                for key in self.universe_cache.keys()
+                if any(network_id == key_network_id for key_network_id, _ in key)
+            ]
+            for key in keys:
+                del self.universe_cache[key]
+        for key in keys:
+            path = self._get_universe_path(key)
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+    def clear_universe_cache(self) -> None:
+        """Clear the merged graphs from memory and from the cache directory."""
+        with self._universe_cache_lock:
+            self.universe_cache.cache_clear()
+        if self.universe_cache_directory is None or not os.path.isdir(self.universe_cache_directory):
+            return
+        for name in os.listdir(self.universe_cache_directory):
+            if name.endswith('.universe'):
+                os.remove(os.path.join(self.universe_cache_directory, name))
+
 
 class InsertManager(NamespaceManager, LookupManager):
     """Manages inserting data into the edge store."""
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, object_cache_size: Optional[int] = None, **kwargs):
+        """Build the caches of the models that have been looked up or created.
+
+        :param object_cache_size: The maximum number of models in each cache. If None, tries to load from the
+         configuration option ``manager_object_cache_size``, then defaults to
+         :data:`DEFAULT_OBJECT_CACHE_SIZE`.
+        """
         super(InsertManager, self).__init__(*args, **kwargs)
 
+        if object_cache_size is None:
+            object_cache_size = int(config.get('manager_object_cache_size', DEFAULT_OBJECT_CACHE_SIZE))
+
         # A set of dictionaries that contains objects of the type described by the key
         self.object_cache_modification = {}
         self.object_cache_property = {}
-        self.object_cache_node = {}
-        self.object_cache_edge = {}
-        self.object_cache_evidence = {}
-        self.curie_to_citation = {}
-        self.object_cache_author = {}
+        self.object_cache_node = ObjectCache(object_cache_size)
+        self.object_cache_edge = ObjectCache(object_cache_size)
+        self.object_cache_evidence = ObjectCache(object_cache_size)
+        self.curie_to_citation = ObjectCache(object_cache_size)
+        self.object_cache_author = ObjectCache(object_cache_size)
+
+        # Models that were added in a transaction that's rolled back aren't in the database anymore
+        sqlalchemy.event.listen(self.session, 'after_soft_rollback', self._evict_transient_objects)
+
+    def _get_object_caches(self) -> Mapping[str, ObjectCache]:
+        return {
+            'node': self.object_cache_node,
+            'edge': self.object_cache_edge,
+            'evidence': self.object_cache_evidence,
+            'citation': self.curie_to_citation,
+            'author': self.object_cache_author,
+        }
+
+    def cache_info(self) -> Mapping[str, ObjectCacheInfo]:
+        """Get the hits, misses, maximum size, and current size of each of the caches."""
+        return {
+            name: cache.cache_info()
+            for name, cache in self._get_object_caches().items()
+        }
+
+    def clear_caches(self) -> None:
+        """Clear the caches and their statistics."""
+        for cache in self._get_object_caches().values():
+            cache.cache_clear()
+
+    def _drop_orphans(self, *args, **kwargs) -> Tuple[int, int, int]:
+        """Delete the edges, nodes, and evidences that aren't used anymore, then forget the cached ones."""
+        rv = super()._drop_orphans(*args, **kwargs)
+        if any(rv):
+            for cache in (self.object_cache_edge, self.object_cache_node, self.object_cache_evidence):
+                cache.clear()
+        return rv
+
+    def _evict_transient_objects(self, session, previous_transaction) -> None:
+        """Remove the models from the caches that were expunged from the session when its transaction rolled back."""
+        for cache in self._get_object_caches().values():
+            transient_keys = [
+                key
+                for key, model in cache.items()
+                if sqlalchemy.inspect(model).transient
+            ]
+            for key in transient_keys:
+                del cache[key]
 
     def insert_graph(
         self,
         graph: BELGraph,
         use_tqdm: bool = True,
         tqdm_kwargs: Optional[Mapping[str, Any]] = None,
+        edges: Optional[Iterable[Tuple[BaseEntity, BaseEntity, str, EdgeData]]] = None,
+        batch_size: int = 1000,
     ) -> Network:
         """Insert a graph in the database and returns the corresponding Network model.
 
+        :param graph: A BEL graph
+        :param use_tqdm: Should progress bars be shown?
+        :param tqdm_kwargs: Keywords to pass to ``tqdm``
+        :param edges: If given, insert these ``(u, v, key, data)`` edges instead of the graph's, e.g., as they're
+         streamed from :func:`pybel.io.line_utils.iterate_lines`. The graph is still used for the metadata and
+         terminologies. The edges are stored in batches so they don't all have to be in memory. The network's blob
+         is written from the same batches with :class:`pybel.manager.blob.ChunkedBlobWriter`.
+        :param batch_size: The number of streamed edges to store at a time
         :raises: pybel.resources.exc.ResourceError
         """
         if not graph.name:
@@ -608,129 +1096,383 @@ class InsertManager(NamespaceManager, LookupManager):
             if key in METADATA_INSERT_KEYS
         })
 
-        network.store_bel(graph)
+        if edges is None:
+            network.store_bel(graph)
+        self.session.add(network)
+        self.session.flush()
 
-        network.nodes, network.edges = self._store_graph_parts(graph, use_tqdm=use_tqdm)
+        if edges is None:
+            self._store_graph_parts(network, graph, use_tqdm=use_tqdm)
+        else:
+            self._store_edge_stream(network, graph, edges, batch_size=batch_size, use_tqdm=use_tqdm)
 
-        self.session.add(network)
         self.session.commit()
 
         logger.info('inserted %s v%s in %.2f seconds', graph.name, graph.version, time.time() - t)
 
         return network
 
-    def _store_graph_parts(self, graph: BELGraph, use_tqdm: bool = False) -> Tuple[List[Node], List[Edge]]:
-        """Store the given graph into the edge store.
+    def _store_graph_parts(self, network: Network, graph: BELGraph, use_tqdm: bool = False) -> None:
+        """Store the nodes and edges of the given graph in the edge store and add them to the network.
+
+        The network must already have been flushed so it has an identifier.
 
         :raises: pybel.resources.exc.ResourceError
         :raises: EdgeAddError
         """
         logger.debug('inserting %s into edge store', graph)
-        logger.debug('building node models')
-        node_model_build_start = time.time()
+        t = time.time()
 
-        nodes = list(graph)
+        edges = graph.edges(keys=True, data=True)
         if use_tqdm:
-            nodes = tqdm(nodes, total=graph.number_of_nodes(), desc='nodes')
-
-        node_model = {}
-        for node in nodes:
-            node_object = self.get_or_create_node(graph, node)
-
-            if node_object is None:
-                logger.warning('can not add node %s', node)
-                continue
+            edges = tqdm(edges, total=graph.number_of_edges(), desc='edges')
 
-            node_model[node] = node_object
+        node_ids, edge_ids = self._bulk_store_parts(graph, graph, edges)
+        self._bulk_insert_network_links(network, node_ids.values(), edge_ids.values())
 
-        node_models = list(node_model.values())
-        logger.debug('built %d node models in %.2f seconds', len(node_models), time.time() - node_model_build_start)
+        logger.debug('stored %d nodes and %d edges in %.2f seconds', len(node_ids), len(edge_ids), time.time() - t)
 
-        node_model_commit_start = time.time()
-        self.session.add_all(node_models)
-        self.session.commit()
-        logger.debug('stored %d node models in %.2f seconds', len(node_models), time.time() - node_model_commit_start)
+    def _store_edge_stream(
+        self,
+        network: Network,
+        graph: BELGraph,
+        edges: Iterable[Tuple[BaseEntity, BaseEntity, str, EdgeData]],
+        batch_size: int,
+        use_tqdm: bool = False,
+    ) -> None:
+        """Store a stream of edges in batches and add them and their nodes to the network, then write its blob.
 
-        logger.debug('building edge models')
-        edge_model_build_start = time.time()
+        Only the identifiers of the nodes and edges already in the network are kept between batches.
 
-        edges = graph.edges(keys=True, data=True)
+        :raises: pybel.resources.exc.ResourceError
+        :raises: EdgeAddError
+        """
+        logger.debug('inserting stream of edges from %s into edge store', graph)
         if use_tqdm:
-            edges = tqdm(edges, total=graph.number_of_edges(), desc='edges')
-
-        edge_models = list(self._get_edge_models(graph, node_model, edges))
+            edges = tqdm(edges, desc='edges', unit_scale=True)
+
+        network_node_ids, network_edge_ids = set(), set()
+        blob_writer = ChunkedBlobWriter()
+        for batch in chunked(edges, batch_size):
+            nodes = {node: None for u, v, _, _ in batch for node in (u, v)}
+            node_ids, edge_ids = self._bulk_store_parts(graph, nodes, batch)
+            node_ids = set(node_ids.values()) - network_node_ids
+            edge_ids = set(edge_ids.values()) - network_edge_ids
+            self._bulk_insert_network_links(network, node_ids, edge_ids)
+            network_node_ids.update(node_ids)
+            network_edge_ids.update(edge_ids)
+            blob_writer.add_edges(batch)
+
+        # The warnings from the stream are only in the graph once it's been consumed
+        network.blob, network.blob_codec = blob_writer.to_blob(graph)
+
+        logger.debug('stored %d nodes and %d edges', len(network_node_ids), len(network_edge_ids))
+
+    def _bulk_store_parts(
+        self,
+        graph: BELGraph,
+        nodes: Iterable[BaseEntity],
+        edges: Iterable[Tuple[BaseEntity, BaseEntity, str, EdgeData]],
+    ) -> Tuple[Mapping[str, int], Mapping[str, int]]:
+        """Store nodes and edges that aren't in the database yet with bulk queries.
 
-        logger.debug('built %d edge models in %.2f seconds', len(edge_models), time.time() - edge_model_build_start)
+        1. The rows that already exist are looked up by their hashes with one ``IN`` query per chunk
+        2. The missing rows are inserted with SQLAlchemy Core using ``executemany``
+        3. The identifiers of the new rows are looked up the same way as the existing ones
 
-        edge_model_commit_start = time.time()
-        self.session.add_all(edge_models)
-        self.session.commit()
-        logger.debug('stored %d edge models in %.2f seconds', len(edge_models), time.time() - edge_model_commit_start)
+        This is done in turn for nodes, citations, evidences, then edges and their annotations.
 
-        return node_models, edge_models
+        :returns: Dictionaries from the hashes of the stored nodes and edges to their identifiers
+        :raises: EdgeAddError
+        """
+        node_ids = self._bulk_ensure_nodes(graph, nodes)
 
-    def _get_edge_models(
-        self,
-        graph: BELGraph,
-        tuple_model: Mapping[BaseEntity, Node],
-        edges,
-    ) -> Iterable[Edge]:
+        edge_rows = {}
         for u, v, key, data in edges:
-            source = tuple_model.get(u)
-            if source is None or source.md5 not in self.object_cache_node:
+            if key in edge_rows:
+                continue
+
+            source_id = node_ids.get(u.md5)
+            if source_id is None:
                 logger.warning('skipping uncached source node: %s', u)
                 continue
 
-            target = tuple_model.get(v)
-            if target is None or target.md5 not in self.object_cache_node:
+            target_id = node_ids.get(v.md5)
+            if target_id is None:
                 logger.warning('skipping uncached target node: %s', v)
                 continue
 
-            relation = data[RELATION]
+            if data[RELATION] not in UNQUALIFIED_EDGES and _get_evidence_key(data) is None:
+                continue
 
-            if relation in UNQUALIFIED_EDGES:
-                try:
-                    edge = self._add_unqualified_edge(
-                        source=source,
-                        target=target,
-                        bel=graph.edge_to_bel(u, v, data),
-                        key=key,
-                        data=data,
-                    )
-                    if edge is None:
-                        continue
-                except Exception as e:
-                    self.session.rollback()
-                    logger.exception('error storing edge in database. edge data: %s', data)
-                    raise EdgeAddError(e, u, v, key, data) from e
-                else:
-                    yield edge
+            try:
+                bel = graph.edge_to_bel(u, v, data)
+            except Exception as e:
+                self.session.rollback()
+                logger.exception('error storing edge in database. edge data: %s', data)
+                raise EdgeAddError(e, u, v, key, data) from e
+
+            edge_rows[key] = u, v, dict(
+                source_id=source_id,
+                source_modifier=data.get(SOURCE_MODIFIER),
+                target_id=target_id,
+                target_modifier=data.get(TARGET_MODIFIER),
+                relation=data[RELATION],
+                bel=bel,
+                md5=key,
+                data=data,
+                evidence_id=None,
+            )
+
+        edge_ids = self._select_ids(Edge.__table__.c.md5, edge_rows)
+        new_edges = {
+            key: value
+            for key, value in edge_rows.items()
+            if key not in edge_ids
+        }
+        if not new_edges:
+            return node_ids, edge_ids
 
-            elif EVIDENCE not in data or CITATION not in data:
+        qualified_rows = [
+            row
+            for _, _, row in new_edges.values()
+            if row['relation'] not in UNQUALIFIED_EDGES
+        ]
+        evidence_ids = self._bulk_ensure_evidences({_get_evidence_key(row['data']) for row in qualified_rows})
+        for row in qualified_rows:
+            row['evidence_id'] = evidence_ids[_get_evidence_key(row['data'])]
+
+        url_to_names = defaultdict(set)
+        key_to_annotations = {}
+        for key, (u, v, row) in new_edges.items():
+            data = row['data']
+            if row['relation'] in UNQUALIFIED_EDGES or not data.get(ANNOTATIONS):
+                continue
+            try:
+                annotations = key_to_annotations[key] = list(self._iter_from_annotations_dict(graph, data[ANNOTATIONS]))
+            except Exception as e:
+                self.session.rollback()
+                logger.exception('error storing edge in database. edge data: %s', data)
+                raise EdgeAddError(e, u, v, key, data) from e
+            for url, names in annotations:
+                url_to_names[url].update(names)
+
+        self._bulk_insert(Edge.__table__, [row for _, _, row in new_edges.values()])
+        new_edge_ids = self._select_ids(Edge.__table__.c.md5, new_edges)
+        edge_ids.update(new_edge_ids)
+
+        entry_ids = self._select_entry_ids(url_to_names)
+        self._bulk_insert(edge_annotation, [
+            dict(edge_id=new_edge_ids[key], name_id=entry_ids[url, name])
+            for key, annotations in key_to_annotations.items()
+            for url, names in annotations
+            for name in names
+            if (url, name) in entry_ids
+        ])
+
+        return node_ids, edge_ids
+
+    def _bulk_ensure_nodes(self, graph: BELGraph, nodes: Iterable[BaseEntity]) -> Dict[str, int]:
+        """Insert the nodes that aren't in the database yet and return a dictionary from their hashes to identifiers.
+
+        Nodes whose names can't be found in their namespaces are skipped.
+        """
+        hash_to_node = {node.md5: node for node in nodes}
+        node_ids = self._select_ids(Node.__table__.c.md5, hash_to_node)
+        missing_nodes = [node for node_hash, node in hash_to_node.items() if node_hash not in node_ids]
+
+        url_to_names = defaultdict(set)
+        keyword_to_concepts = defaultdict(dict)
+        for node in missing_nodes:
+            if not isinstance(node, BaseConcept):
                 continue
+            if node.namespace in graph.namespace_url:
+                url_to_names[graph.namespace_url[node.namespace]].add(node.name)
+            elif node.namespace in graph.namespace_pattern:
+                keyword_to_concepts[node.namespace][node.name] = node.identifier
+        entry_ids = self._select_entry_ids(url_to_names)
+        regex_entry_ids = {
+            (keyword, name): entry_id
+            for keyword, name_to_identifier in keyword_to_concepts.items()
+            for name, entry_id in self._ensure_regex_entry_ids(
+                keyword, graph.namespace_pattern[keyword], name_to_identifier,
+            ).items()
+        }
 
-            elif NAMESPACE not in data[CITATION] or IDENTIFIER not in data[CITATION]:
+        rows = []
+        for node in missing_nodes:
+            row = dict(type=node.function, bel=node.as_bel(), md5=node.md5, data=node, namespace_entry_id=None)
+            if not isinstance(node, BaseConcept):
+                rows.append(row)
                 continue
 
+            if node.namespace in graph.namespace_url:
+                url = graph.namespace_url[node.namespace]
+                entry_id = entry_ids.get((url, node.name))
+                if entry_id is None:
+                    logger.warning('can not add node %s. skipping name missing from %s', node, url)
+                    continue
+                row['namespace_entry_id'] = entry_id
+
+            elif node.namespace in graph.namespace_pattern:
+                row['namespace_entry_id'] = regex_entry_ids[node.namespace, node.name]
+
             else:
-                try:
-                    bel = graph.edge_to_bel(u, v, data)
-                    edge = self._add_qualified_edge(
-                        graph=graph,
-                        source=source,
-                        target=target,
-                        key=key,
-                        bel=bel,
-                        data=data,
-                    )
-                    if edge is None:
-                        continue
-                except Exception as e:
-                    self.session.rollback()
-                    logger.exception('error storing edge in database. edge data: %s', data)
-                    raise EdgeAddError(e, u, v, key, data) from e
-                else:
-                    yield edge
+                logger.warning('can not add node %s. no reference in BELGraph for namespace: %s', node, node.namespace)
+                continue
+
+            rows.append(row)
+
+        self._bulk_insert(Node.__table__, rows)
+        node_ids.update(self._select_ids(Node.__table__.c.md5, [row['md5'] for row in rows]))
+        return node_ids
+
+    def _bulk_ensure_evidences(self, evidences: Iterable[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], int]:
+        """Insert the citations and evidences that aren't in the database yet.
+
+        :param evidences: Triples of the citation's namespace, the citation's identifier, and the evidence text
+        :returns: A dictionary from the given triples to the identifiers of their evidences
+        """
+        evidences = set(evidences)
+
+        db_to_db_ids = defaultdict(set)
+        for db, db_id, _ in evidences:
+            db_to_db_ids[db].add(db_id)
+
+        citation_ids = {}
+        for db, db_ids in db_to_db_ids.items():
+            for db_id, citation_id in self._bulk_ensure_citations(db, db_ids).items():
+                citation_ids[db, db_id] = citation_id
+
+        evidence_table = Evidence.__table__
+        wanted = {(citation_ids[db, db_id], text): (db, db_id, text) for db, db_id, text in evidences}
+
+        def _select_evidence_ids(keys) -> Dict[Tuple[int, str], int]:
+            rv = {}
+            for batch in chunked({citation_id for citation_id, _ in keys}, DEFAULT_IN_CLAUSE_SIZE):
+                query = sqlalchemy.select([evidence_table.c.citation_id, evidence_table.c.text, evidence_table.c.id])
+                for citation_id, text, evidence_id in self.session.execute(
+                    query.where(evidence_table.c.citation_id.in_(batch)),
+                ):
+                    if (citation_id, text) in keys:
+                        rv[citation_id, text] = evidence_id
+            return rv
+
+        evidence_ids = _select_evidence_ids(wanted)
+        missing = wanted.keys() - evidence_ids.keys()
+        self._bulk_insert(evidence_table, [
+            dict(citation_id=citation_id, text=text)
+            for citation_id, text in missing
+        ])
+        evidence_ids.update(_select_evidence_ids(missing))
+
+        return {
+            wanted[key]: evidence_id
+            for key, evidence_id in evidence_ids.items()
+        }
+
+    def _bulk_ensure_citations(self, db: str, db_ids: Iterable[str]) -> Dict[str, int]:
+        """Insert the citations that aren't in the database yet.
+
+        :param db: The citations' namespace
+        :param db_ids: The citations' identifiers
+        :returns: A dictionary from the given identifiers to the identifiers of their citations
+        """
+        db_ids = set(db_ids)
+        citation_table = Citation.__table__
+        db_filter = citation_table.c.db == db
+        rv = self._select_ids(citation_table.c.db_id, db_ids, db_filter)
+        missing = db_ids - rv.keys()
+        self._bulk_insert(citation_table, [
+            dict(db=db, db_id=db_id)
+            for db_id in missing
+        ])
+        rv.update(self._select_ids(citation_table.c.db_id, missing, db_filter))
+        return rv
+
+    def _bulk_ensure_authors(self, names: Iterable[str]) -> Dict[str, int]:
+        """Insert the authors that aren't in the database yet.
+
+        :returns: A dictionary from the given names to the identifiers of their authors
+        """
+        names = set(names)
+        author_table = Author.__table__
+        rv = self._select_ids(author_table.c.name, names)
+        missing = names - rv.keys()
+        self._bulk_insert(author_table, [
+            dict(name=name)
+            for name in missing
+        ])
+        rv.update(self._select_ids(author_table.c.name, missing))
+        return rv
+
+    def _select_entry_ids(self, url_to_names: Mapping[str, Set[str]]) -> Dict[Tuple[str, str], int]:
+        """Look up the identifiers of namespace or annotation entries by the URL of their namespace and their names."""
+        if not url_to_names:
+            return {}
+
+        namespace_ids = dict(
+            self.session.query(Namespace.url, Namespace.id).filter(Namespace.url.in_(url_to_names)),
+        )
+
+        entry_table = NamespaceEntry.__table__
+        rv = {}
+        for url, names in url_to_names.items():
+            namespace_id = namespace_ids.get(url)
+            if namespace_id is None:
+                continue
+            name_to_id = self._select_ids(entry_table.c.name, names, entry_table.c.namespace_id == namespace_id)
+            for name, entry_id in name_to_id.items():
+                rv[url, name] = entry_id
+        return rv
+
+    def _ensure_regex_entry_ids(
+        self,
+        keyword: str,
+        pattern: str,
+        name_to_identifier: Mapping[str, Optional[str]],
+    ) -> Dict[str, int]:
+        """Insert the entries for a regular expression namespace that aren't in the database yet.
+
+        :returns: A dictionary from the given names to the identifiers of their entries
+        """
+        namespace = self.ensure_regex_namespace(keyword, pattern)
+        entry_table = NamespaceEntry.__table__
+        namespace_filter = entry_table.c.namespace_id == namespace.id
+        rv = self._select_ids(entry_table.c.name, name_to_identifier, namespace_filter)
+        missing = name_to_identifier.keys() - rv.keys()
+        self._bulk_insert(entry_table, [
+            dict(namespace_id=namespace.id, name=name, identifier=name_to_identifier[name])
+            for name in missing
+        ])
+        rv.update(self._select_ids(entry_table.c.name, missing, namespace_filter))
+        return rv
+
+    def _select_ids(self, column, values: Iterable, *filters) -> Dict[Any, int]:
+        """Look up the identifiers of the rows whose column has one of the given values, with one query per chunk."""
+        table = column.table
+        rv = {}
+        for batch in chunked(values, DEFAULT_IN_CLAUSE_SIZE):
+            query = sqlalchemy.select([column, table.c.id]).where(and_(column.in_(batch), *filters))
+            rv.update(self.session.execute(query).fetchall())
+        return rv
+
+    def _bulk_insert(self, table: sqlalchemy.Table, rows: List[Mapping[str, Any]]) -> None:
+        """Insert rows in batches with SQLAlchemy Core using ``executemany`` in the session's transaction."""
+        insert = table.insert()
+        for batch in chunked(rows, DEFAULT_ENTRY_BATCH_SIZE):
+            self.session.execute(insert, batch)
+
+    def _bulk_insert_network_links(self, network: Network, node_ids: Iterable[int], edge_ids: Iterable[int]) -> None:
+        """Add nodes and edges that aren't already part of the network to it by their identifiers."""
+        self._bulk_insert(network_node, [
+            dict(network_id=network.id, node_id=node_id)
+            for node_id in set(node_ids)
+        ])
+        self._bulk_insert(network_edge, [
+            dict(network_id=network.id, edge_id=edge_id)
+            for edge_id in set(edge_ids)
+        ])
 
     @staticmethod
     def _iter_from_annotations_dict(
@@ -762,51 +1504,11 @@ class InsertManager(NamespaceManager, LookupManager):
                 rv.append(entry)
         return rv
 
-    def _add_qualified_edge(
-        self,
-        graph: BELGraph,
-        source: Node,
-        target: Node,
-        key: str,
-        bel: str,
-        data: EdgeData,
-    ) -> Optional[Edge]:
-        """Add a qualified edge to the network."""
-        citation_dict = data[CITATION]
-        citation = self.get_or_create_citation(
-            namespace=citation_dict[NAMESPACE],
-            identifier=citation_dict[IDENTIFIER],
-        )
-        evidence = self.get_or_create_evidence(citation, data[EVIDENCE])
-        annotations = self._get_annotation_entries_from_data(graph, data)
-
-        return self.get_or_create_edge(
-            source=source,
-            target=target,
-            relation=data[RELATION],
-            bel=bel,
-            md5=key,
-            data=data,
-            evidence=evidence,
-            annotations=annotations,
-        )
-
-    def _add_unqualified_edge(self, source: Node, target: Node, key: str, bel: str, data: EdgeData) -> Edge:
-        """Add an unqualified edge to the network."""
-        return self.get_or_create_edge(
-            source=source,
-            target=target,
-            relation=data[RELATION],
-            bel=bel,
-            md5=key,
-            data=data,
-        )
-
     def get_or_create_evidence(self, citation: Citation, text: str) -> Evidence:
         """Create an entry and object for given evidence if it does not exist."""
         evidence_tuple = citation.db, citation.db_id, text
-        if evidence_tuple in self.object_cache_evidence:
-            evidence = self.object_cache_evidence[evidence_tuple]
+        evidence = self.object_cache_evidence.get(evidence_tuple)
+        if evidence is not None:
             self.session.add(evidence)
             return evidence
 
@@ -826,8 +1528,9 @@ class InsertManager(NamespaceManager, LookupManager):
     def get_or_create_node(self, graph: BELGraph, node: BaseEntity) -> Optional[Node]:
         """Create an entry and object for given node if it does not exist."""
         node_md5 = node.md5
-        if node_md5 in self.object_cache_node:
-            return self.object_cache_node[node_md5]
+        node_model = self.object_cache_node.get(node_md5)
+        if node_model is not None:
+            return node_model
 
         node_model = self.get_node_by_hash(node_md5)
         if node_model is not None:
@@ -909,8 +1612,8 @@ class InsertManager(NamespaceManager, LookupManager):
         :param evidence: Evidence object that proves the given relation
         :param annotations: List of all annotations that belong to the edge
         """
-        if md5 in self.object_cache_edge:
-            edge = self.object_cache_edge[md5]
+        edge = self.object_cache_edge.get(md5)
+        if edge is not None:
             self.session.add(edge)
             return edge
 
@@ -955,8 +1658,8 @@ class InsertManager(NamespaceManager, LookupManager):
             namespace = CITATION_TYPE_PUBMED
 
         citation_curie = f'{namespace}:{identifier}'
-        if citation_curie in self.curie_to_citation:
-            citation = self.curie_to_citation[citation_curie]
+        citation = self.curie_to_citation.get(citation_curie)
+        if citation is not None:
             self.session.add(citation)
             return citation
 
@@ -1009,6 +1712,10 @@ class Manager(_Manager):
         connection: Optional[str] = None,
         engine=None,
         session=None,
+        term_index_directory: Optional[str] = None,
+        object_cache_size: Optional[int] = None,
+        universe_cache_size: Optional[int] = None,
+        universe_cache_directory: Optional[str] = None,
         **kwargs
     ) -> None:
         """Create a connection to database and a persistent session using SQLAlchemy.
@@ -1031,7 +1738,25 @@ class Manager(_Manager):
          value for ``PYBEL_CONNECTION`` defaults to :data:`pybel.constants.DEFAULT_CACHE_LOCATION`.
         :param engine: Optional engine to use. Must be specified with a session and no connection.
         :param session: Optional session to use. Must be specified with an engine and no connection.
+        :param term_index_directory: The directory where memory-mapped namespace term indexes are stored. If
+         ``None``, tries to load from the environment variable ``PYBEL_TERM_INDEX_DIRECTORY`` then from the
+         config file. If neither are set, term indexes aren't used.
+        :param object_cache_size: The maximum number of models kept in each of the caches used while inserting
+         graphs. See :meth:`InsertManager.cache_info`.
+        :param universe_cache_size: The maximum number of merged graphs kept in memory by
+         :meth:`NetworkManager.get_universe_by_ids`
+        :param universe_cache_directory: The directory where merged graphs are stored between processes. If ``None``,
+         tries to load from the environment variable ``PYBEL_UNIVERSE_CACHE_DIRECTORY`` then from the config file. If
+         neither are set, they're only kept in memory.
         :param bool echo: Turn on echoing sql
+        :param Optional[int] pool_size: The number of connections kept open in the pool.
+         See :func:`pybel.manager.build_engine_session` for this and the other connection pool options,
+         ``max_overflow``, ``pool_timeout``, ``pool_recycle``, and ``pool_pre_ping``.
+        :param Optional[str] sqlite_journal_mode: SQLite's ``journal_mode`` pragma. Defaults to ``WAL``.
+         See :func:`pybel.manager.build_engine_session` for this and the other SQLite pragmas,
+         ``sqlite_synchronous``, ``sqlite_cache_size``, and ``sqlite_mmap_size``.
+        :param Optional[str] executemany_mode: psycopg2's ``executemany`` mode for PostgreSQL. Defaults to
+         ``values``.
         :param Optional[bool] autoflush: Defaults to True if not specified in kwargs or configuration.
         :param Optional[bool] autocommit: Defaults to False if not specified in kwargs or configuration.
         :param Optional[bool] expire_on_commit: Defaults to False if not specified in kwargs or configuration.
@@ -1087,5 +1812,12 @@ class Manager(_Manager):
         elif kwargs:
             raise ValueError('keyword arguments should not be used with engine/session')
 
-        super().__init__(engine=engine, session=session)
+        super().__init__(
+            engine=engine,
+            session=session,
+            object_cache_size=object_cache_size,
+            universe_cache_size=universe_cache_size,
+            universe_cache_directory=universe_cache_directory or default_universe_cache_directory,
+        )
+        self.term_index_directory = term_index_directory or default_term_index_directory
         self.create_all()
@@ -2,28 +2,63 @@
 
 """Citation utilities for the database manager."""
 
+import json
 import logging
+import math
+import os
 import re
+import sqlite3
+import threading
 import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from itertools import zip_longest
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
 
 import requests
+import sqlalchemy
+from more_itertools import chunked
+from sqlalchemy.orm import joinedload, selectinload
 
+from .models import Citation, author_citation
+from ..config import config, pubmed_cache_directory as default_pubmed_cache_directory
 from ..constants import CITATION, CITATION_TYPE_PUBMED, IDENTIFIER
 from ..struct.filters import filter_edges
 from ..struct.filters.edge_predicates import has_pubmed
 from ..struct.summary.provenance import get_pubmed_identifiers
 
 __all__ = [
+    'TokenBucket',
+    'PubMedCache',
+    'bulk_enrich_citations',
     'get_citations_by_pmids',
     'enrich_pubmed_citations',
 ]
 
 logger = logging.getLogger(__name__)
 
-EUTILS_URL_FMT = "http://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi?db=pubmed&retmode=json&id={}"
+#: The URL of the PubMed E-Utils summary service. Can be set with the configuration option ``eutils_url``.
+EUTILS_URL = config.get('eutils_url', 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi')
+
+#: The NCBI API key sent with requests to E-Utils. Can be set with the configuration option ``ncbi_api_key``.
+NCBI_API_KEY = config.get('ncbi_api_key')
+
+#: The number of requests per second NCBI allows without an API key
+NCBI_RATE = 3
+#: The number of requests per second NCBI allows with an API key
+NCBI_API_KEY_RATE = 10
+
+#: The number of PubMed identifiers looked up in each request to E-Utils
+DEFAULT_PUBMED_GROUP_SIZE = 200
+#: The number of requests to E-Utils that can be in flight at once. Can be set with the configuration option
+#: ``pubmed_workers``.
+DEFAULT_PUBMED_WORKERS = int(config.get('pubmed_workers', 3))
+#: The number of times a request to E-Utils is tried again after it's rate limited or the server fails
+DEFAULT_PUBMED_RETRIES = 3
+
+#: The HTTP status codes of E-Utils responses that are worth trying again
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
 
 re1 = re.compile(r'^[12][0-9]{3} [a-zA-Z]{3} \d{1,2}$')
 re2 = re.compile(r'^[12][0-9]{3} [a-zA-Z]{3}$')
@@ -81,130 +116,394 @@ def clean_pubmed_identifiers(pmids: Iterable[str]) -> List[str]:
     return sorted({str(pmid).strip() for pmid in pmids})
 
 
-def get_pubmed_citation_response(pubmed_identifiers: Iterable[str]):
-    """Get the response from PubMed E-Utils for a given list of PubMed identifiers.
+class TokenBucket:
+    """A thread-safe token bucket that limits how often something happens.
 
-    :param pubmed_identifiers:
-    :rtype: dict
+    The bucket fills with ``rate`` tokens per second, up to ``capacity``. :meth:`acquire` takes a token, waiting for
+    one if the bucket is empty. With the default capacity of one token, there's no burst at the start, so the rate is
+    never exceeded in any one second window.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """Build a token bucket.
+
+        :param rate: The number of tokens added per second. If infinite, :meth:`acquire` never waits.
+        :param capacity: The largest number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, waiting until one is available."""
+        if math.isinf(self.rate):
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # The token is reserved while holding the lock, so waiting threads queue up in order
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+class PubMedCache:
+    """A persistent cache of the results from PubMed E-Utils, stored in an SQLite database in a directory.
+
+    Only successful results are stored, so failed PubMed identifiers are looked up again the next time.
     """
-    pubmed_identifiers = list(pubmed_identifiers)
-    url = EUTILS_URL_FMT.format(
-        ','.join(
+
+    #: The name of the database file in the cache directory
+    file_name = 'pubmed.db'
+
+    def __init__(self, directory: str) -> None:
+        """Open the cache in the given directory, creating it if it doesn't exist."""
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.file_name)
+        self._connection = sqlite3.connect(self.path)
+        with self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS result (pmid TEXT PRIMARY KEY, data TEXT NOT NULL)')
+
+    def __len__(self) -> int:  # noqa: D105
+        return self._connection.execute('SELECT COUNT(*) FROM result').fetchone()[0]
+
+    def get_many(self, pmids: Iterable[str]) -> Dict[str, Mapping[str, Any]]:
+        """Get the stored results for the given PubMed identifiers that have them."""
+        rv = {}
+        for batch in chunked(pmids, 500):
+            query = 'SELECT pmid, data FROM result WHERE pmid IN ({})'.format(', '.join('?' * len(batch)))
+            for pmid, data in self._connection.execute(query, batch):
+                rv[pmid] = json.loads(data)
+        return rv
+
+    def set_many(self, pmid_to_result: Mapping[str, Mapping[str, Any]]) -> None:
+        """Store the results for the given PubMed identifiers."""
+        with self._connection:
+            self._connection.executemany('INSERT OR REPLACE INTO result (pmid, data) VALUES (?, ?)', (
+                (pmid, json.dumps(result))
+                for pmid, result in pmid_to_result.items()
+            ))
+
+    def close(self) -> None:
+        """Close the connection to the cache's database."""
+        self._connection.close()
+
+
+def _post_pubmed_citation_request(
+    pubmed_identifiers: Iterable[str],
+    *,
+    url: Optional[str] = None,
+    api_key: Optional[str] = None,
+) -> requests.Response:
+    """Post a list of PubMed identifiers to PubMed E-Utils, so the URL doesn't get too long for big groups."""
+    data = dict(
+        db='pubmed',
+        retmode='json',
+        id=','.join(
             pubmed_identifier
             for pubmed_identifier in pubmed_identifiers
             if pubmed_identifier
         ),
     )
-    response = requests.get(url)
+    api_key = api_key or NCBI_API_KEY
+    if api_key:
+        data['api_key'] = api_key
+    return requests.post(url or EUTILS_URL, data=data)
+
+
+def get_pubmed_citation_response(
+    pubmed_identifiers: Iterable[str],
+    *,
+    url: Optional[str] = None,
+    api_key: Optional[str] = None,
+):
+    """Get the response from PubMed E-Utils for a given list of PubMed identifiers.
+
+    :param pubmed_identifiers: PubMed identifiers
+    :param url: The URL of E-Utils. Defaults to :data:`EUTILS_URL`.
+    :param api_key: An NCBI API key. Defaults to :data:`NCBI_API_KEY`.
+    :rtype: dict
+    """
+    response = _post_pubmed_citation_request(pubmed_identifiers, url=url, api_key=api_key)
     return response.json()
 
 
+def _get_pubmed_results(
+    pubmed_identifiers: List[str],
+    *,
+    bucket: TokenBucket,
+    url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    retries: int = DEFAULT_PUBMED_RETRIES,
+) -> Dict[str, Mapping[str, Any]]:
+    """Get the results from PubMed E-Utils by PubMed identifier, taking a token from the bucket for each request.
+
+    :raises requests.RequestException: if E-Utils fails more than the given number of times
+    """
+    for attempt in range(retries + 1):
+        bucket.acquire()
+        response = _post_pubmed_citation_request(pubmed_identifiers, url=url, api_key=api_key)
+        if response.status_code not in _RETRY_STATUS_CODES or attempt == retries:
+            break
+        logger.info('E-Utils responded with %d. Trying again', response.status_code)
+
+    response.raise_for_status()
+    result = response.json()['result']
+    return {
+        pmid: result[pmid]
+        for pmid in result['uids']
+    }
+
+
+def _iterate_citations(manager, pmids: Iterable[str]) -> Iterable[Citation]:
+    """Iterate over the PubMed citations with the given identifiers, with their authors loaded."""
+    for batch in chunked(pmids, 500):
+        yield from manager.session.query(Citation).filter(
+            Citation.db == CITATION_TYPE_PUBMED,
+            Citation.db_id.in_(batch),
+        ).options(
+            joinedload(Citation.first),
+            joinedload(Citation.last),
+            selectinload(Citation.authors),
+        )
+
+
+def _get_author_names(p: Mapping[str, Any]) -> List[str]:
+    return [author['name'] for author in p.get('authors', []) if author['name']]
+
+
+def _get_citation_row(p: Mapping[str, Any]) -> Dict[str, Any]:
+    """Get the values of the columns of a citation from the dictionary from PubMed E-Utils."""
+    rv = dict(
+        title=p['title'],
+        journal=p['fulljournalname'],
+        volume=p['volume'],
+        issue=p['issue'],
+        pages=p['pages'],
+        date=None,
+    )
+
+    publication_date = p['pubdate']
+    sanitized_publication_date = sanitize_date(publication_date)
+    if sanitized_publication_date:
+        rv['date'] = datetime.strptime(sanitized_publication_date, '%Y-%m-%d').date()
+    else:
+        logger.info('result had date with strange format: %s', publication_date)
+
+    return rv
+
+
+def bulk_enrich_citations(manager, pmid_to_result: Mapping[str, Mapping[str, Any]]) -> None:
+    """Enrich the PubMed citations with the given results from PubMed E-Utils in bulk.
+
+    The authors that aren't in the database yet are inserted, then the citations are updated and linked to their
+    authors with a few statements for all of them. Doesn't commit.
+
+    :type manager: pybel.manager.Manager
+    :param pmid_to_result: A dictionary from PubMed identifiers to their dictionaries from E-Utils, like
+     ``d["result"][pmid]``
+    """
+    if not pmid_to_result:
+        return
+
+    citation_ids = manager._bulk_ensure_citations(CITATION_TYPE_PUBMED, pmid_to_result)
+    author_ids = manager._bulk_ensure_authors(
+        name
+        for p in pmid_to_result.values()
+        for name in _get_author_names(p) + [p['sortfirstauthor'], p['lastauthor']]
+        if name
+    )
+
+    citation_table = Citation.__table__
+    rows = []
+    for pmid, p in pmid_to_result.items():
+        row = _get_citation_row(p)
+        row['first_id'] = author_ids.get(p['sortfirstauthor'])
+        row['last_id'] = author_ids.get(p['lastauthor'])
+        rows.append({'b_' + key: value for key, value in row.items()})
+        rows[-1]['b_id'] = citation_ids[pmid]
+
+    update = citation_table.update().where(citation_table.c.id == sqlalchemy.bindparam('b_id')).values({
+        key[len('b_'):]: sqlalchemy.bindparam(key)
+        for key in rows[0]
+        if key != 'b_id'
+    })
+    for batch in chunked(rows, 1000):
+        manager.session.execute(update, batch)
+
+    wanted = {
+        (author_ids[name], citation_ids[pmid])
+        for pmid, p in pmid_to_result.items()
+        for name in _get_author_names(p)
+    }
+    existing = set()
+    for batch in chunked(citation_ids.values(), 500):
+        existing.update(manager.session.execute(
+            sqlalchemy.select([author_citation.c.author_id, author_citation.c.citation_id]).where(
+                author_citation.c.citation_id.in_(batch),
+            ),
+        ).fetchall())
+    manager._bulk_insert(author_citation, [
+        dict(author_id=author_id, citation_id=citation_id)
+        for author_id, citation_id in wanted - existing
+    ])
+
+    # The citations that were already loaded don't know they were updated
+    manager.session.expire_all()
+
+
 def enrich_citation_model(manager, citation, p) -> bool:
-    """Enrich a citation model with the information from PubMed.
+    """Enrich a citation model with the information from PubMed. Deprecated in favor of :func:`bulk_enrich_citations`.
 
     :param pybel.manager.Manager manager:
     :param Citation citation: A citation model
     :param dict p: The dictionary from PubMed E-Utils corresponding to d["result"][pmid]
     """
+    warnings.warn('use bulk_enrich_citations()', DeprecationWarning)
+
     if 'error' in p:
         logger.warning('Error downloading PubMed')
         return False
 
-    citation.title = p['title']
-    citation.journal = p['fulljournalname']
-    citation.volume = p['volume']
-    citation.issue = p['issue']
-    citation.pages = p['pages']
+    for key, value in _get_citation_row(p).items():
+        setattr(citation, key, value)
     citation.first = manager.get_or_create_author(p['sortfirstauthor'])
     citation.last = manager.get_or_create_author(p['lastauthor'])
 
-    if 'authors' in p:
-        for author in p['authors']:
-            author_model = manager.get_or_create_author(author['name'])
-            if author_model not in citation.authors:
-                citation.authors.append(author_model)
-
-    publication_date = p['pubdate']
-    sanitized_publication_date = sanitize_date(publication_date)
-    if sanitized_publication_date:
-        citation.date = datetime.strptime(sanitized_publication_date, '%Y-%m-%d')
-    else:
-        logger.info('result had date with strange format: %s', publication_date)
+    for name in _get_author_names(p):
+        author_model = manager.get_or_create_author(name)
+        if author_model not in citation.authors:
+            citation.authors.append(author_model)
 
     return True
 
 
+def _get_default_rate(api_key: Optional[str]) -> float:
+    if 'pubmed_rate' in config:
+        return float(config['pubmed_rate'])
+    return NCBI_API_KEY_RATE if api_key or NCBI_API_KEY else NCBI_RATE
+
+
 def get_citations_by_pmids(
     manager,
     pmids: Iterable[Union[str, int]],
     group_size: Optional[int] = None,
     sleep_time: Optional[int] = None,
+    *,
+    rate: Optional[float] = None,
+    workers: Optional[int] = None,
+    cache_directory: Optional[str] = None,
+    url: Optional[str] = None,
+    api_key: Optional[str] = None,
 ) -> Tuple[Dict[str, Dict], Set[str]]:
     """Get citation information for the given list of PubMed identifiers using the NCBI's eUtils service.
 
+    The PubMed identifiers that aren't enriched in the database yet are looked up in groups. A few groups are requested
+    at once, and a :class:`TokenBucket` keeps the requests under NCBI's rate limit. The citations and their authors
+    are written in bulk as each group comes back, then committed. If there's a cache directory, the results are also
+    stored in a :class:`PubMedCache` there, so they're never requested again.
+
     :type manager: pybel.Manager
     :param pmids: an iterable of PubMed identifiers
     :param group_size: The number of PubMed identifiers to query at a time. Defaults to 200 identifiers.
-    :param sleep_time: Number of seconds to sleep between queries. Defaults to 1 second.
-    :return: A dictionary of {pmid: pmid data dictionary} or a pair of this dictionary and a set ot erroneous
-            pmids if return_errors is :data:`True`
+    :param sleep_time: Number of seconds between queries. Superseded by ``rate``. If 0, queries aren't limited.
+    :param rate: The number of queries per second. Defaults to the configuration option ``pubmed_rate``, or
+     NCBI's limit of 3 or 10 with an API key.
+    :param workers: The number of queries in flight at once. Defaults to :data:`DEFAULT_PUBMED_WORKERS`.
+    :param cache_directory: The directory where results are stored. Defaults to
+     :data:`pybel.config.pubmed_cache_directory`.
+    :param url: The URL of E-Utils. Defaults to :data:`EUTILS_URL`.
+    :param api_key: An NCBI API key. Defaults to :data:`NCBI_API_KEY`.
+    :return: A dictionary of {pmid: pmid data dictionary} and a set of erroneous pmids
     """
-    group_size = group_size if group_size is not None else 200
-    sleep_time = sleep_time if sleep_time is not None else 1
+    group_size = group_size if group_size is not None else DEFAULT_PUBMED_GROUP_SIZE
+    workers = workers if workers is not None else DEFAULT_PUBMED_WORKERS
+    if rate is None and sleep_time is not None:
+        rate = 1 / sleep_time if sleep_time else math.inf
+    elif rate is None:
+        rate = _get_default_rate(api_key)
+    cache_directory = cache_directory if cache_directory is not None else default_pubmed_cache_directory
 
     pmids = clean_pubmed_identifiers(pmids)
     logger.info('Ensuring %d PubMed identifiers', len(pmids))
 
-    result = {}
-    unenriched_pmids = {}
-
-    for pmid in pmids:
-        citation = manager.get_or_create_citation(namespace=CITATION_TYPE_PUBMED, identifier=pmid)
-
-        if not citation.is_enriched:
-            unenriched_pmids[pmid] = citation
-            continue
-
-        result[pmid] = citation.to_json()
-
+    manager._bulk_ensure_citations(CITATION_TYPE_PUBMED, pmids)
     manager.session.commit()
 
-    logger.debug('Found %d PubMed identifiers in database', len(pmids) - len(unenriched_pmids))
+    result = {
+        citation.db_id: citation.to_json()
+        for citation in _iterate_citations(manager, pmids)
+        if citation.is_enriched
+    }
+    unenriched_pmids = [pmid for pmid in pmids if pmid not in result]
+
+    logger.debug('Found %d PubMed identifiers in database', len(result))
 
     if not unenriched_pmids:
         return result, set()
 
-    number_unenriched = len(unenriched_pmids)
-    logger.info('Querying PubMed for %d identifiers', number_unenriched)
-
     errors = set()
     t = time.time()
 
-    for pmid_group_index, pmid_list in enumerate(grouper(group_size, unenriched_pmids), start=1):
-        pmid_list = list(pmid_list)
-        logger.info('Getting group %d having %d PubMed identifiers', pmid_group_index, len(pmid_list))
-
-        response = get_pubmed_citation_response(pmid_list)
-        response_pmids = response['result']['uids']
-
-        for pmid in response_pmids:
-            p = response['result'][pmid]
-            citation = unenriched_pmids[pmid]
-
-            successful_enrichment = enrich_citation_model(manager, citation, p)
-
-            if not successful_enrichment:
-                logger.warning("Error downloading PubMed identifier: %s", pmid)
-                errors.add(pmid)
-                continue
-
-            result[pmid] = citation.to_json()
-            manager.session.add(citation)
-
-        manager.session.commit()  # commit in groups
-
-        # Don't want to hit that rate limit
-        time.sleep(sleep_time)
+    cache = PubMedCache(cache_directory) if cache_directory else None
+    try:
+        if cache is not None:
+            cached = cache.get_many(unenriched_pmids)
+            logger.info('Found %d PubMed identifiers in cache', len(cached))
+            bulk_enrich_citations(manager, cached)
+            manager.session.commit()
+            missing_pmids = [pmid for pmid in unenriched_pmids if pmid not in cached]
+        else:
+            missing_pmids = unenriched_pmids
+
+        logger.info('Querying PubMed for %d identifiers', len(missing_pmids))
+        bucket = TokenBucket(rate)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_group = {
+                executor.submit(_get_pubmed_results, group, bucket=bucket, url=url, api_key=api_key): group
+                for group in chunked(missing_pmids, group_size)
+            }
+            try:
+                for pmid_group_index, future in enumerate(as_completed(future_to_group), start=1):
+                    group = future_to_group[future]
+                    logger.info('Got group %d having %d PubMed identifiers', pmid_group_index, len(group))
+                    try:
+                        pmid_to_result = future.result()
+                    except (requests.RequestException, ValueError, KeyError):
+                        logger.warning('Error downloading group %d from PubMed', pmid_group_index, exc_info=True)
+                        errors.update(group)
+                        continue
+
+                    pmid_to_result = {
+                        pmid: p
+                        for pmid, p in pmid_to_result.items()
+                        if 'error' not in p
+                    }
+                    for pmid in set(group) - pmid_to_result.keys():
+                        logger.warning('Error downloading PubMed identifier: %s', pmid)
+                        errors.add(pmid)
+
+                    bulk_enrich_citations(manager, pmid_to_result)
+                    manager.session.commit()  # commit in groups
+                    if cache is not None:
+                        cache.set_many(pmid_to_result)
+            finally:
+                # Don't wait for the requests that haven't started if something went wrong
+                for future in future_to_group:
+                    future.cancel()
+    finally:
+        if cache is not None:
+            cache.close()
+
+    result.update(
+        (citation.db_id, citation.to_json())
+        for citation in _iterate_citations(manager, unenriched_pmids)
+        if citation.is_enriched
+    )
 
     logger.info('retrieved %d PubMed identifiers in %.02f seconds', len(unenriched_pmids), time.time() - t)
 
@@ -216,6 +515,7 @@ def enrich_pubmed_citations(
     graph,
     group_size: Optional[int] = None,
     sleep_time: Optional[int] = None,
+    **kwargs,
 ) -> Set[str]:
     """Overwrite all PubMed citations with values from NCBI's eUtils lookup service.
 
@@ -225,11 +525,14 @@ def enrich_pubmed_citations(
     :type manager: pybel.manager.Manager
     :type graph: pybel.BELGraph
     :param group_size: The number of PubMed identifiers to query at a time. Defaults to 200 identifiers.
-    :param sleep_time: Number of seconds to sleep between queries. Defaults to 1 second.
+    :param sleep_time: Number of seconds between queries. Superseded by ``rate``.
+    :param kwargs: Keyword arguments passed to :func:`get_citations_by_pmids`, like ``rate`` and ``cache_directory``
     :return: A set of PMIDs for which the eUtils service crashed
     """
     pmids = {x for x in get_pubmed_identifiers(graph) if x}
-    pmid_data, errors = get_citations_by_pmids(manager, pmids=pmids, group_size=group_size, sleep_time=sleep_time)
+    pmid_data, errors = get_citations_by_pmids(
+        manager, pmids=pmids, group_size=group_size, sleep_time=sleep_time, **kwargs,
+    )
 
     for u, v, k in filter_edges(graph, has_pubmed):
         pmid = graph[u][v][k][CITATION][IDENTIFIER].strip()
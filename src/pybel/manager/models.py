@@ -10,15 +10,15 @@ from sqlalchemy import (
     Boolean, Column, Date, DateTime, ForeignKey, Integer, JSON, LargeBinary, String, Table, Text, UniqueConstraint,
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import backref, relationship
+from sqlalchemy.orm import backref, deferred, relationship
 
+from .blob import from_blob, iterate_blob_edges, to_blob
 from ..constants import (
     CITATION, CITATION_AUTHORS, CITATION_DATE, CITATION_FIRST_AUTHOR, CITATION_JOURNAL, CITATION_LAST_AUTHOR,
     CITATION_PAGES, CITATION_TYPE_PUBMED, CITATION_VOLUME, EVIDENCE, IDENTIFIER, METADATA_AUTHORS, METADATA_CONTACT,
     METADATA_COPYRIGHT, METADATA_DESCRIPTION, METADATA_DISCLAIMER, METADATA_LICENSES, METADATA_NAME, METADATA_VERSION,
     NAME, NAMESPACE,
 )
-from ..io.gpickle import from_bytes, to_bytes
 from ..language import Entity
 from ..tokens import parse_result_to_dsl
 
@@ -203,13 +203,13 @@ class NamespaceEntry(Base):
 network_edge = Table(
     NETWORK_EDGE_TABLE_NAME, Base.metadata,
     Column('network_id', Integer, ForeignKey('{}.id'.format(NETWORK_TABLE_NAME)), primary_key=True),
-    Column('edge_id', Integer, ForeignKey('{}.id'.format(EDGE_TABLE_NAME)), primary_key=True),
+    Column('edge_id', Integer, ForeignKey('{}.id'.format(EDGE_TABLE_NAME)), primary_key=True, index=True),
 )
 
 network_node = Table(
     NETWORK_NODE_TABLE_NAME, Base.metadata,
     Column('network_id', Integer, ForeignKey('{}.id'.format(NETWORK_TABLE_NAME)), primary_key=True),
-    Column('node_id', Integer, ForeignKey('{}.id'.format(NODE_TABLE_NAME)), primary_key=True),
+    Column('node_id', Integer, ForeignKey('{}.id'.format(NODE_TABLE_NAME)), primary_key=True, index=True),
 )
 
 
@@ -230,7 +230,11 @@ class Network(Base):
     licenses = Column(Text, nullable=True, doc='License information')
 
     created = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
-    blob = Column(LargeBinary(LONGBLOB), doc='A pickled version of this network')
+    blob = deferred(Column(LargeBinary(LONGBLOB), doc='A serialized version of this network'))
+    blob_codec = Column(
+        String(32), nullable=True,
+        doc='The name of the codec used for the blob from pybel.manager.blob. If null, the blob is a plain pickle',
+    )
 
     nodes = relationship('Node', secondary=network_node, lazy='dynamic', backref=backref('networks', lazy='dynamic'))
     edges = relationship('Edge', secondary=network_edge, lazy='dynamic', backref=backref('networks', lazy='dynamic'))
@@ -297,14 +301,23 @@ class Network(Base):
 
         :rtype: pybel.BELGraph
         """
-        return from_bytes(self.blob)
+        return from_blob(self.blob, self.blob_codec)
+
+    def iterate_edges(self):
+        """Iterate over the ``(u, v, key, data)`` edges of this network's graph without building the whole graph.
+
+        :rtype: Iterable[tuple[pybel.dsl.BaseEntity,pybel.dsl.BaseEntity,str,dict]]
+        """
+        return iterate_blob_edges(self.blob, self.blob_codec)
 
-    def store_bel(self, graph):
+    def store_bel(self, graph, codec: Optional[str] = None):
         """Insert a BEL graph.
 
         :param pybel.BELGraph graph: A BEL Graph
+        :param codec: The name of the codec from :mod:`pybel.manager.blob` to use. Defaults to
+         :data:`pybel.manager.blob.DEFAULT_BLOB_CODEC`.
         """
-        self.blob = to_bytes(graph)
+        self.blob, self.blob_codec = to_blob(graph, codec)
 
 
 class Node(Base):
@@ -530,19 +543,19 @@ class Edge(Base):
     bel = Column(Text, nullable=False, doc='Valid BEL statement that represents the given edge')
     relation = Column(String(32), nullable=False)
 
-    source_id = Column(Integer, ForeignKey('{}.id'.format(NODE_TABLE_NAME)), nullable=False)
+    source_id = Column(Integer, ForeignKey('{}.id'.format(NODE_TABLE_NAME)), nullable=False, index=True)
     source = relationship(
         Node, foreign_keys=[source_id],
         backref=backref('out_edges', lazy='dynamic', cascade='all, delete-orphan'),
     )
 
-    target_id = Column(Integer, ForeignKey('{}.id'.format(NODE_TABLE_NAME)), nullable=False)
+    target_id = Column(Integer, ForeignKey('{}.id'.format(NODE_TABLE_NAME)), nullable=False, index=True)
     target = relationship(
         Node, foreign_keys=[target_id],
         backref=backref('in_edges', lazy='dynamic', cascade='all, delete-orphan'),
     )
 
-    evidence_id = Column(Integer, ForeignKey('{}.id'.format(EVIDENCE_TABLE_NAME)), nullable=True)
+    evidence_id = Column(Integer, ForeignKey('{}.id'.format(EVIDENCE_TABLE_NAME)), nullable=True, index=True)
     evidence = relationship(Evidence, backref=backref('edges', lazy='dynamic'))
 
     annotations = relationship(
@@ -609,7 +622,7 @@ class Edge(Base):
         u = self.source.as_bel()
         v = self.target.as_bel()
 
-        if self.evidence:
+        if self.evidence_id is not None:
             return graph.add_qualified_edge(u, v, **self.data)
         else:
             return graph.add_unqualified_edge(u, v, self.relation)
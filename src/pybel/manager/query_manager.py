@@ -3,22 +3,55 @@
 """The query manager for the database."""
 
 import datetime
-from typing import Iterable, List, Optional, Union
+import logging
+from typing import Any, Iterable, List, Mapping, Optional, Union
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import aliased
+import sqlalchemy
+from sqlalchemy import and_, func, literal_column, or_, select, text
+from sqlalchemy.orm import aliased, joinedload
+from sqlalchemy.sql import column, table
 
+from .blob import from_blob_header
 from .lookup_manager import LookupManager
-from .models import Author, Citation, Edge, Evidence, Namespace, NamespaceEntry, Node
-from ..constants import CITATION_TYPE_PUBMED
-from ..struct import BELGraph
+from .models import (
+    Author, Citation, Edge, Evidence, Namespace, NamespaceEntry, Network, Node, edge_annotation, network_edge,
+    network_node,
+)
+from .search import (
+    POSTGRESQL, SEARCH_COLUMNS, SEARCH_INDEX_DIALECTS, SQLITE, get_create_statements, get_drop_statements,
+    get_exists_statement,
+)
+from ..constants import CITATION_TYPE_PUBMED, RELATION
+from ..struct import BELGraph, union
+from ..struct.mutation import get_subgraph_by_annotations
+from ..struct.query.constants import SEED_TYPE_ANNOTATION, SEED_TYPE_INDUCTION, SEED_TYPE_NEIGHBORS, SEED_TYPE_PUBMED
 from ..utils import parse_datetime
 
 __all__ = [
     'QueryManager',
     'graph_from_edges',
+    'PUSHDOWN_SEED_TYPES',
 ]
 
+logger = logging.getLogger(__name__)
+
+#: The default number of edges loaded in each page by :meth:`QueryManager.iterate_edges`
+DEFAULT_EDGE_PAGE_SIZE = 10000
+
+#: The default number of rows fetched at a time from the cursor of each page by :meth:`QueryManager.iterate_edges`
+DEFAULT_EDGE_YIELD_PER = 1000
+
+#: The default number of results in each page of a ranked search, like :meth:`QueryManager.search_evidences`
+DEFAULT_SEARCH_LIMIT = 25
+
+#: The seed types that :meth:`QueryManager.get_subgraph_by_seeding` runs in the database
+PUSHDOWN_SEED_TYPES = {
+    SEED_TYPE_INDUCTION,
+    SEED_TYPE_NEIGHBORS,
+    SEED_TYPE_PUBMED,
+    SEED_TYPE_ANNOTATION,
+}
+
 
 def graph_from_edges(edges: Iterable[Edge], **kwargs) -> BELGraph:
     """Build a BEL graph from edges."""
@@ -30,9 +63,168 @@ def graph_from_edges(edges: Iterable[Edge], **kwargs) -> BELGraph:
     return graph
 
 
+def _graph_from_seeded_edges(universe: BELGraph, edges: Iterable[Edge]) -> BELGraph:
+    """Build a BEL graph from edges like the in-memory seeding does, without the implied edges of their nodes.
+
+    Unlike :func:`graph_from_edges`, the variants' parents and the members of complexes and reactions aren't added
+    with their ``hasVariant``, ``partOf``, ``hasReactant``, and ``hasProduct`` edges unless they're in the given edges.
+    The edges are keyed by their stored hashes, which are the keys they had in the graphs they were inserted from.
+
+    :param universe: A graph with the metadata and terminologies of the networks the edges came from. The result is
+     its child, like the subgraphs made by the in-memory seeding are children of the universe.
+    """
+    graph = universe.child()
+    keyed_edges = []
+    for edge in edges:
+        source, target = edge.source.as_bel(), edge.target.as_bel()
+        if edge.evidence_id is None:
+            attr = {RELATION: edge.relation}
+        else:
+            attr = graph._build_attr(**edge.data)
+        graph.add_node(source)
+        graph.add_node(target)
+        keyed_edges.append((source, target, edge.md5, attr))
+    graph._help_add_keyed_edges(keyed_edges)
+    return graph
+
+
 class QueryManager(LookupManager):
     """An extension to the Manager to make queries over the database."""
 
+    #: Does the database have search indexes? None if it hasn't been checked yet.
+    _has_search_index: Optional[bool] = None
+
+    def create_search_index(self) -> None:
+        """Create full-text indexes over the text of evidences, edges, nodes, and namespace entries.
+
+        Afterwards, the substring searches like :meth:`search_edges_with_evidence` use them and the ranked searches
+        like :meth:`search_evidences` rank by relevance. They're kept up to date as data is inserted. See
+        :mod:`pybel.manager.search`.
+
+        :raises ValueError: if the database isn't SQLite or PostgreSQL
+        """
+        dialect = self.engine.dialect.name
+        if dialect not in SEARCH_INDEX_DIALECTS:
+            raise ValueError('search indexes are not supported on {}'.format(dialect))
+
+        for statement in get_create_statements(dialect):
+            self.session.execute(text(statement))
+        self.session.commit()
+        self._has_search_index = True
+
+    def drop_search_index(self) -> None:
+        """Drop the full-text indexes made by :meth:`create_search_index`, if they exist."""
+        dialect = self.engine.dialect.name
+        if dialect not in SEARCH_INDEX_DIALECTS:
+            return
+
+        for statement in get_drop_statements(dialect):
+            self.session.execute(text(statement))
+        self.session.commit()
+        self._has_search_index = False
+
+    def has_search_index(self) -> bool:
+        """Check if the database has the full-text indexes made by :meth:`create_search_index`."""
+        if self._has_search_index is None:
+            dialect = self.engine.dialect.name
+            self._has_search_index = (
+                dialect in SEARCH_INDEX_DIALECTS
+                and len(SEARCH_COLUMNS) == self.session.execute(text(get_exists_statement(dialect))).scalar()
+            )
+        return self._has_search_index
+
+    def drop_all(self, checkfirst: bool = True) -> None:
+        """Drop all data, tables, and databases for the PyBEL cache, including the search indexes."""
+        super().drop_all(checkfirst=checkfirst)
+        self.drop_search_index()
+
+    def _get_like_filter(self, key: str, pattern: str):
+        """Build a filter for the rows whose column in :data:`pybel.manager.search.SEARCH_COLUMNS` is like a pattern.
+
+        PostgreSQL uses its search index for ``LIKE`` by itself, but SQLite needs the pattern to be matched in the
+        column's FTS5 table.
+        """
+        search_column = SEARCH_COLUMNS[key]
+        if self.engine.dialect.name == SQLITE and self.has_search_index():
+            index = table(search_column.index_name, column(search_column.column_name))
+            matching_ids = select([literal_column('rowid')]).select_from(index).where(
+                index.c[search_column.column_name].like(pattern),
+            )
+            return search_column.model.id.in_(matching_ids)
+        return search_column.column.like(pattern)
+
+    def _search(self, key: str, query: str, limit: int, offset: int) -> List:
+        """Get a page of the rows whose column in :data:`pybel.manager.search.SEARCH_COLUMNS` contains the query.
+
+        With a search index, they're ranked with BM25 on SQLite or trigram similarity on PostgreSQL. Otherwise,
+        shorter texts are ranked first.
+        """
+        search_column = SEARCH_COLUMNS[key]
+        model, model_column = search_column.model, search_column.column
+        dialect = self.engine.dialect.name
+
+        # The trigram tokenizer can only match queries with at least three characters
+        if dialect == SQLITE and 3 <= len(query) and self.has_search_index():
+            statement = text(
+                'SELECT rowid FROM {index} WHERE {index} MATCH :query ORDER BY rank, rowid LIMIT :limit OFFSET :offset'
+                .format(index=search_column.index_name),
+            )
+            parameters = {'query': '"{}"'.format(query.replace('"', '""')), 'limit': limit, 'offset': offset}
+            ids = [row_id for row_id, in self.session.execute(statement, parameters)]
+            id_to_model = {
+                result.id: result
+                for result in self.session.query(model).filter(model.id.in_(ids))
+            }
+            return [id_to_model[row_id] for row_id in ids if row_id in id_to_model]
+
+        rv = self.session.query(model).filter(model_column.contains(query, autoescape=True))
+        if dialect == POSTGRESQL and self.has_search_index():
+            rv = rv.order_by(func.similarity(model_column, query).desc(), model.id)
+        else:
+            rv = rv.order_by(func.length(model_column), model.id)
+        return rv.limit(limit).offset(offset).all()
+
+    def search_evidences(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT, offset: int = 0) -> List[Evidence]:
+        """Search for evidences whose text contains the query, ranked by relevance.
+
+        :param query: The text to search for
+        :param limit: The number of results in each page
+        :param offset: The number of results to skip, e.g., to get the next page
+        """
+        return self._search('evidence', query, limit=limit, offset=offset)
+
+    def search_edges(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT, offset: int = 0) -> List[Edge]:
+        """Search for edges whose BEL contains the query, ranked by relevance.
+
+        :param query: The text to search for
+        :param limit: The number of results in each page
+        :param offset: The number of results to skip, e.g., to get the next page
+        """
+        return self._search('edge', query, limit=limit, offset=offset)
+
+    def search_nodes(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT, offset: int = 0) -> List[Node]:
+        """Search for nodes whose BEL contains the query, ranked by relevance.
+
+        :param query: The text to search for
+        :param limit: The number of results in each page
+        :param offset: The number of results to skip, e.g., to get the next page
+        """
+        return self._search('node', query, limit=limit, offset=offset)
+
+    def search_namespace_entries(
+        self,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        offset: int = 0,
+    ) -> List[NamespaceEntry]:
+        """Search for namespace entries whose name contains the query, ranked by relevance.
+
+        :param query: The text to search for
+        :param limit: The number of results in each page
+        :param offset: The number of results to skip, e.g., to get the next page
+        """
+        return self._search('namespace_entry', query, limit=limit, offset=offset)
+
     def count_nodes(self) -> int:
         """Count the number of nodes in the database."""
         return self._count_model(Node)
@@ -54,7 +246,7 @@ class QueryManager(LookupManager):
         q = self.session.query(Node)
 
         if bel:
-            q = q.filter(Node.bel.contains(bel))
+            q = q.filter(self._get_like_filter('node', '%{}%'.format(bel)))
 
         if type:
             q = q.filter(Node.type == type)
@@ -66,7 +258,7 @@ class QueryManager(LookupManager):
                 q = q.join(Namespace).filter(Namespace.keyword.contains(namespace))
 
             if name:
-                q = q.filter(NamespaceEntry.name.contains(name))
+                q = q.filter(self._get_like_filter('namespace_entry', '%{}%'.format(name)))
 
         return q
 
@@ -74,6 +266,42 @@ class QueryManager(LookupManager):
         """Count the number of edges in the database."""
         return self._count_model(Edge)
 
+    def iterate_edges(
+        self,
+        query: Optional[sqlalchemy.orm.query.Query] = None,
+        after: Optional[int] = None,
+        page_size: int = DEFAULT_EDGE_PAGE_SIZE,
+        yield_per: int = DEFAULT_EDGE_YIELD_PER,
+    ) -> Iterable[Edge]:
+        """Iterate over edges in order of their identifiers, loading them a page at a time.
+
+        Each page is selected with keyset pagination, i.e., by the identifiers after the last edge of the previous
+        page, so later pages are as fast as the first. Rows are fetched from each page's cursor with ``yield_per``, so
+        only a few edges need to be in memory at once. For example, this can build a graph from millions of edges:
+
+        >>> from pybel.manager.query_manager import graph_from_edges
+        >>> graph = graph_from_edges(manager.iterate_edges(manager.query_edges(relation='increases')))
+
+        :param query: A query over edges, e.g., from :meth:`query_edges`. If None, iterates over all edges. Its
+         ordering is replaced with the order of the edges' identifiers.
+        :param after: Only get the edges whose identifiers are greater than this, e.g., to resume from the last one
+        :param page_size: The number of edges selected in each page
+        :param yield_per: The number of rows fetched at a time from each page's cursor
+        """
+        if query is None:
+            query = self.session.query(Edge)
+        query = query.order_by(None).order_by(Edge.id).options(joinedload(Edge.source), joinedload(Edge.target))
+
+        while True:
+            page = query if after is None else query.filter(Edge.id > after)
+            count = 0
+            for edge in page.limit(page_size).yield_per(yield_per):
+                yield edge
+                after = edge.id
+                count += 1
+            if count < page_size:
+                return
+
     def get_edges_with_citation(self, citation: Citation) -> List[Edge]:
         """Get the edges with the given citation."""
         return self.session.query(Edge).join(Evidence).filter(Evidence.citation == citation)
@@ -87,14 +315,14 @@ class QueryManager(LookupManager):
 
         :param evidence: A string to search evidences. Can use wildcard percent symbol (%).
         """
-        return self.session.query(Edge).join(Evidence).filter(Evidence.text.like(evidence)).all()
+        return self.session.query(Edge).join(Evidence).filter(self._get_like_filter('evidence', evidence)).all()
 
     def search_edges_with_bel(self, bel: str) -> List[Edge]:
         """Search edges with given BEL.
 
         :param bel: A BEL string to use as a search
         """
-        return self.session.query(Edge).filter(Edge.bel.like(bel))
+        return self.session.query(Edge).filter(self._get_like_filter('edge', bel))
 
     def get_edges_with_annotation(self, annotation: str, value: str) -> List[Edge]:
         """Search edges with the given annotation/value pair."""
@@ -118,7 +346,8 @@ class QueryManager(LookupManager):
     ):
         """Return a query over the edges in the database.
 
-        Usually this means that you should call ``list()`` or ``.all()`` on this result.
+        Usually this means that you should call ``list()`` or ``.all()`` on this result, or pass it to
+        :meth:`iterate_edges` if there might be many edges.
 
         :param bel: BEL statement that represents the desired edge.
         :param source_function: Filter source nodes with the given BEL function
@@ -266,3 +495,139 @@ class QueryManager(LookupManager):
     def query_neighbors(self, nodes: List[Node]) -> List[Edge]:
         """Get all edges incident to any of the given nodes."""
         return self.session.query(Edge).filter(self._edge_one_node(nodes)).all()
+
+    def can_push_down(self, seeding: Iterable[Mapping[str, Any]]) -> bool:
+        """Check if all of the seeds can be run in the database with :meth:`get_subgraph_by_seeding`.
+
+        Only annotations defined by URL are stored in the edge store, so annotation seeds can only be run in the
+        database if all of their annotations are in the namespace store.
+
+        :param seeding: A :class:`pybel.struct.query.Seeding` or other list of seed dictionaries
+        """
+        seeding = list(seeding)
+        if not seeding or any(seed['type'] not in PUSHDOWN_SEED_TYPES for seed in seeding):
+            return False
+
+        keywords = set()
+        for seed in seeding:
+            if seed['type'] == SEED_TYPE_ANNOTATION:
+                if not seed['data']['annotations']:  # matches all edges
+                    return False
+                keywords.update(seed['data']['annotations'])
+        if not keywords:
+            return True
+
+        annotation_keywords = self.session.query(Namespace.keyword).filter(
+            Namespace.is_annotation,
+            Namespace.keyword.in_(keywords),
+        )
+        return keywords == {keyword for keyword, in annotation_keywords}
+
+    def get_subgraph_by_seeding(
+        self,
+        network_ids: Iterable[int],
+        seeding: Iterable[Mapping[str, Any]],
+    ) -> Optional[BELGraph]:
+        """Run the seeds over the edge store for the given networks instead of over the union of their graphs.
+
+        Gives the same nodes and edges as :meth:`pybel.struct.query.Seeding.run` on the union of the networks' graphs,
+        but only the matching edges are loaded from the database. The networks' metadata and terminologies are read
+        from the headers of their blobs, so the result can still be exported like the in-memory one.
+
+        :param network_ids: The identifiers of the networks to search
+        :param seeding: A :class:`pybel.struct.query.Seeding` or other list of seed dictionaries whose types are all
+         in :data:`PUSHDOWN_SEED_TYPES`. Check with :meth:`can_push_down`.
+        :returns: The union of the subgraphs for each seed or None if none of the seeds matched anything
+        """
+        network_ids = list(network_ids)
+        universe = self._get_universe_header(network_ids)
+        subgraphs = []
+        for seed in seeding:
+            subgraph = self._get_subgraph_by_seed(universe, network_ids, seed['type'], seed['data'])
+            if subgraph is None:
+                logger.debug('seed returned empty graph: %s', seed)
+                continue
+            subgraphs.append(subgraph)
+
+        if not subgraphs:
+            logger.debug('no subgraphs returned')
+            return
+
+        return union(subgraphs)
+
+    def _get_universe_header(self, network_ids: List[int]) -> BELGraph:
+        """Get a graph with the metadata and terminologies that the union of the networks' graphs would have.
+
+        The networks are merged in the same order as :meth:`pybel.manager.NetworkManager.get_universe_by_ids` does.
+        """
+        blobs = self.session.query(Network.blob, Network.blob_codec).filter(
+            Network.id.in_(network_ids),
+            Network.blob.isnot(None),
+        ).order_by(Network.id)
+        headers = [from_blob_header(blob, codec) for blob, codec in blobs]
+        if not headers:
+            return BELGraph()
+        return union(headers)
+
+    def _get_subgraph_by_seed(
+        self,
+        universe: BELGraph,
+        network_ids: List[int],
+        seed_method: str,
+        seed_data: Any,
+    ) -> Optional[BELGraph]:
+        network_edge_ids = select([network_edge.c.edge_id]).where(network_edge.c.network_id.in_(network_ids))
+
+        if seed_method in {SEED_TYPE_INDUCTION, SEED_TYPE_NEIGHBORS}:
+            nodes = self._get_network_nodes_by_md5(network_ids, {node.md5 for node in seed_data})
+            if not nodes:  # like the in-memory seeding, give nothing when none of the nodes are in the networks
+                return
+            node_ids = [node.id for node in nodes]
+            if seed_method == SEED_TYPE_INDUCTION:
+                edge_filter = and_(Edge.source_id.in_(node_ids), Edge.target_id.in_(node_ids))
+            else:
+                edge_filter = or_(Edge.source_id.in_(node_ids), Edge.target_id.in_(node_ids))
+            graph = _graph_from_seeded_edges(universe, self._query_network_edges(network_edge_ids).filter(edge_filter))
+            if seed_method == SEED_TYPE_INDUCTION:
+                # induced subgraphs keep the seed nodes without edges and the universe's document metadata
+                graph.add_nodes_from(node.as_bel() for node in nodes)
+                graph.graph.update(universe.graph)
+            return graph
+
+        if seed_method == SEED_TYPE_PUBMED:
+            pubmed_identifiers = [seed_data] if isinstance(seed_data, str) else list(seed_data)
+            query = self._query_network_edges(network_edge_ids).join(Evidence).join(Citation).filter(
+                Citation.db == CITATION_TYPE_PUBMED,
+                Citation.db_id.in_(pubmed_identifiers),
+            )
+            return _graph_from_seeded_edges(universe, query)
+
+        if seed_method == SEED_TYPE_ANNOTATION:
+            annotations = seed_data['annotations']
+            # Get the edges matching any of the annotations, then match them exactly like the in-memory seeding
+            annotation_filter = or_(*(
+                and_(Namespace.keyword == annotation, NamespaceEntry.name.in_(list(values)))
+                for annotation, values in annotations.items()
+            ))
+            annotated_edge_ids = select([edge_annotation.c.edge_id]).select_from(
+                edge_annotation.join(NamespaceEntry).join(Namespace),
+            ).where(annotation_filter)
+            query = self._query_network_edges(network_edge_ids).filter(Edge.id.in_(annotated_edge_ids))
+            graph = _graph_from_seeded_edges(universe, query)
+            return get_subgraph_by_annotations(graph, annotations, or_=seed_data.get('or'))
+
+        raise ValueError('can not run seed in the database: {}'.format(seed_method))
+
+    def _get_network_nodes_by_md5(self, network_ids: List[int], md5s: Iterable[str]) -> List[Node]:
+        """Get the nodes with the given hashes that are in any of the given networks."""
+        network_node_ids = select([network_node.c.node_id]).where(network_node.c.network_id.in_(network_ids))
+        return self.session.query(Node).filter(Node.md5.in_(list(md5s)), Node.id.in_(network_node_ids)).all()
+
+    def _query_network_edges(self, network_edge_ids):
+        """Query the edges in the given selection of identifiers, loading their nodes in the same query."""
+        return (
+            self.session
+                .query(Edge)
+                .filter(Edge.id.in_(network_edge_ids))
+                .options(joinedload(Edge.source), joinedload(Edge.target))
+        )
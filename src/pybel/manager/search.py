@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""Optional full-text indexes over the text columns of the edge store.
+
+Substring searches like :meth:`pybel.manager.QueryManager.search_edges_with_evidence` use ``LIKE '%...%'``, which has
+to scan the whole table. :meth:`pybel.manager.QueryManager.create_search_index` adds indexes that make them fast:
+
+- On SQLite, each column gets an external content FTS5 table with the trigram tokenizer that's kept up to date by
+  triggers. Substring searches select the matching rows from it with ``LIKE``, which it answers with its index, and
+  ranked searches order matches with BM25.
+- On PostgreSQL, each column gets a GIN index with ``gin_trgm_ops`` from the ``pg_trgm`` extension, which the query
+  planner uses for ``LIKE`` by itself, and ranked searches order matches by trigram similarity.
+
+Other databases don't support search indexes, so their searches still scan.
+"""
+
+from typing import Iterable, List, Mapping, NamedTuple, Type
+
+from .models import Base, Edge, Evidence, NamespaceEntry, Node
+
+__all__ = [
+    'SearchColumn',
+    'SEARCH_COLUMNS',
+    'SQLITE',
+    'POSTGRESQL',
+    'SEARCH_INDEX_DIALECTS',
+]
+
+#: The name of the SQLite dialect in SQLAlchemy
+SQLITE = 'sqlite'
+#: The name of the PostgreSQL dialect in SQLAlchemy
+POSTGRESQL = 'postgresql'
+#: The dialects that support search indexes
+SEARCH_INDEX_DIALECTS = {SQLITE, POSTGRESQL}
+
+
+class SearchColumn(NamedTuple):
+    """A text column that can have a search index."""
+
+    model: Type[Base]
+    column_name: str
+
+    @property
+    def column(self):
+        """Get the column."""
+        return getattr(self.model, self.column_name)
+
+    @property
+    def table_name(self) -> str:
+        """Get the name of the column's table."""
+        return self.model.__tablename__
+
+    @property
+    def index_name(self) -> str:
+        """Get the name of the column's FTS5 table on SQLite or its index on PostgreSQL."""
+        return '{}_{}_search'.format(self.table_name, self.column_name)
+
+
+#: The text columns that get search indexes, by short names
+SEARCH_COLUMNS: Mapping[str, SearchColumn] = {
+    'evidence': SearchColumn(Evidence, 'text'),
+    'edge': SearchColumn(Edge, 'bel'),
+    'node': SearchColumn(Node, 'bel'),
+    'namespace_entry': SearchColumn(NamespaceEntry, 'name'),
+}
+
+
+def _iterate_sqlite_create(search_column: SearchColumn) -> Iterable[str]:
+    names = dict(
+        index=search_column.index_name,
+        table=search_column.table_name,
+        column=search_column.column_name,
+    )
+    yield (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5("
+        "{column}, content='{table}', content_rowid='id', tokenize='trigram')"
+    ).format(**names)
+
+    insert = 'INSERT INTO {index}(rowid, {column}) VALUES (new.id, new.{column});'.format(**names)
+    delete = "INSERT INTO {index}({index}, rowid, {column}) VALUES ('delete', old.id, old.{column});".format(**names)
+    trigger = 'CREATE TRIGGER IF NOT EXISTS {index}_{name} AFTER {event} ON {table} BEGIN {body} END'
+    yield trigger.format(name='insert', event='INSERT', body=insert, **names)
+    yield trigger.format(name='delete', event='DELETE', body=delete, **names)
+    yield trigger.format(name='update', event='UPDATE OF {column}'.format(**names), body=delete + ' ' + insert, **names)
+
+    # Fill the index with the rows that are already in the table
+    yield "INSERT INTO {index}({index}) VALUES ('rebuild')".format(**names)
+
+
+def _iterate_sqlite_drop(search_column: SearchColumn) -> Iterable[str]:
+    index = search_column.index_name
+    for event in ('insert', 'delete', 'update'):
+        yield 'DROP TRIGGER IF EXISTS {}_{}'.format(index, event)
+    yield 'DROP TABLE IF EXISTS {}'.format(index)
+
+
+def _iterate_postgresql_create(search_column: SearchColumn) -> Iterable[str]:
+    yield 'CREATE EXTENSION IF NOT EXISTS pg_trgm'
+    yield 'CREATE INDEX IF NOT EXISTS {} ON {} USING gin ({} gin_trgm_ops)'.format(
+        search_column.index_name, search_column.table_name, search_column.column_name,
+    )
+
+
+def _iterate_postgresql_drop(search_column: SearchColumn) -> Iterable[str]:
+    yield 'DROP INDEX IF EXISTS {}'.format(search_column.index_name)
+
+
+def get_create_statements(dialect: str) -> List[str]:
+    """Get the SQL statements that create the search indexes for the given dialect."""
+    iterate = _iterate_sqlite_create if dialect == SQLITE else _iterate_postgresql_create
+    return [
+        statement
+        for search_column in SEARCH_COLUMNS.values()
+        for statement in iterate(search_column)
+    ]
+
+
+def get_drop_statements(dialect: str) -> List[str]:
+    """Get the SQL statements that drop the search indexes for the given dialect."""
+    iterate = _iterate_sqlite_drop if dialect == SQLITE else _iterate_postgresql_drop
+    return [
+        statement
+        for search_column in SEARCH_COLUMNS.values()
+        for statement in iterate(search_column)
+    ]
+
+
+def get_exists_statement(dialect: str) -> str:
+    """Get a SQL statement that counts how many of the search indexes exist for the given dialect."""
+    names = ', '.join(
+        "'{}'".format(search_column.index_name)
+        for search_column in SEARCH_COLUMNS.values()
+    )
+    if dialect == SQLITE:
+        return "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ({})".format(names)
+    return 'SELECT COUNT(*) FROM pg_indexes WHERE indexname IN ({})'.format(names)
@@ -2,7 +2,8 @@
 
 """Utilities for the PyBEL database manager."""
 
-from typing import Dict, Mapping, Optional, Tuple, Union
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Mapping, MutableMapping, NamedTuple, Optional, Tuple, Union
 
 from ..utils import parse_datetime
 
@@ -64,3 +65,81 @@ def int_or_str(v: Optional[str]) -> Union[None, int, str]:
         return int(v)
     except ValueError:
         return v
+
+
+class ObjectCacheInfo(NamedTuple):
+    """Statistics about an object cache, like :func:`functools.lru_cache`'s ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class ObjectCache(MutableMapping[Any, Any]):
+    """A dictionary that evicts its least recently used items when it holds more than a given number of them.
+
+    Looking up an item with ``cache[key]`` or :meth:`get` counts towards the hits and misses reported by
+    :meth:`cache_info`, but checking membership with ``key in cache`` doesn't.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        """Build an empty cache.
+
+        :param maxsize: The maximum number of items to keep. If None, items are never evicted.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __getitem__(self, key):
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key) -> None:
+        del self._data[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def keys(self):  # noqa: D102
+        return self._data.keys()
+
+    def values(self):  # noqa: D102
+        return self._data.values()
+
+    def items(self):  # noqa: D102
+        return self._data.items()
+
+    def clear(self) -> None:
+        """Remove all items from the cache, but keep its statistics."""
+        self._data.clear()
+
+    def cache_info(self) -> ObjectCacheInfo:
+        """Get the hits, misses, maximum size, and current size of the cache."""
+        return ObjectCacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        self._data.clear()
+        self.hits = self.misses = 0
@@ -3,7 +3,7 @@
 """The :mod:`pybel.parser` module contains utilities for parsing BEL documents and BEL statements."""
 
 from .modifiers import *
-from .parse_bel import BELParser
+from .parse_bel import BELParser, get_bel_parser
 from .parse_concept import ConceptParser
 from .parse_control import ControlParser
 from .parse_metadata import MetadataParser
@@ -7,8 +7,11 @@ This module handles parsing BEL relations and validation of semantics.
 
 import itertools as itt
 import logging
+import re
+import threading
+from contextlib import contextmanager
 from functools import lru_cache
-from typing import Any, Dict, List, Mapping, Optional, Pattern, Set, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Pattern, Set, Union
 
 import pyparsing
 from pyparsing import Group, Keyword, MatchFirst, ParseResults, StringEnd, Suppress, delimitedList, oneOf, replaceWith
@@ -22,19 +25,21 @@ from .modifiers import (
 )
 from .parse_concept import ConceptParser
 from .parse_control import ControlParser
+from .term_cache import TermCache, TermCacheInfo
 from .utils import WCW, nest, one_of_tags, triple
 from .. import language
 from ..constants import (
-    ABUNDANCE, ACTIVITY, ASSOCIATION, BINDS, BIOPROCESS, CAUSES_NO_CHANGE, CELL_SECRETION, CELL_SURFACE_EXPRESSION,
-    COMPLEX, COMPOSITE, CONCEPT, CORRELATION, DECREASES, DEGRADATION, DIRECTLY_DECREASES, DIRECTLY_INCREASES, DIRTY,
-    EFFECT, EQUIVALENT_TO, FROM_LOC, FUNCTION, FUSION, GENE, IDENTIFIER, INCREASES, IS_A, LINE, LOCATION, MEMBERS,
-    MIRNA, MODIFIER, NAME, NAMESPACE, NEGATIVE_CORRELATION, NO_CORRELATION, PART_OF, PATHOLOGY, POPULATION,
-    POSITIVE_CORRELATION, PRODUCTS, PROTEIN, REACTANTS, REACTION, REGULATES, RELATION, RNA, SOURCE, TARGET, TO_LOC,
-    TRANSCRIBED_TO, TRANSLATED_TO, TRANSLOCATION, TWO_WAY_RELATIONS, VARIANTS, belns_encodings,
+    ABUNDANCE, ACTIVITY, ANALOGOUS_TO, ASSOCIATION, BINDS, BIOPROCESS, CAUSES_NO_CHANGE, CELL_SECRETION,
+    CELL_SURFACE_EXPRESSION, COMPLEX, COMPOSITE, CONCEPT, CORRELATION, DECREASES, DEGRADATION, DIRECTLY_DECREASES,
+    DIRECTLY_INCREASES, DIRTY, EFFECT, EQUIVALENT_TO, FROM_LOC, FUNCTION, FUSION, GENE, IDENTIFIER, INCREASES, IS_A,
+    LINE, LOCATION, MEMBERS, MIRNA, MODIFIER, NAME, NAMESPACE, NEGATIVE_CORRELATION, NO_CORRELATION, ORTHOLOGOUS,
+    PART_OF, PATHOLOGY, POPULATION, POSITIVE_CORRELATION, PRODUCTS, PROTEIN, REACTANTS, REACTION, REGULATES, RELATION,
+    RNA, SOURCE, TARGET, TO_LOC, TRANSCRIBED_TO, TRANSLATED_TO, TRANSLOCATION, TWO_WAY_RELATIONS, VARIANTS,
+    belns_encodings,
 )
 from ..dsl import BaseEntity
 from ..exceptions import (
-    InvalidEntity, InvalidFunctionSemantic, MalformedTranslocationWarning, MissingAnnotationWarning,
+    BELParserWarning, InvalidEntity, InvalidFunctionSemantic, MalformedTranslocationWarning, MissingAnnotationWarning,
     MissingCitationException, MissingSupportWarning, NestedRelationWarning,
 )
 from ..struct.graph import BELGraph
@@ -42,6 +47,7 @@ from ..tokens import parse_result_to_dsl
 
 __all__ = [
     'BELParser',
+    'get_bel_parser',
     'modifier_po_to_dict',
     'parse',
 ]
@@ -231,6 +237,73 @@ equivalent_tag = one_of_tags(['eq', EQUIVALENT_TO], EQUIVALENT_TO)
 #: The ``partOf`` relationship has been proposed for BEL 2.0.0+
 partof_tag = Keyword(PART_OF)
 
+#############
+# Fast Path #
+#############
+
+#: The functions whose terms can be written as ``f(NS:name)``
+_SIMPLE_FUNCTIONS = {
+    'a': ABUNDANCE,
+    'abundance': ABUNDANCE,
+    'complex': COMPLEX,
+    'complexAbundance': COMPLEX,
+    'g': GENE,
+    'geneAbundance': GENE,
+    'm': MIRNA,
+    'microRNAAbundance': MIRNA,
+    'p': PROTEIN,
+    'proteinAbundance': PROTEIN,
+    'r': RNA,
+    'rnaAbundance': RNA,
+    'pop': POPULATION,
+    'populationAbundance': POPULATION,
+    'bp': BIOPROCESS,
+    'biologicalProcess': BIOPROCESS,
+    'o': PATHOLOGY,
+    'path': PATHOLOGY,
+    'pathology': PATHOLOGY,
+}
+
+#: The tags for the relations that can be used between any two BEL terms
+_SIMPLE_RELATIONS = {
+    '--': ASSOCIATION,
+    'association': ASSOCIATION,
+    '->': INCREASES,
+    '→': INCREASES,
+    'increases': INCREASES,
+    '-|': DECREASES,
+    'decreases': DECREASES,
+    '=>': DIRECTLY_INCREASES,
+    '⇒': DIRECTLY_INCREASES,
+    'directlyIncreases': DIRECTLY_INCREASES,
+    '=|': DIRECTLY_DECREASES,
+    'directlyDecreases': DIRECTLY_DECREASES,
+    'pos': POSITIVE_CORRELATION,
+    'positiveCorrelation': POSITIVE_CORRELATION,
+    'neg': NEGATIVE_CORRELATION,
+    'negativeCorrelation': NEGATIVE_CORRELATION,
+    'cor': CORRELATION,
+    'correlation': CORRELATION,
+    'noCor': NO_CORRELATION,
+    'noCorrelation': NO_CORRELATION,
+    'cnc': CAUSES_NO_CHANGE,
+    'causesNoChange': CAUSES_NO_CHANGE,
+    'reg': REGULATES,
+    'regulates': REGULATES,
+    'eq': EQUIVALENT_TO,
+    EQUIVALENT_TO: EQUIVALENT_TO,
+    BINDS: BINDS,
+    ORTHOLOGOUS: ORTHOLOGOUS,
+    IS_A: IS_A,
+    PART_OF: PART_OF,
+    ANALOGOUS_TO: ANALOGOUS_TO,
+}
+
+_SIMPLE_TERM = r'([A-Za-z]+)\(([A-Za-z0-9]+):(?:([A-Za-z0-9]+)|"([^"\\]*)")\)'
+
+#: Matches statements like ``p(HGNC:AKT1) -> bp(GO:"apoptotic process")`` that can skip the full grammar
+SIMPLE_STATEMENT_RE = re.compile(r'^\s*{term}\s+(\S+)\s+{term}\s*$'.format(term=_SIMPLE_TERM))
+
 
 class BELParser(BaseParser):
     """Build a parser backed by a given dictionary of namespaces."""
@@ -250,6 +323,8 @@ class BELParser(BaseParser):
         skip_validation: bool = False,
         autostreamline: bool = True,
         required_annotations: Optional[List[str]] = None,
+        term_cache_size: int = 4096,
+        use_fast_path: bool = True,
     ) -> None:
         """Build a BEL parser.
 
@@ -273,12 +348,38 @@ class BELParser(BaseParser):
          Delegated to :class:`pybel.parser.ControlParser`
         :param autostreamline: Should the parser be streamlined on instantiation?
         :param required_annotations: Optional list of required annotations
+        :param term_cache_size: The number of distinct terms whose parse results and nodes are cached. Set to 0
+         to disable the cache. See :class:`pybel.parser.term_cache.TermCache`.
+        :param use_fast_path: Should statements like ``f(NS:name) relation f(NS:name)`` be handled with a regular
+         expression instead of the full grammar? Anything the regular expression can't handle without raising a
+         warning still goes through the full grammar, so the results are the same either way.
         """
         self.graph = graph
         self.metagraph = set()
+        self._has_graph = graph is not None
+
+        #: The settings used to build this parser (except the graph), so it can be rebuilt in worker processes
+        self.parser_kwargs = dict(
+            namespace_to_term_to_encoding=namespace_to_term_to_encoding,
+            namespace_to_pattern=namespace_to_pattern,
+            annotation_to_term=annotation_to_term,
+            annotation_to_pattern=annotation_to_pattern,
+            annotation_to_local=annotation_to_local,
+            allow_naked_names=allow_naked_names,
+            disallow_nested=disallow_nested,
+            disallow_unqualified_translocations=disallow_unqualified_translocations,
+            citation_clearing=citation_clearing,
+            skip_validation=skip_validation,
+            autostreamline=autostreamline,
+            required_annotations=required_annotations,
+            term_cache_size=term_cache_size,
+            use_fast_path=use_fast_path,
+        )
 
         self.disallow_nested = disallow_nested
         self.disallow_unqualified_translocations = disallow_unqualified_translocations
+        self.skip_validation = skip_validation
+        self.use_fast_path = use_fast_path
 
         if skip_validation:
             self.control_parser = ControlParser(
@@ -520,6 +621,12 @@ class BELParser(BaseParser):
 
         self.bel_term = MatchFirst([self.transformation, self.process, self.abundance]).streamline()
 
+        if term_cache_size:
+            self.term_cache = TermCache(self.bel_term, maxsize=term_cache_size)
+            self.bel_term = self.term_cache
+        else:
+            self.term_cache = None
+
         self.bel_to_bel_relations = [
             association_tag,
             increases_tag,
@@ -656,6 +763,79 @@ class BELParser(BaseParser):
 
         super(BELParser, self).__init__(self.language, streamline=autostreamline)
 
+    def parseString(self, line: str, line_number: int = 0) -> ParseResults:  # noqa: N802
+        """Parse a string, using the fast path for simple statements when it's enabled."""
+        if self.term_cache is not None:
+            self.term_cache.clear_results()
+
+        if self.use_fast_path and self.graph is not None:
+            match = SIMPLE_STATEMENT_RE.match(line)
+            if match is not None:
+                self._line_number = line_number
+                tokens = self._handle_simple_statement(line, match)
+                if tokens is not None:
+                    return tokens
+
+        return super().parseString(line, line_number=line_number)
+
+    def _handle_simple_statement(self, line: str, match) -> Optional[ParseResults]:
+        """Add the edge for a statement matched by :data:`SIMPLE_STATEMENT_RE`.
+
+        Returns None without changing the graph if the statement should go through the full grammar instead,
+        like when it would raise a warning.
+        """
+        relation = _SIMPLE_RELATIONS.get(match.group(5))
+        if relation is None:
+            return
+
+        source = self._get_simple_term(line, match.group(1, 2, 3, 4))
+        if source is None:
+            return
+
+        target = self._get_simple_term(line, match.group(6, 7, 8, 9))
+        if target is None:
+            return
+
+        if (
+            not self.control_parser.citation_is_set
+            or not self.control_parser.evidence
+            or self.control_parser.get_missing_required_annotations()
+        ):
+            return
+
+        tokens = ParseResults.from_dict({
+            SOURCE: source,
+            RELATION: relation,
+            TARGET: target,
+        })
+        self._handle_relation(tokens)
+        return tokens
+
+    def _get_simple_term(self, line: str, groups) -> Optional[Dict[str, Any]]:
+        func, namespace, name, quoted_name = groups
+        func = _SIMPLE_FUNCTIONS.get(func)
+        if func is None:
+            return
+
+        if name is None:
+            name = quoted_name
+
+        rv = {
+            FUNCTION: func,
+            CONCEPT: {
+                NAMESPACE: namespace,
+                NAME: name,
+            },
+        }
+        try:
+            if not self.skip_validation:
+                self.concept_parser.raise_for_missing_name(line, 0, namespace, name)
+            self.check_function_semantics(line, 0, rv)
+        except BELParserWarning:
+            return
+
+        return rv
+
     def parse(self, s: str) -> Mapping[str, Any]:
         """Parse the string."""
         return self.parseString(s).asDict()
@@ -670,10 +850,86 @@ class BELParser(BaseParser):
         """Return if naked names should be parsed (``True``), or if errors should be thrown (``False``)."""
         return self.concept_parser.allow_naked_names
 
+    def get_term_cache_info(self) -> Optional[TermCacheInfo]:
+        """Get the hits, misses, maximum size, and current size of the term cache, if it's enabled."""
+        if self.term_cache is not None:
+            return self.term_cache.cache_info()
+
     def get_annotations(self) -> Dict:
         """Get the current annotations in this parser."""
         return self.control_parser.get_annotations()
 
+    def rebind(
+        self,
+        graph: Optional[BELGraph] = None,
+        namespace_to_term_to_encoding: Optional[NamespaceTermEncodingMapping] = None,
+        namespace_to_pattern: Optional[Mapping[str, Pattern]] = None,
+        annotation_to_term: Optional[Mapping[str, Set[str]]] = None,
+        annotation_to_pattern: Optional[Mapping[str, Pattern]] = None,
+        annotation_to_local: Optional[Mapping[str, Set[str]]] = None,
+        disallow_nested: bool = False,
+        citation_clearing: bool = True,
+        required_annotations: Optional[List[str]] = None,
+    ) -> None:
+        """Reuse this parser's grammar for a new graph and terminologies.
+
+        This resets the control parser data (current citation, annotations, and statement group), but doesn't
+        clear the old graph. The options that change the structure of the grammar, like ``skip_validation`` and
+        ``allow_naked_names``, can't be changed. Parameters are the same as for :class:`BELParser`.
+
+        :raises ValueError: if the parser was built without a graph and is rebound to one, or vice versa
+        """
+        if (graph is not None) != self._has_graph:
+            raise ValueError('can not rebind a parser between having a graph and not having a graph')
+
+        self.graph = graph
+        self.metagraph = set()
+        self.disallow_nested = disallow_nested
+
+        self.control_parser.citation_clearing = citation_clearing
+        self.control_parser.required_annotations = required_annotations or []
+        if not self.skip_validation:
+            self.control_parser.set_annotations(annotation_to_term, annotation_to_pattern, annotation_to_local)
+            self.concept_parser.set_namespaces(namespace_to_term_to_encoding, namespace_to_pattern)
+            if self.term_cache is not None:  # cached terms were validated against the old namespaces
+                self.term_cache.cache_clear()
+
+        self.control_parser.clear()
+        self._line_number = 0
+
+        self.parser_kwargs.update(
+            namespace_to_term_to_encoding=namespace_to_term_to_encoding,
+            namespace_to_pattern=namespace_to_pattern,
+            annotation_to_term=annotation_to_term,
+            annotation_to_pattern=annotation_to_pattern,
+            annotation_to_local=annotation_to_local,
+            disallow_nested=disallow_nested,
+            citation_clearing=citation_clearing,
+            required_annotations=required_annotations,
+        )
+
+    def unbind(self) -> None:
+        """Drop the references to the graph and terminologies so they can be garbage collected.
+
+        The grammar is kept, so the parser can't be used again until it's given a new graph and terminologies
+        with :meth:`rebind`.
+        """
+        self.graph = None
+        self.metagraph = set()
+        if not self.skip_validation:
+            self.control_parser.set_annotations()
+            self.concept_parser.set_namespaces()
+        if self.term_cache is not None:
+            self.term_cache.cache_clear()
+        self.control_parser.clear()
+        self.parser_kwargs.update(
+            namespace_to_term_to_encoding=None,
+            namespace_to_pattern=None,
+            annotation_to_term=None,
+            annotation_to_pattern=None,
+            annotation_to_local=None,
+        )
+
     def clear(self):
         """Clear the graph and all control parser data (current citation, annotations, and statement group)."""
         if self.graph is not None:
@@ -886,7 +1142,13 @@ class BELParser(BaseParser):
 
     def ensure_node(self, tokens: ParseResults) -> BaseEntity:
         """Turn parsed tokens into canonical node name and makes sure its in the graph."""
-        node = parse_result_to_dsl(tokens)
+        entry = None if self.term_cache is None else self.term_cache.get_entry(tokens)
+        if entry is None:
+            node = parse_result_to_dsl(tokens)
+        elif entry.node is None:
+            node = entry.node = parse_result_to_dsl(tokens)
+        else:
+            node = entry.node
         self.graph.add_node_from_data(node)
         return node
 
@@ -992,6 +1254,70 @@ def modifier_po_to_dict(tokens):
     return attrs
 
 
+_parsers = threading.local()
+
+
+@contextmanager
+def get_bel_parser(
+    graph: Optional[BELGraph] = None,
+    *,
+    allow_naked_names: bool = False,
+    disallow_unqualified_translocations: bool = False,
+    skip_validation: bool = False,
+    autostreamline: bool = True,
+    term_cache_size: int = 4096,
+    use_fast_path: bool = True,
+    **kwargs
+) -> Iterator[BELParser]:
+    """Borrow a BEL parser for the graph, reusing a grammar already built with the same options in this thread.
+
+    Building a :class:`BELParser` takes a few seconds, most of which is spent streamlining its grammar. This
+    keeps one parser for each combination of the options that change the structure of the grammar, then
+    uses :meth:`BELParser.rebind` to point it at the given graph and terminologies (passed as keyword
+    arguments) on later calls.
+
+    While it's borrowed, the parser is taken out of the cache, so it's never shared. Other calls in the same
+    thread, like ones made while a generator that parses lazily is still being consumed, build their own parser.
+    Afterwards, the parser is unbound with :meth:`BELParser.unbind` so it doesn't keep the graph and
+    terminologies alive, then put back in the cache.
+
+    .. code-block:: python
+
+        with get_bel_parser(graph, namespace_to_pattern={'HGNC': re.compile('.*')}) as parser:
+            parser.parseString('p(HGNC:AKT1) -> p(HGNC:EGFR)')
+    """
+    key = (
+        graph is None,
+        allow_naked_names,
+        disallow_unqualified_translocations,
+        skip_validation,
+        autostreamline,
+        term_cache_size,
+        use_fast_path,
+    )
+    cache = _parsers.__dict__.setdefault('cache', {})
+    parser = cache.pop(key, None)
+    if parser is None:
+        parser = BELParser(
+            graph=graph,
+            allow_naked_names=allow_naked_names,
+            disallow_unqualified_translocations=disallow_unqualified_translocations,
+            skip_validation=skip_validation,
+            autostreamline=autostreamline,
+            term_cache_size=term_cache_size,
+            use_fast_path=use_fast_path,
+            **kwargs,
+        )
+    else:
+        parser.rebind(graph, **kwargs)
+
+    try:
+        yield parser
+    finally:
+        parser.unbind()
+        cache.setdefault(key, parser)
+
+
 @lru_cache()
 def _default_parser():
     return BELParser(skip_validation=True, citation_clearing=False)
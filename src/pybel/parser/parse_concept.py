@@ -11,6 +11,7 @@ from pyparsing import ParseResults, Suppress
 
 from .baseparser import BaseParser
 from .constants import NamespaceTermEncodingMapping
+from .term_index import TermIndex
 from .utils import quote, word
 from ..constants import DIRTY, IDENTIFIER, NAME, NAMESPACE
 from ..exceptions import (
@@ -56,28 +57,13 @@ class ConceptParser(BaseParser):
         )
         self.identifier_qualified = word(NAMESPACE) + Suppress(':') + (word | quote)(NAME)
 
-        if namespace_to_term_to_encoding is not None:
-            self.namespace_to_name_to_encoding = defaultdict(dict)
-            self.namespace_to_identifier_to_encoding = defaultdict(dict)
-            for namespace, term_mapping in namespace_to_term_to_encoding.items():
-                for (identifier, name), encoding in term_mapping.items():
-                    self.namespace_to_name_to_encoding[namespace][name] = encoding
-                    self.namespace_to_identifier_to_encoding[namespace][identifier] = encoding
-
-            self.namespace_to_name_to_encoding = dict(self.namespace_to_name_to_encoding)
-            self.namespace_to_identifier_to_encoding = dict(self.namespace_to_identifier_to_encoding)
-        else:
-            self.namespace_to_name_to_encoding = {}
-            self.namespace_to_identifier_to_encoding = {}
+        self.ensure_go = ensure_go
+        self.set_namespaces(namespace_to_term_to_encoding, namespace_to_pattern)
 
         if not skip_validation:
             self.identifier_fqualified.setParseAction(self.handle_identifier_fqualified)
             self.identifier_qualified.setParseAction(self.handle_identifier_qualified)
 
-        self.namespace_to_pattern = namespace_to_pattern or {}
-        if ensure_go and 'go' not in self.namespace_to_name_to_encoding:
-            self.namespace_to_pattern['go'] = re.compile(r'^\d+$')
-
         self.default_namespace = set(default_namespace) if default_namespace is not None else None
         self.allow_naked_names = allow_naked_names
 
@@ -92,6 +78,38 @@ class ConceptParser(BaseParser):
             self.identifier_fqualified | self.identifier_qualified | self.identifier_bare,
         )
 
+    def set_namespaces(
+        self,
+        namespace_to_term_to_encoding: Optional[NamespaceTermEncodingMapping] = None,
+        namespace_to_pattern: Optional[Mapping[str, Pattern]] = None,
+    ) -> None:
+        """Replace the namespaces used to validate concepts.
+
+        :param namespace_to_term_to_encoding: A dictionary of {namespace: {(identifier, name): encoding}}
+        :param namespace_to_pattern: A dictionary of {namespace: regular expression string} to compile
+        """
+        if namespace_to_term_to_encoding is not None:
+            self.namespace_to_name_to_encoding = defaultdict(dict)
+            self.namespace_to_identifier_to_encoding = defaultdict(dict)
+            for namespace, term_mapping in namespace_to_term_to_encoding.items():
+                if isinstance(term_mapping, TermIndex):  # use its memory-mapped lookups instead of copying them
+                    self.namespace_to_name_to_encoding[namespace] = term_mapping.names
+                    self.namespace_to_identifier_to_encoding[namespace] = term_mapping.identifiers
+                    continue
+                for (identifier, name), encoding in term_mapping.items():
+                    self.namespace_to_name_to_encoding[namespace][name] = encoding
+                    self.namespace_to_identifier_to_encoding[namespace][identifier] = encoding
+
+            self.namespace_to_name_to_encoding = dict(self.namespace_to_name_to_encoding)
+            self.namespace_to_identifier_to_encoding = dict(self.namespace_to_identifier_to_encoding)
+        else:
+            self.namespace_to_name_to_encoding = {}
+            self.namespace_to_identifier_to_encoding = {}
+
+        self.namespace_to_pattern = dict(namespace_to_pattern or {})
+        if self.ensure_go and 'go' not in self.namespace_to_name_to_encoding:
+            self.namespace_to_pattern['go'] = re.compile(r'^\d+$')
+
     def has_enumerated_namespace(self, namespace: str) -> bool:
         """Check that the namespace has been defined by an enumeration."""
         return namespace in self.namespace_to_name_to_encoding
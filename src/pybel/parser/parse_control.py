@@ -70,9 +70,7 @@ class ControlParser(BaseParser):
         """
         self.citation_clearing = citation_clearing
 
-        self.annotation_to_term = annotation_to_term or {}
-        self.annotation_to_pattern = annotation_to_pattern or {}
-        self.annotation_to_local = annotation_to_local or {}
+        self.set_annotations(annotation_to_term, annotation_to_pattern, annotation_to_local)
 
         self.statement_group = None
         self.citation_db = None
@@ -84,8 +82,8 @@ class ControlParser(BaseParser):
         annotation_key = ppc.identifier('key').setParseAction(self.handle_annotation_key)
 
         self.set_statement_group = set_statement_group_stub().setParseAction(self.handle_set_statement_group)
-        self.set_citation = set_citation_stub.setParseAction(self.handle_set_citation)
-        self.set_evidence = set_evidence_stub.setParseAction(self.handle_set_evidence)
+        self.set_citation = set_citation_stub.copy().setParseAction(self.handle_set_citation)
+        self.set_evidence = set_evidence_stub.copy().setParseAction(self.handle_set_evidence)
 
         set_command_prefix = And([annotation_key('key'), Suppress('=')])
         self.set_command = set_command_prefix + qid('value')
@@ -109,7 +107,7 @@ class ControlParser(BaseParser):
         self.unset_list = delimited_unquoted_list('values')
         self.unset_list.setParseAction(self.handle_unset_list)
 
-        self.unset_all = unset_all.setParseAction(self.handle_unset_all)
+        self.unset_all = unset_all.copy().setParseAction(self.handle_unset_all)
 
         self.set_statements = set_tag('action') + MatchFirst([
             self.set_statement_group,
@@ -132,6 +130,22 @@ class ControlParser(BaseParser):
 
         super(ControlParser, self).__init__(self.language)
 
+    def set_annotations(
+        self,
+        annotation_to_term: Optional[Mapping[str, Set[str]]] = None,
+        annotation_to_pattern: Optional[Mapping[str, Pattern]] = None,
+        annotation_to_local: Optional[Mapping[str, Set[str]]] = None,
+    ) -> None:
+        """Replace the annotations used to validate control statements.
+
+        :param annotation_to_term: A dictionary of {annotation: set of valid values} defined with URL for parsing
+        :param annotation_to_pattern: A dictionary of {annotation: regular expression string}
+        :param annotation_to_local: A dictionary of {annotation: set of valid values} for parsing defined with LIST
+        """
+        self.annotation_to_term = annotation_to_term or {}
+        self.annotation_to_pattern = annotation_to_pattern or {}
+        self.annotation_to_local = annotation_to_local or {}
+
     @property
     def _in_debug_mode(self) -> bool:
         return not self.annotation_to_term and not self.annotation_to_pattern
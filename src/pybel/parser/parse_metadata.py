@@ -190,20 +190,23 @@ class MetadataParser(BaseParser):
 
         self.raise_for_redefined_namespace(line, position, namespace_keyword)
 
-        url = tokens['url']
-        if self.upgrade_urls and namespace_keyword.lower() in keyword_to_url:
-            url = keyword_to_url[namespace_keyword.lower()]
-
+        url = self.get_namespace_url(namespace_keyword, tokens['url'])
         self.namespace_url_dict[namespace_keyword] = url
 
         if self.skip_validation:
             return tokens
 
         namespace = self.manager.get_or_create_namespace(url)
-        self.namespace_to_term_to_encoding[namespace_keyword] = namespace.get_term_to_encodings()
+        self.namespace_to_term_to_encoding[namespace_keyword] = self.manager.get_namespace_terms(namespace)
 
         return tokens
 
+    def get_namespace_url(self, keyword: str, url: str) -> str:
+        """Get the URL that will be used for a namespace, upgrading it if this parser was configured to."""
+        if self.upgrade_urls and keyword.lower() in keyword_to_url:
+            return keyword_to_url[keyword.lower()]
+        return url
+
     def handle_namespace_pattern(self, line: str, position: int, tokens: ParseResults) -> ParseResults:
         """Handle statements like ``DEFINE NAMESPACE X AS PATTERN "Y"``.
 
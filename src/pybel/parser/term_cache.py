@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""A bounded cache of parsed BEL terms.
+
+Large BEL documents repeat the same terms many times, and each term is often parsed several times
+per statement while PyParsing tries the alternative relations. :class:`TermCache` wraps the BEL term
+grammar and memoizes its results by the raw text of each term, so repeated terms skip the grammar
+and their parse actions. Only successful parses are cached, so warnings are raised exactly as before.
+"""
+
+import re
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from pyparsing import ParseElementEnhance, ParseResults, ParserElement
+
+from ..dsl import BaseEntity
+
+__all__ = [
+    'TermCache',
+    'TermCacheInfo',
+]
+
+_TERM_START = re.compile(r'\s*([A-Za-z]+\s*\()')
+
+
+class TermCacheInfo(NamedTuple):
+    """Statistics about a term cache, like :func:`functools.lru_cache`'s ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _TermCacheEntry:
+    """The parse results for a term and the node made from them, once one has been."""
+
+    __slots__ = ('tokens', 'node')
+
+    def __init__(self, tokens: ParseResults) -> None:
+        self.tokens = tokens
+        self.node: Optional[BaseEntity] = None
+
+
+def _scan_term(instring: str, loc: int) -> Optional[Tuple[int, int]]:
+    """Find the start and end of the term at the given location by matching its parentheses."""
+    match = _TERM_START.match(instring, loc)
+    if match is None:
+        return None
+
+    depth = 1
+    in_quote = False
+    i = match.end()
+    length = len(instring)
+    while i < length:
+        c = instring[i]
+        if in_quote:
+            if c == '\\':
+                i += 1
+            elif c == '"':
+                in_quote = False
+        elif c == '"':
+            in_quote = True
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+            if depth == 0:
+                return match.start(1), i + 1
+        i += 1
+
+    return None
+
+
+class TermCache(ParseElementEnhance):
+    """Wrap a grammar for BEL terms with a bounded, least recently used cache keyed by the raw term.
+
+    The parse results it returns are copies, so parse actions can change them. Each copy is mapped to its entry by
+    its ``id`` until :meth:`clear_results` is called, which should happen before each statement is parsed. The entry
+    isn't stored on the copy itself since :class:`pyparsing.ParseResults` has ``__slots__`` from PyParsing 3.
+    """
+
+    def __init__(self, expr: ParserElement, maxsize: int = 4096) -> None:
+        """Wrap the grammar.
+
+        :param expr: The grammar for BEL terms. It must not depend on any state besides the text of the term.
+        :param maxsize: The maximum number of terms to keep
+        """
+        super().__init__(expr)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._results: Dict[int, Tuple[ParseResults, _TermCacheEntry]] = {}
+
+    def parseImpl(self, instring, loc, doActions=True):  # noqa: D102,N802
+        span = _scan_term(instring, loc)
+        if span is None:
+            return self.expr._parse(instring, loc, doActions, callPreParse=False)
+
+        start, end = span
+        term = instring[start:end]
+        entry = self._entries.get(term)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(term)
+        else:
+            self.misses += 1
+            result_loc, tokens = self.expr._parse(instring, loc, doActions, callPreParse=False)
+            if result_loc != end or not doActions:
+                return result_loc, tokens
+            entry = self._entries[term] = _TermCacheEntry(tokens)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        rv = entry.tokens.copy()
+        self._results[id(rv)] = rv, entry
+        return end, rv
+
+    def get_entry(self, tokens: ParseResults) -> Optional[_TermCacheEntry]:
+        """Get the cache entry for parse results returned by this cache since the last :meth:`clear_results`."""
+        result = self._results.get(id(tokens))
+        if result is None or result[0] is not tokens:
+            return None
+        return result[1]
+
+    def clear_results(self) -> None:
+        """Forget the parse results returned so far, so they can be garbage collected."""
+        self._results.clear()
+
+    def cache_info(self) -> TermCacheInfo:
+        """Get the hits, misses, maximum size, and current size of the cache."""
+        return TermCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        self._entries.clear()
+        self._results.clear()
+        self.hits = self.misses = 0
+
+    def __str__(self):  # noqa: D105
+        return str(self.expr)
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+"""Compact, read-only indexes of the terms in a namespace.
+
+Each document that defines a namespace by URL needs a lookup table from the namespace's names and identifiers
+to their encodings. Building these as dictionaries from the cache database takes a while for big namespaces
+and has to be repeated in every process. A :class:`TermIndex` stores the terms in a file of sorted arrays that
+is memory-mapped, so it opens instantly and the operating system shares its pages between all of the processes
+that use it. Lookups are binary searches.
+
+The file is laid out as a header followed by these arrays, with integers in the native byte order:
+
+1. The offsets of the names in the string section, in order of their UTF-8 bytes (``n + 1`` unsigned longs)
+2. The offsets of the identifiers in the string section, where empty ones stand for missing identifiers
+   (``n + 1`` unsigned longs)
+3. The positions of the terms in order of their identifiers' UTF-8 bytes (``n`` unsigned longs)
+4. The encodings, padded to the length of the longest one
+5. The strings
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from threading import Lock
+from typing import Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from .constants import Term, TermEncodingMapping
+
+__all__ = [
+    'TermIndex',
+    'get_term_index',
+]
+
+_MAGIC = b'PYBELTI1' if sys.byteorder == 'little' else b'PYBELTIB'
+_HEADER = struct.Struct('8sQQ')
+
+
+class _TermIndexView(Mapping[str, str]):
+    """A read-only mapping from either the names or the identifiers in a term index to their encodings."""
+
+    def __init__(self, index: 'TermIndex', by_identifier: bool) -> None:
+        self._index = index
+        self._by_identifier = by_identifier
+
+    def __getitem__(self, key: str) -> str:
+        position = self._index._find(key, self._by_identifier)
+        if position is None:
+            raise KeyError(key)
+        return self._index._get_encoding(position)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self._index._find(key, self._by_identifier) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        if self._by_identifier:
+            for position in self._index._identifier_order:
+                identifier = self._index._get_identifier(position)
+                if identifier is not None:
+                    yield identifier
+        else:
+            for position in range(len(self._index)):
+                yield self._index._get_name(position)
+
+    def __len__(self) -> int:
+        if self._by_identifier:
+            return self._index._number_identifiers
+        return len(self._index)
+
+
+class TermIndex(Mapping[Term, str]):
+    """A read-only mapping from the (identifier, name) pairs in a namespace to their encodings, stored in a file.
+
+    The :attr:`names` and :attr:`identifiers` attributes are mappings from just the names or identifiers to their
+    encodings, which are used by :class:`pybel.parser.ConceptParser` instead of building its own dictionaries.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open a term index that was written with :meth:`TermIndex.build`.
+
+        :raises ValueError: if the file isn't a term index written on a machine with the same byte order
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, n, self._encoding_size = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC:
+            raise ValueError('not a term index for this platform: {}'.format(path))
+
+        buffer = memoryview(self._mmap)
+        start = _HEADER.size
+        offsets_size = (n + 1) * 8
+        self._name_offsets = buffer[start:start + offsets_size].cast('Q')
+        start += offsets_size
+        self._identifier_offsets = buffer[start:start + offsets_size].cast('Q')
+        start += offsets_size
+        self._identifier_order = buffer[start:start + n * 8].cast('Q')
+        start += n * 8
+        self._encodings = buffer[start:start + n * self._encoding_size]
+        start += n * self._encoding_size
+        self._strings = buffer[start:]
+        self._length = n
+
+        # Identifiers that are missing are empty, so they're sorted at the front
+        self._first_identifier = 0
+        while (
+            self._first_identifier < n
+            and self._identifier_length(self._identifier_order[self._first_identifier]) == 0
+        ):
+            self._first_identifier += 1
+        self._number_identifiers = n - self._first_identifier
+
+        #: A read-only mapping from the names in the namespace to their encodings
+        self.names: Mapping[str, str] = _TermIndexView(self, by_identifier=False)
+        #: A read-only mapping from the identifiers in the namespace to their encodings
+        self.identifiers: Mapping[str, str] = _TermIndexView(self, by_identifier=True)
+
+    @classmethod
+    def build(cls, path: str, terms: TermEncodingMapping) -> 'TermIndex':
+        """Write the terms to a term index file then open it.
+
+        The file is written to a temporary file that's moved into place, so other processes never see a partial
+        index.
+
+        :param path: The path to write the term index
+        :param terms: A mapping from (identifier, name) pairs to encodings
+        """
+        rows = sorted(
+            (name.encode('utf-8'), (identifier or '').encode('utf-8'), (encoding or '').encode('ascii'))
+            for (identifier, name), encoding in terms.items()
+        )
+        encoding_size = max((len(encoding) for _, _, encoding in rows), default=0)
+        identifier_order = sorted(range(len(rows)), key=lambda position: rows[position][1])
+
+        strings = bytearray()
+        name_offsets, identifier_offsets = array('Q'), array('Q')
+        for name, _, _ in rows:
+            name_offsets.append(len(strings))
+            strings += name
+        name_offsets.append(len(strings))
+        for _, identifier, _ in rows:
+            identifier_offsets.append(len(strings))
+            strings += identifier
+        identifier_offsets.append(len(strings))
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(_HEADER.pack(_MAGIC, len(rows), encoding_size))
+                file.write(name_offsets.tobytes())
+                file.write(identifier_offsets.tobytes())
+                file.write(array('Q', identifier_order).tobytes())
+                for _, _, encoding in rows:
+                    file.write(encoding.ljust(encoding_size, b'\0'))
+                file.write(strings)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+        return cls(path)
+
+    def __reduce__(self):
+        # Other processes open the same file instead of copying the terms
+        return _open_term_index, (self.path,)
+
+    def close(self) -> None:
+        """Close the memory map. The index can't be used after this."""
+        for view in (self._name_offsets, self._identifier_offsets, self._identifier_order):
+            view.release()
+        self._encodings.release()
+        self._strings.release()
+        self._mmap.close()
+
+    def _get_name(self, position: int) -> str:
+        return bytes(self._strings[self._name_offsets[position]:self._name_offsets[position + 1]]).decode('utf-8')
+
+    def _identifier_length(self, position: int) -> int:
+        return self._identifier_offsets[position + 1] - self._identifier_offsets[position]
+
+    def _get_identifier(self, position: int) -> Optional[str]:
+        start, end = self._identifier_offsets[position], self._identifier_offsets[position + 1]
+        if start == end:
+            return None
+        return bytes(self._strings[start:end]).decode('utf-8')
+
+    def _get_encoding(self, position: int) -> str:
+        start = position * self._encoding_size
+        return bytes(self._encodings[start:start + self._encoding_size]).rstrip(b'\0').decode('ascii')
+
+    def _find(self, key: str, by_identifier: bool) -> Optional[int]:
+        """Find the position of the term with the given name or identifier with a binary search."""
+        target = key.encode('utf-8')
+        if by_identifier:
+            if not target:
+                return None
+            offsets, order, lo = self._identifier_offsets, self._identifier_order, self._first_identifier
+        else:
+            offsets, order, lo = self._name_offsets, None, 0
+
+        strings = self._strings
+        hi = self._length
+        while lo < hi:
+            mid = (lo + hi) // 2
+            position = mid if order is None else order[mid]
+            value = bytes(strings[offsets[position]:offsets[position + 1]])
+            if value < target:
+                lo = mid + 1
+            elif value == target:
+                return position
+            else:
+                hi = mid
+        return None
+
+    def __getitem__(self, term: Term) -> str:
+        identifier, name = term
+        position = self._find(name, by_identifier=False)
+        if position is None or self._get_identifier(position) != identifier:
+            raise KeyError(term)
+        return self._get_encoding(position)
+
+    def __iter__(self) -> Iterator[Tuple[Optional[str], str]]:
+        for position in range(self._length):
+            yield self._get_identifier(position), self._get_name(position)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def items(self) -> Iterable[Tuple[Term, str]]:  # noqa: D102
+        for position in range(self._length):
+            yield (self._get_identifier(position), self._get_name(position)), self._get_encoding(position)
+
+
+#: The term indexes that have been opened in this process, by path
+_term_indexes: Dict[str, TermIndex] = {}
+_term_indexes_lock = Lock()
+
+
+def get_term_index(path: str, get_terms: Callable[[], TermEncodingMapping]) -> TermIndex:
+    """Get the term index at the given path, building it with the given function if it doesn't exist yet.
+
+    Indexes are only opened once per process, so all parsers in a process share the same memory map.
+
+    :param path: The path of the term index
+    :param get_terms: A function that returns a mapping from (identifier, name) pairs to encodings
+    """
+    with _term_indexes_lock:
+        rv = _term_indexes.get(path)
+        if rv is None:
+            try:
+                rv = TermIndex(path)
+            except (OSError, ValueError):  # it doesn't exist yet or was written on another platform
+                rv = TermIndex.build(path, get_terms())
+            _term_indexes[path] = rv
+        return rv
+
+
+def _open_term_index(path: str) -> TermIndex:
+    """Get the term index at the given path, opening it if it hasn't been opened in this process yet."""
+    with _term_indexes_lock:
+        rv = _term_indexes.get(path)
+        if rv is None:
+            rv = _term_indexes[path] = TermIndex(path)
+        return rv
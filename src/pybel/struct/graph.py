@@ -402,6 +402,40 @@ class BELGraph(nx.MultiDiGraph):
 
         return key
 
+    def _help_add_edges(self, edges: Iterable[Tuple[BaseEntity, BaseEntity, Mapping[str, Any]]]) -> List[str]:
+        """Help add several pre-built edges, writing directly into the adjacency dictionaries."""
+        keys = []
+
+        def _iterate_keyed_edges():
+            for source, target, attr in edges:
+                key = hash_edge(source, target, attr)
+                keys.append(key)
+                yield source, target, key, attr
+
+        self._help_add_keyed_edges(_iterate_keyed_edges())
+        return keys
+
+    def _help_add_keyed_edges(self, edges: Iterable[Tuple[BaseEntity, BaseEntity, str, Mapping[str, Any]]]) -> None:
+        """Help add several pre-built edges whose keys have already been calculated with :func:`hash_edge`."""
+        adj, pred = self._adj, self._pred
+        for source, target, key, attr in edges:
+            if source not in self:
+                self.add_node_from_data(source)
+            if target not in self:
+                self.add_node_from_data(target)
+
+            keydict = adj[source].get(target)
+            if keydict is None:
+                keydict = self.edge_key_dict_factory()
+                adj[source][target] = keydict
+                pred[target][source] = keydict
+            elif key in keydict:
+                continue
+
+            datadict = self.edge_attr_dict_factory()
+            datadict.update(attr)
+            keydict[key] = datadict
+
     def add_unqualified_edge(self, source: BaseEntity, target: BaseEntity, relation: str) -> str:
         """Add a unique edge that has no annotations.
 
@@ -413,6 +447,19 @@ class BELGraph(nx.MultiDiGraph):
         attr = {RELATION: relation}
         return self._help_add_edge(source=source, target=target, attr=attr)
 
+    def add_unqualified_edges(self, edges: Iterable[Tuple[BaseEntity, BaseEntity, str]]) -> List[str]:
+        """Add several unique edges that have no annotations.
+
+        :param edges: An iterable of triples of the source node, target node, and relation
+        :return: The keys for the edges, in the same order as they were given
+
+        This is equivalent to, but faster than, calling :meth:`add_unqualified_edge` for each triple.
+        """
+        return self._help_add_edges(
+            (source, target, {RELATION: relation})
+            for source, target, relation in edges
+        )
+
     def add_transcription(self, gene: Gene, rna: Union[Rna, MicroRna]) -> str:
         """Add a transcription relation from a gene to an RNA or miRNA node.
 
@@ -501,6 +548,34 @@ class BELGraph(nx.MultiDiGraph):
         )
         return self._help_add_edge(source=source, target=target, attr=attr)
 
+    def add_qualified_edges(self, edges: Iterable[Tuple[BaseEntity, BaseEntity, Mapping[str, Any]]]) -> List[str]:
+        """Add several qualified edges.
+
+        :param edges: An iterable of triples of the source node, target node, and a dictionary of the keyword
+         arguments for :meth:`add_qualified_edge` (``relation``, ``evidence``, ``citation``, and optionally
+         ``annotations``, ``source_modifier``, ``target_modifier``, and any other edge attributes)
+        :return: The keys for the edges, in the same order as they were given
+
+        This is equivalent to, but faster than, calling :meth:`add_qualified_edge` for each triple. Duplicate
+        edges, both within the given edges and with the ones already in the graph, are only added once.
+
+        >>> from pybel import BELGraph
+        >>> from pybel.constants import INCREASES
+        >>> from pybel.dsl import Protein
+        >>> graph = BELGraph()
+        >>> akt1, mapk1 = Protein('hgnc', 'AKT1'), Protein('hgnc', 'MAPK1')
+        >>> keys = graph.add_qualified_edges([
+        ...     (akt1, mapk1, dict(relation=INCREASES, citation='1234', evidence='Some evidence')),
+        ...     (akt1, mapk1, dict(relation=INCREASES, citation='1234', evidence='Some evidence')),
+        ... ])
+        >>> graph.number_of_edges()
+        1
+        """
+        return self._help_add_edges(
+            (source, target, self._build_attr(**kwargs))
+            for source, target, kwargs in edges
+        )
+
     @staticmethod
     def _build_attr(
         relation: str,
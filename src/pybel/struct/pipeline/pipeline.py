@@ -27,6 +27,17 @@ def _get_protocol_tuple(data: Dict[str, Any]) -> Tuple[str, List, Dict]:
     return data['function'], data.get('args', []), data.get('kwargs', {})
 
 
+def _protocol_uses_universe(protocol: Iterable[Dict]) -> bool:
+    """Check if any of the functions in a protocol, including in its meta-entries, need a universe."""
+    for entry in protocol:
+        if entry.get('meta') is None:
+            if entry['function'] in universe_map:
+                return True
+        elif any(_protocol_uses_universe(subprotocol) for subprotocol in entry['pipelines']):
+            return True
+    return False
+
+
 class Pipeline:
     """Build and runs analytical pipelines on BEL graphs.
 
@@ -113,6 +124,10 @@ class Pipeline:
 
         return f
 
+    def uses_universe(self) -> bool:
+        """Check if any of the functions in this pipeline, including in its meta-pipelines, need a universe."""
+        return _protocol_uses_universe(self.protocol)
+
     def append(self, name, *args, **kwargs) -> 'Pipeline':
         """Add a function (either as a reference, or by name) and arguments to the pipeline.
 
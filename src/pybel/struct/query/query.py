@@ -109,23 +109,46 @@ class Query:
         """
         return self.run(manager)
 
-    def run(self, manager):
+    def run(self, manager, push_down: bool = True):
         """Run this query and returns the resulting BEL graph.
 
+        If all of the seeds can be run in the database (see :data:`pybel.manager.query_manager.PUSHDOWN_SEED_TYPES`)
+        and none of the pipeline's functions need the universe, only the edges matching the seeds are loaded from the
+        edge store with :meth:`pybel.manager.QueryManager.get_subgraph_by_seeding`. Otherwise, the seeds are run on the
+        union of the networks' graphs.
+
         :param manager: A cache manager
+        :param push_down: Should the seeds be run in the database when possible?
         :rtype: Optional[pybel.BELGraph]
         """
+        if push_down and self._can_push_down(manager):
+            logger.debug('running seeding in the database over networks: %s', self.network_ids)
+            graph = manager.get_subgraph_by_seeding(self.network_ids, self.seeding)
+            if graph is None:
+                return
+            return self.pipeline.run(graph)
+
         universe = self._get_universe(manager)
         graph = self.seeding.run(universe)
         return self.pipeline.run(graph, universe=universe)
 
+    def _can_push_down(self, manager) -> bool:
+        from ...manager.query_manager import QueryManager
+
+        return (
+            isinstance(manager, QueryManager)
+            and bool(self.network_ids)
+            and manager.can_push_down(self.seeding)
+            and not self.pipeline.uses_universe()
+        )
+
     def _get_universe(self, manager):
         if not self.network_ids:
             raise QueryMissingNetworksError('can not run query without network identifiers')
 
         logger.debug('query universe consists of networks: %s', self.network_ids)
 
-        universe = manager.get_graph_by_ids(self.network_ids)
+        universe = manager.get_universe_by_ids(self.network_ids)
         logger.debug('query universe has %d nodes/%d edges', universe.number_of_nodes(), universe.number_of_edges())
 
         return universe
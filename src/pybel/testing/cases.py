@@ -22,6 +22,14 @@ logger = logging.getLogger(__name__)
 TEST_CONNECTION = config.get('test_connection')
 
 
+def _remove_sqlite_files(path: str) -> None:
+    """Remove an SQLite database and the files next to it used for write-ahead logging."""
+    os.remove(path)
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
 class TemporaryCacheMixin(unittest.TestCase):
     """A test case that has a connection and a manager that is created for each test function."""
 
@@ -40,10 +48,11 @@ class TemporaryCacheMixin(unittest.TestCase):
     def tearDown(self):
         """Tear down the test function by closing the session and removing the database."""
         self.manager.session.close()
+        self.manager.engine.dispose()
 
         if not TEST_CONNECTION:
             os.close(self.fd)
-            os.remove(self.path)
+            _remove_sqlite_files(self.path)
         else:
             self.manager.drop_all()
 
@@ -70,10 +79,11 @@ class TemporaryCacheClsMixin(unittest.TestCase):
     def tearDownClass(cls):
         """Tear down the test class by closing the session and removing the database."""
         cls.manager.session.close()
+        cls.manager.engine.dispose()
 
         if not TEST_CONNECTION:
             os.close(cls.fd)
-            os.remove(cls.path)
+            _remove_sqlite_files(cls.path)
         else:
             cls.manager.drop_all()
 
@@ -64,6 +64,14 @@ class MockQueryManager:
 
         return union(graphs)
 
+    def get_universe_by_ids(self, network_ids: Iterable[int]):
+        """Get a graph from the union of multiple networks. Isn't cached, unlike the real manager.
+
+        :param network_ids: The identifiers of networks in the database
+        :rtype: pybel.BELGraph
+        """
+        return self.get_graph_by_ids(network_ids)
+
     def get_dsl_by_hash(self, md5: str):
         """Get a DSL by its hash.
 
@@ -3,8 +3,14 @@
 """Mocks for PyBEL testing."""
 
 import itertools as itt
+import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Any, List, Mapping
 from unittest import mock
+from urllib.parse import parse_qs
 
 from .constants import bel_dir_path, belanno_dir_path, belns_dir_path
 from .utils import get_uri_name
@@ -13,6 +19,7 @@ __all__ = [
     'MockResponse',
     'MockSession',
     'mock_bel_resources',
+    'MockEUtilsServer',
 ]
 
 _responses = [
@@ -72,3 +79,77 @@ class MockSession:
 
 
 mock_bel_resources = mock.patch('bel_resources.utils.requests.Session', side_effect=MockSession)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class MockEUtilsServer:
+    """A local stand-in for the PubMed E-Utils summary service.
+
+    Answers posted lookups with the given results, like ``d["result"][pmid]``, and an error for the PubMed identifiers
+    it doesn't have. Use it as a context manager and pass its :attr:`url` to
+    :func:`pybel.manager.citation_utils.get_citations_by_pmids`.
+    """
+
+    def __init__(self, results: Mapping[str, Mapping[str, Any]], failures: int = 0) -> None:
+        """Build a stand-in for E-Utils.
+
+        :param results: A dictionary from PubMed identifiers to their results
+        :param failures: The number of requests to answer with 429 Too Many Requests before answering normally
+        """
+        self.results = results
+        self.failures = failures
+        #: The lists of PubMed identifiers in the requests that were answered normally
+        self.requests: List[List[str]] = []
+        self._lock = threading.Lock()
+        self._server = _ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Get the URL of the server."""
+        host, port = self._server.server_address
+        return 'http://{}:{}/esummary.fcgi'.format(host, port)
+
+    def _respond(self, pmids: List[str]):
+        with self._lock:
+            if self.failures:
+                self.failures -= 1
+                return 429, {'error': 'API rate limit exceeded'}
+            self.requests.append(pmids)
+        result = {'uids': pmids}
+        for pmid in pmids:
+            result[pmid] = self.results.get(pmid, {'uid': pmid, 'error': 'cannot get document summary'})
+        return 200, {'result': result}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802
+                length = int(self.headers['Content-Length'])
+                data = parse_qs(self.rfile.read(length).decode('utf-8'))
+                status, body = server._respond(data['id'][0].split(','))
+                content = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                """Don't log requests."""
+
+        return Handler
+
+    def __enter__(self) -> 'MockEUtilsServer':  # noqa: D105
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:  # noqa: D105
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
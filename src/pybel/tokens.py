@@ -12,7 +12,7 @@ from .constants import (
 from .dsl import (
     BaseAbundance, BaseEntity, CentralDogma, EnumeratedFusionRange, FUNC_TO_DSL, FUNC_TO_FUSION_DSL, FUNC_TO_LIST_DSL,
     Fragment, FusionBase, FusionRangeBase, GeneModification, Hgvs, ListAbundance, MissingFusionRange,
-    ProteinModification, Reaction, Variant,
+    ProteinModification, Reaction, Variant, intern_node, is_interning_enabled,
 )
 
 __all__ = [
@@ -23,8 +23,18 @@ __all__ = [
 def parse_result_to_dsl(tokens) -> BaseEntity:
     """Convert a ParseResult to a PyBEL DSL object.
 
+    If interning is enabled with :func:`pybel.dsl.set_interning` or :func:`pybel.dsl.interning`,
+    this returns the shared, frozen instance from the global intern table.
+
     :type tokens: dict or pyparsing.ParseResults
     """
+    rv = _parse_result_to_dsl_helper(tokens)
+    if is_interning_enabled():
+        return intern_node(rv)
+    return rv
+
+
+def _parse_result_to_dsl_helper(tokens) -> BaseEntity:
     # if MODIFIER in tokens:
     #     return parse_result_to_dsl(tokens[TARGET])
     if REACTION == tokens[FUNCTION]:
@@ -10,8 +10,9 @@ import typing
 from collections import defaultdict
 from collections.abc import Iterable, MutableMapping
 from datetime import datetime
-from typing import Any, List, Mapping, Optional, Tuple, TypeVar
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
 
+from .config import config
 from .constants import (
     ACTIVITY, CITATION, DEGRADATION, EFFECT, EVIDENCE, FROM_LOC, IDENTIFIER, LOCATION, MODIFIER, NAME, NAMESPACE,
     RELATION, SOURCE_MODIFIER, TARGET_MODIFIER, TO_LOC, TRANSLOCATION,
@@ -23,6 +24,34 @@ logger = logging.getLogger(__name__)
 CanonicalEdge = Tuple[str, Optional[Tuple], Optional[Tuple]]
 
 
+def _md5_hexdigest(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()  # noqa: S303
+
+
+#: Functions for digesting the bytes of an edge tuple into an edge key. MD5 keys are
+#: compatible with the ones stored by previous versions of PyBEL. XXH3 is a much faster
+#: non-cryptographic digest that's available if the optional ``xxhash`` package is installed.
+EDGE_DIGESTS: Dict[str, Callable[[bytes], str]] = {
+    'md5': _md5_hexdigest,
+}
+
+try:
+    import xxhash
+except ImportError:
+    pass
+else:
+    EDGE_DIGESTS['xxh3'] = xxhash.xxh3_128_hexdigest
+
+#: The pickle protocol used for the edge tuple with digests other than MD5, which
+#: use the default protocol for backwards compatibility
+_EDGE_PICKLE_PROTOCOL = 4
+
+_default_edge_digest = config.get('edge_digest', 'md5')
+if _default_edge_digest not in EDGE_DIGESTS:
+    logger.warning('configured edge digest is not available: %s. Falling back to MD5', _default_edge_digest)
+    _default_edge_digest = 'md5'
+
+
 def expand_dict(flat_dict, sep: str = '_'):
     """Expand a flattened dictionary.
 
@@ -141,18 +170,45 @@ def _get_citation_str(data: Mapping) -> Optional[str]:
         return citation.curie
 
 
-def hash_edge(source, target, edge_data: EdgeData) -> str:
-    """Convert an edge tuple to a MD5 hash.
+def get_default_edge_digest() -> str:
+    """Get the name of the digest used by :func:`hash_edge` by default.
+
+    It can be set with the ``edge_digest`` key in the PyBEL configuration.
+    """
+    return _default_edge_digest
+
+
+def set_default_edge_digest(digest: str) -> None:
+    """Set the name of the digest used by :func:`hash_edge` by default.
+
+    Since edges are identified by their keys, this should be done before any graphs are built.
+
+    :param digest: The name of a digest in :data:`EDGE_DIGESTS`
+    :raises ValueError: if the digest is not available
+    """
+    if digest not in EDGE_DIGESTS:
+        raise ValueError('invalid edge digest: {}. Should be one of {}'.format(digest, sorted(EDGE_DIGESTS)))
+    global _default_edge_digest
+    _default_edge_digest = digest
+
+
+def hash_edge(source, target, edge_data: EdgeData, digest: Optional[str] = None) -> str:
+    """Convert an edge tuple to a hash.
 
     :param BaseEntity source: The source BEL node
     :param BaseEntity target: The target BEL node
     :param edge_data: The edge's data dictionary
-    :return: A hashed version of the edge tuple using MD5 hash of the binary pickle dump of u, v, and the json dump
-     of d
+    :param digest: The name of the digest to use from :data:`EDGE_DIGESTS`. If none, uses the default
+     from :func:`get_default_edge_digest`, which is MD5 unless configured otherwise.
+    :return: A hashed version of the edge tuple using the given digest of the binary pickle dump of u, v,
+     and the canonicalized edge data
     """
+    if digest is None:
+        digest = _default_edge_digest
     edge_tuple = _get_edge_tuple(source, target, edge_data)
-    edge_tuple_bytes = pickle.dumps(edge_tuple)
-    return hashlib.md5(edge_tuple_bytes).hexdigest()  # noqa: S303
+    if digest == 'md5':
+        return _md5_hexdigest(pickle.dumps(edge_tuple))
+    return EDGE_DIGESTS[digest](pickle.dumps(edge_tuple, protocol=_EDGE_PICKLE_PROTOCOL))
 
 
 def _get_edge_tuple(
@@ -168,8 +224,8 @@ def _get_edge_tuple(
     :return: A tuple that can be hashed representing this edge. Makes no promises to its structure.
     """
     return (
-        source.as_bel(),
-        target.as_bel(),
+        source.bel,
+        target.bel,
         _get_citation_str(edge_data),
         edge_data.get(EVIDENCE),
         canonicalize_edge(edge_data),
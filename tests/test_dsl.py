@@ -2,16 +2,24 @@
 
 """Tests for the internal DSL."""
 
+import os
+import pickle
+import subprocess
+import sys
 import unittest
 
 from pybel import BELGraph
-from pybel.constants import NAME
+from pybel.constants import NAME, VARIANTS
 from pybel.dsl import (
-    Abundance, ComplexAbundance, CompositeAbundance, EnumeratedFusionRange, Fragment, Gene, GeneFusion,
-    ListAbundanceEmptyException, MissingFusionRange, Protein, Reaction, ReactionEmptyException,
+    Abundance, ComplexAbundance, CompositeAbundance, EnumeratedFusionRange, Fragment, FrozenEntityException, Gene,
+    GeneFusion, GeneModification, Hgvs, ListAbundanceEmptyException, MissingFusionRange, Protein,
+    ProteinModification, Reaction, ReactionEmptyException, compact_from_json, get_intern_table, intern_node,
+    interning, is_interning_enabled, to_compact,
 )
 from pybel.language import Entity
+from pybel.io import from_nodelink, to_nodelink
 from pybel.testing.utils import n
+from pybel.tokens import parse_result_to_dsl
 from pybel.utils import ensure_quotes
 
 
@@ -210,5 +218,184 @@ class TestCentralDogma(unittest.TestCase):
             Reaction([], [])
 
 
+_PICKLE_GRAPH_SCRIPT = """
+from pybel import BELGraph
+from pybel.dsl import ComplexAbundance, Protein
+node = ComplexAbundance([Protein('HGNC', 'A'), Protein('HGNC', 'B')])
+graph = BELGraph()
+graph.add_node_from_data(node)
+assert all(hash(n) == n._hash for n in graph)
+obj = graph
+"""
+
+
+def _dumps_with_hash_seed(script: str, hash_seed: str) -> bytes:
+    """Run a script that defines ``obj`` in a new process with the given hash seed and return ``obj`` pickled."""
+    script += 'import pickle, sys\nsys.stdout.buffer.write(pickle.dumps(obj))\n'
+    env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+    return subprocess.run([sys.executable, '-c', script], env=env, stdout=subprocess.PIPE, check=True).stdout
+
+
+class TestCanonicalCache(unittest.TestCase):
+    """Tests for the cached canonical BEL string and hash of DSL nodes."""
+
+    def test_cached(self):
+        """Test the canonical BEL string is calculated once and reused."""
+        node = Protein(namespace='HGNC', name='APP', variants=[Fragment(start=672, stop=713)])
+        self.assertIsNone(node._bel)
+        self.assertEqual(node.as_bel(), node.bel)
+        self.assertIs(node.bel, node.bel)
+        self.assertEqual(hash(node.as_bel()), hash(node))
+        self.assertEqual(node, Protein(namespace='HGNC', name='APP', variants=[Fragment(start=672, stop=713)]))
+
+    def test_invalidate_on_setitem(self):
+        """Test modifying the node's dictionary resets the cache."""
+        node = Protein(namespace='HGNC', name='APP')
+        self.assertEqual('p(HGNC:APP)', node.bel)
+        md5 = node.md5
+        node[VARIANTS] = [Fragment(start=672, stop=713)]
+        self.assertEqual('p(HGNC:APP, frag("672_713"))', node.bel)
+        self.assertNotEqual(md5, node.md5)
+        del node[VARIANTS]
+        self.assertEqual('p(HGNC:APP)', node.bel)
+        self.assertEqual(md5, node.md5)
+
+    def test_reset_cache(self):
+        """Test in-place modification of nested data needs an explicit reset."""
+        node = Protein(namespace='HGNC', name='APP', variants=[Fragment(start=672, stop=713)])
+        self.assertEqual('p(HGNC:APP, frag("672_713"))', node.bel)
+        node.variants.append(Fragment())
+        self.assertEqual('p(HGNC:APP, frag("672_713"))', node.bel)
+        node.reset_cache()
+        self.assertEqual('p(HGNC:APP, frag("672_713"), frag("?"))', node.bel)
+
+    def test_pickle(self):
+        """Test the hash isn't pickled, since it's different in each process."""
+        for hash_seed in ('1', '2'):
+            with self.subTest(hash_seed=hash_seed):
+                graph = pickle.loads(_dumps_with_hash_seed(_PICKLE_GRAPH_SCRIPT, hash_seed))
+                self.assertIn(ComplexAbundance([Protein('HGNC', 'A'), Protein('HGNC', 'B')]), graph)
+                self.assertIn(Protein('HGNC', 'A'), graph)
+
+
+class TestInterning(unittest.TestCase):
+    """Tests for interning DSL nodes."""
+
+    def test_freeze(self):
+        """Test a frozen node can't be modified."""
+        node = Protein(namespace='HGNC', name='APP').freeze()
+        self.assertTrue(node.frozen)
+        with self.assertRaises(FrozenEntityException):
+            node[VARIANTS] = [Fragment()]
+        with self.assertRaises(FrozenEntityException):
+            node.pop(VARIANTS, None)
+        self.assertEqual(node, pickle.loads(pickle.dumps(node)))
+        self.assertTrue(pickle.loads(pickle.dumps(node)).frozen)
+
+    def test_intern(self):
+        """Test interning returns a single frozen instance."""
+        a = intern_node(Protein(namespace='HGNC', name='APP'))
+        b = intern_node(Protein(namespace='HGNC', name='APP'))
+        self.assertIs(a, b)
+        self.assertTrue(a.frozen)
+        self.assertIn(Protein(namespace='HGNC', name='APP'), get_intern_table())
+        self.assertIsNot(a, intern_node(Protein(namespace='HGNC', name='APP', identifier='620')))
+
+    def test_opt_in(self):
+        """Test interning of parse results only happens when enabled."""
+        data = ComplexAbundance([Protein(namespace='HGNC', name='A'), Protein(namespace='HGNC', name='B')])
+        self.assertFalse(is_interning_enabled())
+        self.assertIsNot(parse_result_to_dsl(data), parse_result_to_dsl(data))
+        with interning():
+            self.assertTrue(is_interning_enabled())
+            a, b = parse_result_to_dsl(data), parse_result_to_dsl(data)
+            self.assertIs(a, b)
+            self.assertIs(a.members[0], parse_result_to_dsl(data.members[0]))
+        self.assertFalse(is_interning_enabled())
+
+    def test_nodelink(self):
+        """Test a graph with interned nodes can be round-tripped through node-link."""
+        graph = BELGraph()
+        graph.add_increases(
+            ComplexAbundance([Protein(namespace='HGNC', name='A'), Protein(namespace='HGNC', name='B')]),
+            Protein(namespace='HGNC', name='C'),
+            citation=n(),
+            evidence=n(),
+        )
+        with interning():
+            reloaded = from_nodelink(to_nodelink(graph))
+            self.assertEqual(graph.number_of_edges(), from_nodelink(to_nodelink(reloaded)).number_of_edges())
+        self.assertEqual(set(graph), set(reloaded))
+        self.assertTrue(all(node.frozen for node in reloaded))
+
+
+class TestCompact(unittest.TestCase):
+    """Tests for the compact node representation."""
+
+    def assert_lossless(self, node):
+        """Check the node converts to and from a compact representation without losing information."""
+        compact_node = to_compact(node)
+        self.assertEqual(node, compact_node)
+        self.assertEqual(compact_node, node)
+        self.assertEqual(hash(node), hash(compact_node))
+        self.assertEqual(node.md5, compact_node.md5)
+        self.assertEqual(dict(node), dict(compact_node.to_dsl()))
+        self.assertEqual(compact_node, compact_from_json(pickle.loads(pickle.dumps(node))))
+        self.assertEqual(compact_node, pickle.loads(pickle.dumps(compact_node)))
+
+    def test_pickle_hash(self):
+        """Test the hash isn't pickled, since it's different in each process."""
+        script = (
+            'import pickle, sys\n'
+            'from pybel.dsl import Protein, to_compact\n'
+            'node = to_compact(Protein("HGNC", "A"))\n'
+            'hash(node)\n'
+            'sys.stdout.buffer.write(pickle.dumps(node))\n'
+        )
+        for hash_seed in ('1', '2'):
+            with self.subTest(hash_seed=hash_seed):
+                env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+                rv = subprocess.run([sys.executable, '-c', script], env=env, stdout=subprocess.PIPE, check=True)
+                self.assertIn(pickle.loads(rv.stdout), {to_compact(Protein('HGNC', 'A'))})
+
+    def test_abundance(self):
+        """Test converting named nodes."""
+        node = Protein(namespace='HGNC', name='APP', identifier='620', xrefs=[Entity(namespace='up', identifier='1')])
+        self.assert_lossless(node)
+        compact_node = to_compact(node)
+        self.assertEqual('HGNC', compact_node.namespace)
+        self.assertEqual('APP', compact_node.name)
+        self.assertEqual('620', compact_node.identifier)
+        self.assertEqual(node.obo, compact_node.obo)
+        self.assertIsNone(compact_node.variants)
+        self.assert_lossless(Abundance(namespace='CHEBI', name='water'))
+
+    def test_variants(self):
+        """Test converting nodes with variants."""
+        self.assert_lossless(Protein(namespace='HGNC', name='AKT1', variants=[
+            ProteinModification('Ph', code='Thr', position=308),
+            Hgvs('p.Ala127Tyr'),
+            Fragment(start=5, stop=8, description='d'),
+            Fragment(),
+        ]))
+        self.assert_lossless(Gene(namespace='HGNC', name='AKT1', variants=GeneModification('Me')))
+
+    def test_list_abundances(self):
+        """Test converting list abundances and reactions."""
+        members = [Protein(namespace='HGNC', name='A'), Protein(namespace='HGNC', name='B')]
+        self.assert_lossless(ComplexAbundance(members))
+        self.assert_lossless(ComplexAbundance(members, namespace='FPLX', name='AB'))
+        self.assert_lossless(CompositeAbundance([ComplexAbundance(members), Abundance(namespace='CHEBI', name='c')]))
+        self.assert_lossless(Reaction(members, [Abundance(namespace='CHEBI', name='c')]))
+
+    def test_fusions(self):
+        """Test converting fusions."""
+        self.assert_lossless(GeneFusion(
+            partner_5p=Gene(namespace='HGNC', name='TMPRSS2'),
+            range_5p=EnumeratedFusionRange('c', 1, 79),
+            partner_3p=Gene(namespace='HGNC', name='ERG'),
+        ))
+
+
 if __name__ == '__main__':
     unittest.main()
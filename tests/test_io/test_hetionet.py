@@ -54,3 +54,17 @@ class TestHetionet(unittest.TestCase):
         self.assertEqual(2, graph.number_of_nodes())
 
         self.assertIn(target_node, graph[source_node])
+
+    def test_import_binds(self):
+        """Test importing a binding relation, which is represented with a complex."""
+        source = dict(kind=hioc.GENE, identifier=1, name='gene1')
+        target = dict(kind=hioc.GENE, identifier=2, name='gene2')
+        edge = dict(source_id=(hioc.GENE, 1), kind='interacts', target_id=(hioc.GENE, 2), data={})
+        graph = from_hetionet_json(dict(nodes=[source, target], edges=[edge]), use_tqdm=False)
+
+        source_node = dsl.Protein(namespace='ncbigene', identifier='1', name='gene1')
+        target_node = dsl.Protein(namespace='ncbigene', identifier='2', name='gene2')
+        complex_node = dsl.ComplexAbundance([source_node, target_node])
+        self.assertEqual(3, graph.number_of_nodes())
+        self.assertIn(complex_node, graph[source_node])
+        self.assertIn(complex_node, graph[target_node])
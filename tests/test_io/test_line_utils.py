@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for parsing BEL scripts in parallel and in streaming mode."""
+
+import unittest
+from io import StringIO
+
+from pybel import BELGraph, from_bel_script, from_sbel_file, to_sbel_file
+from pybel.constants import CITATION, EVIDENCE, IDENTIFIER
+from pybel.io.line_utils import _split_statements, iterate_lines
+from pybel.io.triples import to_triples_file
+from pybel.testing.constants import test_bel_slushy, test_bel_thorough
+
+
+def _get_warnings(graph: BELGraph):
+    return [
+        (path, exc.__class__, exc.line_number, str(exc), context)
+        for path, exc, context in graph.warnings
+    ]
+
+
+class TestParallelParse(unittest.TestCase):
+    """Test parsing BEL scripts in worker processes gives the same results as parsing serially."""
+
+    def test_split_statements(self):
+        """Test that chunks are only split in front of citations outside of statement groups."""
+        lines = list(enumerate([
+            'SET Citation = {"PubMed", "1"}',
+            'SET Evidence = "a"',
+            'SET STATEMENT_GROUP = "Group 1"',
+            'SET Citation = {"PubMed", "2"}',
+            'UNSET STATEMENT_GROUP',
+            'SET Citation = {"PubMed", "3", "\\"4\\""}',
+            'SET Citation = {"PubMed", "5"}',
+        ]))
+        chunks = list(_split_statements(lines, chunksize=1))
+        self.assertEqual([lines[:6], lines[6:]], chunks)
+
+    def _help_test_parallel(self, path: str):
+        serial_graph = from_bel_script(path, no_identifier_validation=True, allow_naked_names=True)
+        parallel_graph = from_bel_script(
+            path, no_identifier_validation=True, allow_naked_names=True, processes=2, chunksize=1,
+        )
+
+        self.assertEqual(list(serial_graph), list(parallel_graph))
+        self.assertEqual(serial_graph.number_of_edges(), parallel_graph.number_of_edges())
+        for u, v, k, d in serial_graph.edges(keys=True, data=True):
+            self.assertEqual(d, parallel_graph[u][v][k])
+        self.assertEqual(_get_warnings(serial_graph), _get_warnings(parallel_graph))
+
+    def test_thorough(self):
+        """Test parsing the thorough BEL script in parallel."""
+        self._help_test_parallel(test_bel_thorough)
+
+    def test_slushy(self):
+        """Test parsing a BEL script with lots of warnings in parallel."""
+        self._help_test_parallel(test_bel_slushy)
+
+
+class TestStreamingParse(unittest.TestCase):
+    """Test streaming the edges from a BEL script gives the same edges as parsing it into a graph."""
+
+    def setUp(self):
+        """Parse the thorough BEL script into a graph."""
+        self.graph = from_bel_script(test_bel_thorough, no_identifier_validation=True, allow_naked_names=True)
+
+    def _iterate_lines(self, graph: BELGraph, file):
+        return iterate_lines(graph, file, no_identifier_validation=True, allow_naked_names=True)
+
+    def test_iterate_lines(self):
+        """Test the graph gets the metadata and warnings, but not the edges."""
+        graph = BELGraph(path=test_bel_thorough)
+        with open(test_bel_thorough) as file:
+            edges = self._iterate_lines(graph, file)
+            self.assertEqual(self.graph.document, graph.document)
+            self.assertEqual(self.graph.namespace_url, graph.namespace_url)
+            edges = list(edges)
+
+        self.assertEqual(0, graph.number_of_nodes())
+        self.assertEqual(_get_warnings(self.graph), _get_warnings(graph))
+        self.assertEqual(set(self.graph.edges(keys=True)), {(u, v, k) for u, v, k, _ in edges})
+        first_edges = {}
+        for u, v, k, d in edges:
+            first_edges.setdefault((u, v, k), d)
+        for (u, v, k), d in first_edges.items():
+            self.assertEqual(self.graph[u][v][k], d)
+
+    def test_interleaved(self):
+        """Test consuming two streams in the same thread keeps their citations and evidences apart."""
+        def _make_lines(pmid, names):
+            return [
+                'SET DOCUMENT Name = "Document {}"'.format(pmid),
+                'SET DOCUMENT Version = "1.0.0"',
+                'DEFINE NAMESPACE HGNC AS PATTERN ".*"',
+                'SET Citation = {{"PubMed", "{}"}}'.format(pmid),
+                'SET Evidence = "e{}"'.format(pmid),
+            ] + ['p(HGNC:{}) -> p(HGNC:{})'.format(names[0], name) for name in names[1:]]
+
+        edges_9 = self._iterate_lines(BELGraph(), _make_lines(9, 'XYZ'))
+        edges_7 = self._iterate_lines(BELGraph(), _make_lines(7, 'ABC'))
+        for edge_9, edge_7 in zip(edges_9, edges_7):
+            for (_, _, _, data), pmid in ((edge_9, '9'), (edge_7, '7')):
+                self.assertEqual(pmid, data[CITATION][IDENTIFIER])
+                self.assertEqual('e' + pmid, data[EVIDENCE])
+
+    def test_sink(self):
+        """Test passing the edges to a sink."""
+        edges = []
+        graph = from_bel_script(
+            test_bel_thorough, no_identifier_validation=True, allow_naked_names=True,
+            sink=lambda u, v, k, d: edges.append((u, v, k)),
+        )
+        self.assertEqual(0, graph.number_of_edges())
+        self.assertEqual(set(self.graph.edges(keys=True)), set(edges))
+
+    def test_sbel(self):
+        """Test writing streamed edges to SBEL."""
+        expected, streamed = StringIO(), StringIO()
+        to_sbel_file(self.graph, expected)
+        graph = BELGraph(path=test_bel_thorough)
+        with open(test_bel_thorough) as file:
+            to_sbel_file(graph, streamed, edges=self._iterate_lines(graph, file))
+
+        expected.seek(0)
+        streamed.seek(0)
+        expected_graph, streamed_graph = from_sbel_file(expected), from_sbel_file(streamed)
+        self.assertEqual(expected_graph.graph, streamed_graph.graph)
+        self.assertEqual(set(expected_graph.edges(keys=True)), set(streamed_graph.edges(keys=True)))
+
+    def test_triples(self):
+        """Test writing streamed edges as triples."""
+        expected, streamed = StringIO(), StringIO()
+        to_triples_file(self.graph, expected)
+        with open(test_bel_thorough) as file:
+            to_triples_file(BELGraph(), streamed, edges=self._iterate_lines(BELGraph(), file))
+        self.assertEqual(
+            set(expected.getvalue().splitlines()),
+            set(streamed.getvalue().splitlines()),
+        )
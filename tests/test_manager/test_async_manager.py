@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the asynchronous manager facade."""
+
+import asyncio
+import threading
+
+from sqlalchemy.orm import sessionmaker
+
+from pybel import BELGraph
+from pybel.dsl import Protein
+from pybel.manager import AsyncManager, Manager
+from pybel.testing.cases import TemporaryCacheMixin
+
+
+def _make_graph(name: str, *names: str) -> BELGraph:
+    graph = BELGraph(name=name, version='1.0.0')
+    graph.namespace_pattern['HGNC'] = '.*'
+    nodes = [Protein(namespace='HGNC', name=node_name) for node_name in names]
+    for i, (u, v) in enumerate(zip(nodes, nodes[1:])):
+        graph.add_increases(u, v, citation=str(i), evidence='Evidence {}'.format(i))
+    return graph
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncManager(TemporaryCacheMixin):
+    """Test running lookups and queries in worker threads."""
+
+    def setUp(self):
+        """Insert two networks and wrap the manager."""
+        super().setUp()
+        self.network_1 = self.manager.insert_graph(_make_graph('Async 1', 'A', 'B', 'C'), use_tqdm=False)
+        self.network_2 = self.manager.insert_graph(_make_graph('Async 2', 'C', 'D'), use_tqdm=False)
+        self.async_manager = AsyncManager(self.manager, max_workers=4)
+
+    def tearDown(self):
+        """Stop the worker threads."""
+        self.async_manager.close()
+        super().tearDown()
+
+    def test_concurrent(self):
+        """Test many concurrent lookups give the same results as the manager."""
+        network_ids = [self.network_1.id, self.network_2.id]
+
+        async def _lookup():
+            return await asyncio.gather(*(
+                coroutine
+                for _ in range(10)
+                for coroutine in (
+                    self.async_manager.get_graph_by_ids(network_ids),
+                    self.async_manager.get_universe_by_ids(network_ids),
+                    self.async_manager.count_edges(),
+                )
+            ))
+
+        results = _run(_lookup())
+        self.assertEqual(30, len(results))
+        for graph, universe, count in zip(*[iter(results)] * 3):
+            self.assertEqual(4, graph.number_of_nodes())
+            self.assertEqual(3, universe.number_of_edges())
+            self.assertEqual(3, count)
+
+    def test_materialized(self):
+        """Test lazy queries are loaded in the worker thread and models can be used after."""
+        edges = _run(self.async_manager.search_edges_with_evidence('%Evidence 1%'))
+        self.assertIsInstance(edges, list)
+        self.assertEqual(1, len(edges))
+        self.assertIn('HGNC:B', edges[0].bel)
+
+        citation = _run(self.async_manager.get_citation_by_pmid('0'))
+        self.assertEqual('0', citation.db_id)
+
+    def test_run(self):
+        """Test running a function with the manager in a worker thread."""
+        def _get_edge_bels(manager, network_id):
+            self.assertNotEqual(threading.main_thread(), threading.current_thread())
+            return sorted(edge.bel for edge in manager.get_network_by_id(network_id).edges)
+
+        bels = _run(self.async_manager.run(_get_edge_bels, self.network_2.id))
+        self.assertEqual(1, len(bels))
+
+    def test_unscoped(self):
+        """Test a manager whose session can't be used from several threads is rejected."""
+        manager = Manager(engine=self.manager.engine, session=sessionmaker(bind=self.manager.engine)())
+        with self.assertRaises(ValueError):
+            AsyncManager(manager)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the codecs of stored networks' blobs."""
+
+import unittest
+from unittest import mock
+
+from sqlalchemy import inspect
+
+from pybel import BELGraph
+from pybel.dsl import Protein
+from pybel.examples import sialic_acid_graph
+from pybel.manager.blob import (
+    BLOB_CODECS, CHUNKED_PICKLE_GZIP, PICKLE, ChunkedBlobWriter, from_blob, from_blob_header, iterate_blob_edges,
+    to_blob,
+)
+from pybel.manager import Manager
+from pybel.manager.models import NETWORK_TABLE_NAME, Network
+from pybel.testing.cases import TemporaryCacheMixin
+
+
+class TestBlobCodecs(unittest.TestCase):
+    """Test writing graphs to blobs and reading them back with each codec."""
+
+    def _help_test_graph_equal(self, expected: BELGraph, actual: BELGraph) -> None:
+        self.assertEqual(expected.graph, actual.graph)
+        self.assertEqual(list(expected), list(actual))
+        self.assertEqual(list(expected.edges(keys=True, data=True)), list(actual.edges(keys=True, data=True)))
+
+    def test_round_trip(self):
+        """Test each codec gives back the same graph."""
+        for codec in BLOB_CODECS:
+            with self.subTest(codec=codec):
+                blob, codec_name = to_blob(sialic_acid_graph, codec)
+                self.assertEqual(codec, codec_name)
+                self._help_test_graph_equal(sialic_acid_graph, from_blob(blob, codec))
+                self.assertEqual(
+                    list(sialic_acid_graph.edges(keys=True, data=True)),
+                    list(iterate_blob_edges(blob, codec)),
+                )
+
+                header = from_blob_header(blob, codec)
+                self.assertEqual(sialic_acid_graph.graph, header.graph)
+                self.assertEqual(0, header.number_of_nodes())
+
+    @mock.patch('pybel.manager.blob.EDGE_CHUNK_SIZE', 2)
+    def test_chunked(self):
+        """Test the edges of a graph are written in several chunks and their nodes aren't duplicated."""
+        blob, _ = to_blob(sialic_acid_graph, CHUNKED_PICKLE_GZIP)
+        graph = from_blob(blob, CHUNKED_PICKLE_GZIP)
+        self._help_test_graph_equal(sialic_acid_graph, graph)
+        nodes = {id(node) for node in graph}
+        for u, v in graph.edges():
+            self.assertIn(id(u), nodes)
+            self.assertIn(id(v), nodes)
+
+    def test_writer(self):
+        """Test writing a blob from chunks of edges, some of them repeated."""
+        edges = list(sialic_acid_graph.edges(keys=True, data=True))
+        writer = ChunkedBlobWriter()
+        writer.add_edges(edges[:3])
+        writer.add_edges(edges[1:])
+        blob, codec = writer.to_blob(sialic_acid_graph)
+        self.assertEqual(CHUNKED_PICKLE_GZIP, codec)
+        self.assertEqual(edges, list(iterate_blob_edges(blob, codec)))
+
+        graph = from_blob(blob, codec)
+        self.assertEqual(sialic_acid_graph.graph, graph.graph)
+        self.assertEqual(set(sialic_acid_graph.edges(keys=True)), set(graph.edges(keys=True)))
+
+    def test_legacy(self):
+        """Test blobs without a codec are read as plain pickles."""
+        blob, _ = to_blob(sialic_acid_graph, PICKLE)
+        self._help_test_graph_equal(sialic_acid_graph, from_blob(blob))
+
+    def test_unknown(self):
+        """Test an error is raised for an unknown codec."""
+        with self.assertRaises(ValueError):
+            to_blob(sialic_acid_graph, 'nope')
+
+
+def _make_graph() -> BELGraph:
+    graph = BELGraph(name='Blob Test', version='1.0.0')
+    graph.namespace_pattern['HGNC'] = '.*'
+    a, b, c = (Protein(namespace='HGNC', name=name) for name in 'ABC')
+    graph.add_increases(a, b, citation='1', evidence='Evidence 1')
+    graph.add_decreases(b, c, citation='2', evidence='Evidence 2')
+    graph.add_node_from_data(Protein(namespace='HGNC', name='D'))
+    return graph
+
+
+class TestNetworkBlob(TemporaryCacheMixin):
+    """Test the blobs of stored networks."""
+
+    def test_deferred(self):
+        """Test querying networks doesn't load their blobs until they're needed."""
+        graph = _make_graph()
+        network = self.manager.insert_graph(graph, use_tqdm=False)
+        self.assertEqual(CHUNKED_PICKLE_GZIP, network.blob_codec)
+        self.manager.session.expunge_all()
+
+        network = self.manager.session.query(Network).one()
+        self.assertNotIn('blob', inspect(network).dict)
+        self.assertEqual(list(graph.edges(keys=True, data=True)), list(network.iterate_edges()))
+        self.assertEqual(list(graph), list(network.as_bel()))
+
+    def test_upgrade(self):
+        """Test the codec column is added to a database made before it existed, whose blobs are plain pickles."""
+        graph = _make_graph()
+        network = self.manager.insert_graph(graph, use_tqdm=False)
+        network.blob, _ = to_blob(graph, PICKLE)
+        self.manager.session.commit()
+        network_id = network.id
+        self.manager.session.close()
+        self.manager.engine.execute('ALTER TABLE {} DROP COLUMN blob_codec'.format(NETWORK_TABLE_NAME))
+        self.manager.engine.dispose()
+
+        manager = Manager(connection=self.connection)
+        try:
+            self.assertIn('blob_codec', {column['name'] for column in inspect(manager.engine).get_columns(
+                NETWORK_TABLE_NAME)})
+            self.assertEqual(1, manager.count_networks())
+            self.assertIsNone(manager.get_network_by_id(network_id).blob_codec)
+            self.assertEqual(list(graph), list(manager.get_graph_by_id(network_id)))
+        finally:
+            manager.session.close()
+            manager.engine.dispose()
@@ -2,21 +2,50 @@
 
 """Test the manager's citation utilities."""
 
+import math
 import os
+import tempfile
 import time
 import unittest
 
 from pybel import BELGraph
 from pybel.constants import (
-    CITATION, CITATION_AUTHORS, CITATION_DATE, CITATION_JOURNAL, CITATION_TYPE_PUBMED,
+    CITATION, CITATION_AUTHORS, CITATION_DATE, CITATION_FIRST_AUTHOR, CITATION_JOURNAL, CITATION_TYPE_PUBMED,
 )
 from pybel.dsl import Protein
-from pybel.manager.citation_utils import enrich_pubmed_citations, get_citations_by_pmids, sanitize_date
-from pybel.manager.models import Citation
+from pybel.manager.citation_utils import (
+    PubMedCache, TokenBucket, enrich_citation_model, enrich_pubmed_citations, get_citations_by_pmids,
+    get_pubmed_citation_response, sanitize_date,
+)
+from pybel.manager.models import Author, Citation
 from pybel.testing.cases import TemporaryCacheMixin
+from pybel.testing.mocks import MockEUtilsServer
 from pybel.testing.utils import n
 
 
+def _make_result(pmid: str, title: str, pubdate: str, *authors: str):
+    return {
+        'uid': pmid,
+        'title': title,
+        'fulljournalname': 'Journal of Tests',
+        'volume': '1',
+        'issue': '2',
+        'pages': '3-4',
+        'pubdate': pubdate,
+        'sortfirstauthor': authors[0] if authors else '',
+        'lastauthor': authors[-1] if authors else '',
+        'authors': [{'name': author, 'authtype': 'Author'} for author in authors],
+    }
+
+
+RESULTS = {
+    '9611787': _make_result('9611787', 'A', '1998 May', 'Lewell XQ', 'Judd DB', 'Watson SP', 'Hann MM'),
+    '25818332': _make_result('25818332', 'B', '2015', 'Judd DB', 'Gomez C'),
+    '27003210': _make_result('27003210', 'C', '2016 Spring', 'Gómez C'),
+    '26438529': _make_result('26438529', 'D', '2015 Strange'),
+}
+
+
 class TestSanitizeDate(unittest.TestCase):
     """Test sanitization of dates in various formats."""
 
@@ -155,11 +184,127 @@ class TestCitations(TemporaryCacheMixin):
         self.assertIsNotNone(x)
         self.assertEqual('Martínez-Guillén JR', x.first.name)
 
-        self.assertIn(g1, self.manager.object_cache_author)
-        self.assertIn(g2, self.manager.object_cache_author)
-
         a1 = self.manager.get_author_by_name(g1)
         self.assertEqual(g1, a1.name)
 
         a2 = self.manager.get_author_by_name(g2)
         self.assertEqual(g2, a2.name)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for the token bucket rate limiter."""
+
+    def test_rate(self):
+        """Test tokens are taken no faster than the rate, without a burst at the start."""
+        bucket = TokenBucket(20)
+        t = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - t, 0.19)
+
+    def test_unlimited(self):
+        """Test an infinite rate never waits."""
+        bucket = TokenBucket(math.inf)
+        t = time.monotonic()
+        for _ in range(1000):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - t, 0.1)
+
+
+class TestEnrichment(TemporaryCacheMixin):
+    """Tests for enriching citations against a local stand-in for E-Utils."""
+
+    def setUp(self):
+        """Make a directory for the PubMed cache."""
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the PubMed cache directory."""
+        self.directory.cleanup()
+        super().tearDown()
+
+    def _get_citations_by_pmids(self, server, pmids, **kwargs):
+        kwargs.setdefault('rate', math.inf)
+        return get_citations_by_pmids(manager=self.manager, pmids=pmids, url=server.url, **kwargs)
+
+    def test_enrich(self):
+        """Test citations and their authors are written in bulk, and missing identifiers are errors."""
+        pmids = list(RESULTS) + ['1']
+        with MockEUtilsServer(RESULTS) as server:
+            result, errors = self._get_citations_by_pmids(server, pmids, group_size=2, workers=2)
+            self.assertEqual(3, len(server.requests))
+
+        self.assertEqual({'1'}, errors)
+        self.assertEqual(set(RESULTS), set(result))
+        self.assertEqual('1998-05-01', result['9611787'][CITATION_DATE])
+        self.assertEqual(['Hann MM', 'Judd DB', 'Lewell XQ', 'Watson SP'], result['9611787'][CITATION_AUTHORS])
+        self.assertNotIn(CITATION_DATE, result['26438529'])
+
+        self.assertEqual(len(pmids), self.manager.count_citations())
+        self.assertEqual(6, self.manager.session.query(Author).count())
+        citation = self.manager.get_citation_by_pmid('25818332')
+        self.assertEqual('Judd DB', citation.first.name)
+        self.assertEqual('Gomez C', citation.last.name)
+        self.assertEqual({'Judd DB', 'Gomez C'}, {author.name for author in citation.authors})
+        self.assertFalse(self.manager.get_citation_by_pmid('1').is_enriched)
+
+        with MockEUtilsServer(RESULTS) as server:
+            result, errors = self._get_citations_by_pmids(server, pmids)
+            self.assertEqual([['1']], server.requests)
+        self.assertEqual(set(RESULTS), set(result))
+
+    def test_cache(self):
+        """Test results in the cache directory aren't requested again, even for a new database."""
+        with MockEUtilsServer(RESULTS) as server:
+            self._get_citations_by_pmids(server, RESULTS, cache_directory=self.directory.name)
+        cache = PubMedCache(self.directory.name)
+        self.assertEqual(len(RESULTS), len(cache))
+        cache.close()
+
+        self.manager.drop_all()
+        self.manager.create_all()
+        with MockEUtilsServer({}) as server:
+            result, errors = self._get_citations_by_pmids(server, RESULTS, cache_directory=self.directory.name)
+            self.assertEqual([], server.requests)
+        self.assertEqual(set(), errors)
+        self.assertEqual(['Gómez C'], result['27003210'][CITATION_AUTHORS])
+
+    def test_retry(self):
+        """Test requests are tried again when E-Utils rate limits them, and groups fail after too many tries."""
+        with MockEUtilsServer(RESULTS, failures=2) as server:
+            result, errors = self._get_citations_by_pmids(server, ['9611787'])
+        self.assertEqual(set(), errors)
+        self.assertIn('9611787', result)
+
+        with MockEUtilsServer(RESULTS, failures=10) as server:
+            result, errors = self._get_citations_by_pmids(server, ['25818332'])
+        self.assertEqual({'25818332'}, errors)
+        self.assertNotIn('25818332', result)
+
+    def test_response(self):
+        """Test getting the parsed response from E-Utils."""
+        with MockEUtilsServer(RESULTS) as server:
+            response = get_pubmed_citation_response(['9611787', '1'], url=server.url)
+        self.assertEqual(['9611787', '1'], response['result']['uids'])
+        self.assertEqual('A', response['result']['9611787']['title'])
+        self.assertIn('error', response['result']['1'])
+
+    def test_enrich_citation_model(self):
+        """Test the deprecated enrichment of a single citation model."""
+        citation = self.manager.get_or_create_citation(namespace=CITATION_TYPE_PUBMED, identifier='25818332')
+        with self.assertWarns(DeprecationWarning):
+            self.assertTrue(enrich_citation_model(self.manager, citation, RESULTS['25818332']))
+        self.assertEqual('Judd DB', citation.first.name)
+
+    def test_enrich_graph(self):
+        """Test enriching the citations in a graph."""
+        graph = BELGraph()
+        graph.add_increases(Protein(n(), n()), Protein(n(), n()), citation='9611787', evidence=n())
+        with MockEUtilsServer(RESULTS) as server:
+            errors = enrich_pubmed_citations(manager=self.manager, graph=graph, url=server.url, rate=math.inf)
+        self.assertEqual(set(), errors)
+
+        _, _, d = list(graph.edges(data=True))[0]
+        self.assertEqual('Journal of Tests', d[CITATION][CITATION_JOURNAL])
+        self.assertEqual('Lewell XQ', d[CITATION][CITATION_FIRST_AUTHOR])
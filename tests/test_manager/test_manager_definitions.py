@@ -1,13 +1,25 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
+import tempfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import event
 
 from pybel import BELGraph, Manager
 from pybel.constants import ANNOTATIONS
+from pybel.dsl import Protein
+from pybel.io.line_utils import parse_lines
+from pybel.manager.models import NAME_TABLE_NAME
+from pybel.parser.term_index import TermIndex
 from pybel.resources import HGNC_URL
-from pybel.testing.cases import TemporaryCacheClsMixin
-from pybel.testing.constants import belns_dir_path
+from pybel.testing.cases import TemporaryCacheClsMixin, TemporaryCacheMixin
+from pybel.testing.constants import belns_dir_path, resources_dir, test_an_1, test_ns_1
 from pybel.testing.mocks import mock_bel_resources
 from tests.constants import OPENBEL_ANNOTATION_RESOURCES
 
@@ -107,3 +119,172 @@ class TestDefinitionManagers(TemporaryCacheClsMixin):
         data = {}
         entries = self.manager._get_annotation_entries_from_data(graph, data)
         self.assertIsNone(entries)
+
+
+class TestBulkInsert(TemporaryCacheMixin):
+    """Test namespace and annotation entries are inserted in batches."""
+
+    @mock.patch('pybel.manager.cache_manager.DEFAULT_ENTRY_BATCH_SIZE', 2)
+    def test_namespace(self):
+        """Test inserting a namespace in several batches."""
+        url = Path(test_ns_1).as_uri()
+        namespace = self.manager.get_or_create_namespace(url)
+        self.assertEqual(5, self.manager.count_namespace_entries())
+        self.assertEqual(
+            {(None, 'TestValue{}'.format(i)): 'O' for i in range(1, 6)},
+            namespace.get_term_to_encodings(),
+        )
+        self.assertIs(namespace, self.manager.get_or_create_namespace(url))
+
+    @mock.patch('pybel.manager.cache_manager.DEFAULT_ENTRY_BATCH_SIZE', 2)
+    def test_annotation(self):
+        """Test inserting an annotation in several batches."""
+        url = Path(test_an_1).as_uri()
+        self.manager.get_or_create_annotation(url)
+        self.assertEqual(5, self.manager.count_annotation_entries())
+        self.assertEqual(
+            {'TestAnnot{}'.format(i) for i in range(1, 6)},
+            self.manager.get_annotation_entry_names(url),
+        )
+
+
+class TestBatchedLookup(TemporaryCacheMixin):
+    """Test namespace entries are looked up in batches instead of one at a time."""
+
+    def setUp(self):
+        """Insert a namespace and count the queries that are run afterwards."""
+        super().setUp()
+        self.url = Path(test_ns_1).as_uri()
+        self.manager.get_or_create_namespace(self.url)
+        self.statements = []
+        event.listen(self.manager.engine, 'before_cursor_execute', self._count_statement)
+
+    def tearDown(self):
+        """Stop counting queries."""
+        event.remove(self.manager.engine, 'before_cursor_execute', self._count_statement)
+        super().tearDown()
+
+    def _count_statement(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    @mock.patch('pybel.manager.cache_manager.DEFAULT_IN_CLAUSE_SIZE', 2)
+    def test_insert_graph(self):
+        """Test inserting a graph looks up its nodes' entries in batches instead of once per node."""
+        graph = BELGraph(name='Batched Lookup', version='1.0.0')
+        graph.namespace_url['TEST'] = self.url
+        nodes = [Protein(namespace='TEST', name='TestValue{}'.format(i)) for i in range(1, 6)]
+        for u, v in zip(nodes, nodes[1:]):
+            graph.add_increases(u, v, citation='1', evidence='Evidence 1')
+        network = self.manager.insert_graph(graph, use_tqdm=False)
+
+        entry_lookups = [
+            statement
+            for statement in self.statements
+            if statement.lstrip().startswith('SELECT') and re.search(r'FROM {}\b'.format(NAME_TABLE_NAME), statement)
+        ]
+        self.assertEqual(3, len(entry_lookups), msg='one query per chunk of names')
+        self.assertEqual(
+            {node.name for node in nodes},
+            {node.namespace_entry.name for node in network.nodes},
+        )
+
+
+class TestTermIndex(TemporaryCacheMixin):
+    """Test namespace terms are loaded from memory-mapped term indexes."""
+
+    def test_namespace_terms(self):
+        """Test a term index is built for a namespace then reused."""
+        namespace = self.manager.get_or_create_namespace(Path(test_ns_1).as_uri())
+        self.assertIsInstance(self.manager.get_namespace_terms(namespace), dict)
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.manager.term_index_directory = directory
+            terms = self.manager.get_namespace_terms(namespace)
+            self.assertIsInstance(terms, TermIndex)
+            self.assertEqual(namespace.get_term_to_encodings(), dict(terms.items()))
+            self.assertEqual(1, len(os.listdir(directory)))
+            self.assertIs(terms, self.manager.get_namespace_terms(namespace))
+            terms.close()
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Serve the test resources and remember which paths were requested."""
+
+    requested = []
+
+    def do_GET(self):  # noqa: N802
+        self.requested.append(self.path)
+        super().do_GET()
+
+    def log_message(self, *args):
+        """Don't log requests."""
+
+
+class TestParallelDownload(TemporaryCacheMixin):
+    """Test downloading resources in parallel from a local HTTP server."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start an HTTP server for the test resources."""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), partial(_QuietHandler, directory=resources_dir))
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = 'http://127.0.0.1:{}/'.format(cls.server.server_port)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the HTTP server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Set up a manager and clear the requests."""
+        super().setUp()
+        _QuietHandler.requested.clear()
+        self.namespace_urls = [
+            self.base_url + 'belns/test_ns_1.belns',
+            self.base_url + 'belns/hgnc-names.belns',
+        ]
+        self.annotation_urls = [
+            self.base_url + 'belanno/test_an_1.belanno',
+            self.base_url + 'belanno/confidence-1.0.0.belanno',
+        ]
+
+    def test_ensure_resources(self):
+        """Test all resources are inserted at once, and not downloaded again."""
+        missing_url = self.base_url + 'belns/missing.belns'
+        errors = self.manager.ensure_resources(self.namespace_urls + [missing_url], self.annotation_urls)
+        self.assertEqual({missing_url}, set(errors))
+        self.assertEqual(2, self.manager.count_namespaces() - self.manager.count_annotations())
+        self.assertEqual(2, self.manager.count_annotations())
+        self.assertIsNotNone(self.manager.get_namespace_entry(self.namespace_urls[1], 'MIA'))
+        self.assertIn('/belns/hgnc.belns.mapping', _QuietHandler.requested)
+
+        _QuietHandler.requested.clear()
+        self.assertEqual({}, self.manager.ensure_resources(self.namespace_urls, self.annotation_urls))
+        self.assertEqual([], _QuietHandler.requested)
+
+    def test_parse_definitions(self):
+        """Test the definitions section of a BEL script is downloaded before it's parsed."""
+        lines = [
+            'SET DOCUMENT Name = "Test"',
+            'SET DOCUMENT Version = "1.0.0"',
+            'DEFINE NAMESPACE TESTNS1 AS URL "{}"'.format(self.namespace_urls[0]),
+            'DEFINE NAMESPACE HGNC AS URL "{}"'.format(self.namespace_urls[1]),
+            'DEFINE ANNOTATION TESTAN1 AS URL "{}"'.format(self.annotation_urls[0]),
+            'DEFINE ANNOTATION Confidence AS URL "{}"'.format(self.annotation_urls[1]),
+            'SET Citation = {"PubMed", "1"}',
+            'SET Evidence = "Evidence 1"',
+            'SET TESTAN1 = "TestAnnot1"',
+            'p(HGNC:MIA) -> p(HGNC:AKT1)',
+        ]
+        graph = BELGraph()
+        parse_lines(graph, lines, manager=self.manager)
+        self.assertEqual(3, graph.number_of_warnings(), msg='should only be missing document metadata')
+        self.assertEqual(1, graph.number_of_edges())
+        self.assertEqual(4, self.manager.count_namespaces())
+        self.assertEqual(
+            sorted(self.namespace_urls + self.annotation_urls),
+            sorted(path for path in map(self.base_url.rstrip('/').__add__, _QuietHandler.requested)
+                   if not path.endswith('.mapping')),
+        )
@@ -4,8 +4,9 @@ import json
 
 from pybel import BELGraph
 from pybel.constants import INCREASES, RELATION
-from pybel.dsl import hgnc
-from pybel.manager.models import Edge, Namespace, NamespaceEntry, Network, Node
+from pybel.dsl import Protein, hgnc
+from pybel.manager import DropSummary
+from pybel.manager.models import Edge, Evidence, Namespace, NamespaceEntry, Network, Node, edge_annotation, network_edge
 from pybel.testing.cases import TemporaryCacheMixin
 from pybel.testing.mocks import mock_bel_resources
 from pybel.testing.utils import make_dummy_annotations, make_dummy_namespaces, n
@@ -150,3 +151,72 @@ class TestCascades(TemporaryCacheMixin):
 
         self.assertEqual(0, self.manager.count_namespaces(), msg='Should have no namespaces')
         self.assertEqual(0, self.manager.count_namespace_entries(), msg='Entries should have been dropped')
+
+
+def _make_graph(name: str, *edges) -> BELGraph:
+    graph = BELGraph(name=name, version='1.0.0')
+    graph.namespace_pattern['HGNC'] = '.*'
+    for u, v, evidence in edges:
+        graph.add_increases(
+            Protein(namespace='HGNC', name=u),
+            Protein(namespace='HGNC', name=v),
+            citation='1',
+            evidence=evidence,
+            annotations={'Disease': {'Disease1': True}},
+        )
+    return graph
+
+
+class TestBulkDrop(TemporaryCacheMixin):
+    """Test dropping networks in bulk cleans up what they don't share with other networks."""
+
+    def setUp(self):
+        """Insert two networks that share an edge and some nodes."""
+        super().setUp()
+        self.graph_1 = _make_graph('1', ('A', 'B', 'Evidence 1'), ('B', 'C', 'Evidence 2'))
+        self.graph_2 = _make_graph('2', ('A', 'B', 'Evidence 1'), ('C', 'D', 'Evidence 3'))
+        make_dummy_annotations(self.manager, self.graph_1)
+        self.graph_2.annotation_url.update(self.graph_1.annotation_url)
+        self.network_1 = self.manager.insert_graph(self.graph_1, use_tqdm=False)
+        self.network_2 = self.manager.insert_graph(self.graph_2, use_tqdm=False)
+        self.assertEqual(3, self.manager.count_edges())
+        self.assertEqual(4, self.manager.count_nodes())
+        self.assertEqual(3, self._count(Evidence))
+
+    def _count(self, model) -> int:
+        return self.manager.session.query(model).count()
+
+    def test_drop(self):
+        """Test dropping networks one at a time, in chunks of one row."""
+        self.assertEqual(DropSummary(1, 1, 0, 1), self.manager.drop_networks_by_ids([self.network_1.id], chunk_size=1))
+        self.assertEqual(1, self.manager.count_networks())
+        self.assertEqual(2, self.manager.count_edges())
+        self.assertEqual(4, self.manager.count_nodes())
+        self.assertEqual({'Evidence 1', 'Evidence 3'}, {text for text, in self.manager.session.query(Evidence.text)})
+        self.assertEqual(2, self._count(edge_annotation))
+
+        self.assertEqual(DropSummary(1, 2, 4, 2), self.manager.drop_network_by_id(self.network_2.id))
+        self.assertEqual(0, self.manager.count_edges())
+        self.assertEqual(0, self.manager.count_nodes())
+        self.assertEqual(0, self._count(edge_annotation))
+        self.assertEqual(1, self.manager.count_citations())
+
+    def test_drop_all(self):
+        """Test dropping all networks at once, then inserting one again."""
+        self.assertEqual(DropSummary(2, 3, 4, 3), self.manager.drop_networks())
+        self.assertEqual(DropSummary(0, 0, 0, 0), self.manager.drop_networks())
+
+        network = self.manager.insert_graph(self.graph_1, use_tqdm=False)
+        self.assertEqual(2, network.edges.count())
+        self.assertEqual(3, network.nodes.count())
+
+    def test_prune(self):
+        """Test pruning cleans up after networks whose links were deleted without cleaning up."""
+        self.manager.session.execute(network_edge.delete().where(network_edge.c.network_id == self.network_1.id))
+        self.manager.session.commit()
+        self.assertEqual(DropSummary(0, 1, 0, 1), self.manager.prune(chunk_size=1))
+        self.assertEqual(DropSummary(0, 0, 0, 0), self.manager.prune())
+
+        # The first network's nodes are still linked to it
+        self.assertEqual(DropSummary(1, 2, 1, 2), self.manager.drop_network_by_id(self.network_2.id))
+        self.assertEqual(DropSummary(1, 0, 3, 0), self.manager.drop_network_by_id(self.network_1.id))
@@ -6,6 +6,7 @@ import time
 import unittest
 from collections import Counter
 from random import randint
+from unittest import mock
 
 from pybel import BELGraph, from_bel_script, from_database, to_database
 from pybel.constants import (
@@ -19,9 +20,11 @@ from pybel.dsl import (
 )
 from pybel.dsl.namespaces import chebi, hgnc, mirbase
 from pybel.examples import ras_tloc_graph, sialic_acid_graph
+from pybel.io.line_utils import iterate_lines, parse_lines
 from pybel.language import Entity
 from pybel.manager import models
 from pybel.manager.models import Author, Citation, Edge, Evidence, NamespaceEntry, Node
+from pybel.manager.query_manager import graph_from_edges
 from pybel.testing.cases import FleetingTemporaryCacheMixin, TemporaryCacheClsMixin, TemporaryCacheMixin
 from pybel.testing.constants import test_bel_simple
 from pybel.testing.mocks import mock_bel_resources
@@ -168,6 +171,68 @@ class TestTemporaryInsertNetwork(TemporaryCacheMixin):
 
         # TODO check that the database doesn't have anything for TEST in it
 
+    def test_insert_edge_stream(self):
+        """Test inserting edges as they're streamed from a BEL script."""
+        lines = [
+            'SET DOCUMENT Name = "Streaming Test"',
+            'SET DOCUMENT Version = "1.0.0"',
+            'DEFINE NAMESPACE HGNC AS PATTERN ".*"',
+            'SET Citation = {"PubMed", "1"}',
+            'SET Evidence = "Evidence 1"',
+            'p(HGNC:A) -> p(HGNC:B)',
+            'p(HGNC:B) -> p(HGNC:C)',
+            'p(HGNC:A) -> p(HGNC:B)',
+            'p(HGNC:C, pmod(Ph)) -| p(HGNC:A)',
+        ]
+        graph = BELGraph()
+        parse_lines(graph, lines, manager=self.manager)
+
+        header = BELGraph()
+        network = self.manager.insert_graph(header, edges=iterate_lines(header, lines, manager=self.manager),
+                                            batch_size=2)
+
+        self.assertEqual('Streaming Test', network.name)
+        self.assertEqual({node.md5 for node in graph}, {node.md5 for node in network.nodes})
+        self.assertEqual({key for _, _, key in graph.edges(keys=True)}, {edge.md5 for edge in network.edges})
+
+        self.assertEqual(graph.number_of_edges(), len(list(network.iterate_edges())))
+        for stored_graph in (self.manager.get_graph_by_id(network.id), self.manager.get_universe_by_ids([network.id])):
+            self.assertEqual('Streaming Test', stored_graph.name)
+            self.assertEqual({'HGNC': '.*'}, stored_graph.namespace_pattern)
+            self.assertEqual(set(graph), set(stored_graph))
+            self.assertEqual(set(graph.edges(keys=True)), set(stored_graph.edges(keys=True)))
+
+    @mock.patch('pybel.manager.cache_manager.DEFAULT_IN_CLAUSE_SIZE', 2)
+    def test_insert_shared_rows(self):
+        """Test inserting graphs that share nodes, citations, evidences, and edges reuses their rows."""
+        a, b, c = (Protein(namespace='HGNC', name=name) for name in 'ABC')
+
+        def _make_graph(version, edges):
+            graph = BELGraph(name='Bulk Test', version=version)
+            graph.namespace_pattern['HGNC'] = '.*'
+            for u, v, citation in edges:
+                graph.add_increases(u, v, citation=citation, evidence='Evidence ' + citation)
+            graph.add_part_of(a, c)
+            return graph
+
+        first = _make_graph('1.0.0', [(a, b, '1'), (b, c, '2'), (a, c, '3')])
+        second = _make_graph('2.0.0', [(a, b, '1'), (c, a, '4')])
+        first_network = self.manager.insert_graph(first, use_tqdm=False)
+        second_network = self.manager.insert_graph(second, use_tqdm=False)
+
+        self.assertEqual(3, self.manager.count_nodes())
+        self.assertEqual(5, self.manager.count_edges())
+        self.assertEqual(4, self.manager.count_citations())
+        self.assertEqual(4, self.manager.session.query(Evidence).count())
+        for graph, network in ((first, first_network), (second, second_network)):
+            self.assertEqual({node.md5 for node in graph}, {node.md5 for node in network.nodes})
+            self.assertEqual({key for _, _, key in graph.edges(keys=True)}, {edge.md5 for edge in network.edges})
+
+        edge = self.manager.get_edge_by_hash(first.add_increases(a, b, citation='1', evidence='Evidence 1'))
+        self.assertEqual('1', edge.evidence.citation.db_id)
+        self.assertEqual(a.md5, edge.source.md5)
+        self.assertEqual('A', edge.source.namespace_entry.name)
+
 
 class TestTypedQuery(TemporaryCacheMixin):
     def setUp(self):
@@ -336,6 +401,43 @@ class TestQuery(TemporaryCacheMixin):
         # self.assertIn(..., name_dict_list2)
 
 
+class TestIterateEdges(TemporaryCacheMixin):
+    """Test iterating over edges a page at a time."""
+
+    def setUp(self):
+        """Insert a chain of edges."""
+        super().setUp()
+        self.graph = BELGraph(name='Iterate Edges', version='1.0.0')
+        self.graph.namespace_pattern['HGNC'] = '.*'
+        nodes = [Protein(namespace='HGNC', name=str(i)) for i in range(6)]
+        for i, (u, v) in enumerate(zip(nodes, nodes[1:])):
+            add_edge = self.graph.add_increases if i % 2 else self.graph.add_decreases
+            add_edge(u, v, citation=str(i), evidence='Evidence {}'.format(i))
+        self.manager.insert_graph(self.graph, use_tqdm=False)
+        self.edge_ids = [edge_id for edge_id, in self.manager.session.query(Edge.id).order_by(Edge.id)]
+
+    def test_pages(self):
+        """Test all edges are given in order for pages that do and don't divide the number of edges."""
+        for page_size in (1, 2, 5, 10):
+            with self.subTest(page_size=page_size):
+                edges = list(self.manager.iterate_edges(page_size=page_size, yield_per=1))
+                self.assertEqual(self.edge_ids, [edge.id for edge in edges])
+
+    def test_after(self):
+        """Test resuming after an edge."""
+        edges = self.manager.iterate_edges(after=self.edge_ids[1], page_size=2)
+        self.assertEqual(self.edge_ids[2:], [edge.id for edge in edges])
+
+    def test_query(self):
+        """Test iterating over the edges from a query and building a graph from them."""
+        query = self.manager.query_edges(relation=INCREASES).order_by(Edge.id.desc())
+        graph = graph_from_edges(self.manager.iterate_edges(query, page_size=1))
+        self.assertEqual(
+            {(u, v, k) for u, v, k, d in self.graph.edges(keys=True, data=True) if d[RELATION] == INCREASES},
+            set(graph.edges(keys=True)),
+        )
+
+
 class TestEnsure(TemporaryCacheMixin):
     def test_get_or_create_citation(self):
         reference = str(randint(1, 1000000))
@@ -397,6 +499,38 @@ class TestEnsure(TemporaryCacheMixin):
         self.assertEqual(author.name, author_from_get.name)
         self.assertEqual(author, author_from_get)
 
+    def test_cache_eviction(self):
+        """Test the least recently used authors are evicted from a bounded cache."""
+        self.manager.object_cache_author.maxsize = 2
+        first = self.manager.get_or_create_author('Author 1')
+        self.manager.get_or_create_author('Author 2')
+        self.assertIs(first, self.manager.get_or_create_author('Author 1'))
+        self.manager.get_or_create_author('Author 3')
+        self.manager.session.commit()
+
+        self.assertEqual({'Author 1', 'Author 3'}, set(self.manager.object_cache_author))
+        self.assertEqual((1, 3, 2, 2), tuple(self.manager.cache_info()['author']))
+
+        self.manager.clear_caches()
+        self.assertEqual((0, 0, 2, 0), tuple(self.manager.cache_info()['author']))
+        self.assertEqual(first, self.manager.get_or_create_author('Author 1'))
+
+    def test_cache_rollback(self):
+        """Test models added in a transaction that's rolled back are evicted from the caches."""
+        kept = self.manager.get_or_create_citation(identifier='1')
+        self.manager.session.commit()
+        self.manager.get_or_create_citation(identifier='2')
+        self.manager.get_or_create_author('Author 1')
+        self.manager.session.rollback()
+
+        self.assertEqual({'{}:1'.format(CITATION_TYPE_PUBMED)}, set(self.manager.curie_to_citation))
+        self.assertEqual(0, len(self.manager.object_cache_author))
+        self.assertIs(kept, self.manager.get_or_create_citation(identifier='1'))
+
+        author = self.manager.get_or_create_author('Author 1')
+        self.manager.session.commit()
+        self.assertEqual(author, self.manager.get_author_by_name('Author 1'))
+
 
 class TestEdgeStore(TemporaryCacheClsMixin, BelReconstitutionMixin):
     """Tests that the cache can be queried."""
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the full-text search indexes."""
+
+from pybel import BELGraph
+from pybel.dsl import Protein
+from pybel.manager.models import Edge, Evidence
+from pybel.testing.cases import TemporaryCacheMixin
+
+
+def _make_graph(name: str, evidences) -> BELGraph:
+    graph = BELGraph(name=name, version='1.0.0')
+    graph.namespace_pattern['HGNC'] = '.*'
+    for i, evidence in enumerate(evidences):
+        graph.add_increases(
+            Protein(namespace='HGNC', name='{}{}'.format(name, i)),
+            Protein(namespace='HGNC', name='{}{}'.format(name, i + 1)),
+            citation=str(i),
+            evidence=evidence,
+        )
+    return graph
+
+
+class TestSearchIndex(TemporaryCacheMixin):
+    """Test searches give the same results with and without search indexes."""
+
+    def setUp(self):
+        """Insert a network."""
+        super().setUp()
+        self.manager.insert_graph(_make_graph('A', [
+            'Kinase activity was increased',
+            'The kinase phosphorylates its "substrate"',
+            'Nothing to see here',
+            'kinase',
+        ]), use_tqdm=False)
+
+    def _search_edges_with_evidence(self, evidence):
+        return sorted(edge.id for edge in self.manager.search_edges_with_evidence(evidence))
+
+    def _search_evidences(self, query, **kwargs):
+        return [evidence.text for evidence in self.manager.search_evidences(query, **kwargs)]
+
+    def test_create(self):
+        """Test creating and dropping search indexes."""
+        self.assertFalse(self.manager.has_search_index())
+        self.manager.create_search_index()
+        self.assertTrue(self.manager.has_search_index())
+        self.manager._has_search_index = None
+        self.assertTrue(self.manager.has_search_index())
+        self.manager.drop_search_index()
+        self.assertFalse(self.manager.has_search_index())
+
+    def test_like(self):
+        """Test substring searches use the index without changing their results."""
+        patterns = ['%kinase%', 'kinase', '%KINASE%', '%to%', '%phosphorylates its "sub%']
+        expected = [self._search_edges_with_evidence(pattern) for pattern in patterns]
+        expected_nodes = [node.id for node in self.manager.query_nodes(bel='A1')]
+        self.assertEqual([3, 1, 3, 1, 1], [len(edge_ids) for edge_ids in expected])
+
+        self.manager.create_search_index()
+        self.assertEqual(expected, [self._search_edges_with_evidence(pattern) for pattern in patterns])
+        self.assertEqual(expected_nodes, [node.id for node in self.manager.query_nodes(bel='A1')])
+        self.assertEqual(2, self.manager.search_edges_with_bel('%HGNC:A2%').count())
+
+    def test_maintained(self):
+        """Test the index is kept up to date when networks are inserted and dropped."""
+        self.manager.create_search_index()
+        network = self.manager.insert_graph(_make_graph('B', ['A kinase cascade']), use_tqdm=False)
+        self.assertEqual(4, len(self._search_edges_with_evidence('%kinase%')))
+        self.assertIn('A kinase cascade', self._search_evidences('kinase'))
+
+        self.manager.drop_network(network)
+        self.manager.session.query(Evidence).filter(Evidence.text == 'A kinase cascade').delete()
+        self.manager.session.commit()
+        self.assertEqual(3, len(self._search_edges_with_evidence('%kinase%')))
+        self.assertNotIn('A kinase cascade', self._search_evidences('kinase'))
+
+    def test_ranked(self):
+        """Test ranked searches page through the same results with and without an index."""
+        for create in (False, True):
+            if create:
+                self.manager.create_search_index()
+            with self.subTest(index=create):
+                results = self._search_evidences('kinase')
+                self.assertEqual('kinase', results[0])
+                self.assertEqual(3, len(results))
+                self.assertEqual(results[1:], self._search_evidences('kinase', limit=2, offset=1))
+                self.assertEqual(['The kinase phosphorylates its "substrate"'], self._search_evidences('"sub'))
+                self.assertEqual(['Nothing to see here'], self._search_evidences('to'))
+                self.assertEqual(1, len(self.manager.search_nodes('HGNC:A4')))
+                self.assertEqual(4, len(self.manager.search_edges('increases')))
+                self.assertEqual([], self.manager.search_namespace_entries('kinase'))
+
+    def test_drop_all(self):
+        """Test dropping everything drops the search indexes too."""
+        self.manager.create_search_index()
+        self.manager.drop_all()
+        self.assertFalse(self.manager.has_search_index())
+        self.manager.create_all()
+        self.assertEqual(0, self.manager.session.query(Edge).count())
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the cache of merged query universes."""
+
+import os
+import tempfile
+from unittest import mock
+
+from pybel import BELGraph
+from pybel.dsl import Protein
+from pybel.manager.cache_manager import NetworkManager
+from pybel.struct.query import Query
+from pybel.testing.cases import TemporaryCacheMixin
+
+
+def _make_graph(name: str, *names: str) -> BELGraph:
+    graph = BELGraph(name=name, version='1.0.0')
+    graph.namespace_pattern['HGNC'] = '.*'
+    nodes = [Protein(namespace='HGNC', name=node_name) for node_name in names]
+    for i, (u, v) in enumerate(zip(nodes, nodes[1:])):
+        graph.add_increases(u, v, citation=str(i), evidence='Evidence {}'.format(i))
+    return graph
+
+
+class TestUniverseCache(TemporaryCacheMixin):
+    """Test merged query universes are reused until their networks change."""
+
+    def setUp(self):
+        """Insert two networks."""
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.network_1 = self.manager.insert_graph(_make_graph('Universe 1', 'A', 'B', 'C'), use_tqdm=False)
+        self.network_2 = self.manager.insert_graph(_make_graph('Universe 2', 'C', 'D'), use_tqdm=False)
+        self.network_ids = [self.network_2.id, self.network_1.id]
+
+    def tearDown(self):
+        """Remove the universe cache directory."""
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_cached(self):
+        """Test the same universe is returned for the same networks, in any order, without merging them again."""
+        universe = self.manager.get_universe_by_ids(self.network_ids)
+        self.assertEqual(4, universe.number_of_nodes())
+        self.assertEqual(3, universe.number_of_edges())
+
+        with mock.patch.object(NetworkManager, 'get_graph_by_ids') as get_graph_by_ids:
+            self.assertIs(universe, self.manager.get_universe_by_ids(reversed(self.network_ids)))
+            self.assertEqual(4, Query(self.network_ids).run(self.manager).number_of_nodes())
+            get_graph_by_ids.assert_not_called()
+
+        self.assertEqual(1, len(self.manager.universe_cache))
+
+    def test_eviction(self):
+        """Test the least recently used universe is evicted when the cache is full."""
+        self.manager.universe_cache.maxsize = 1
+        self.manager.get_universe_by_ids([self.network_1.id])
+        self.manager.get_universe_by_ids(self.network_ids)
+        self.assertEqual(1, len(self.manager.universe_cache))
+        self.assertEqual(2, self.manager.universe_cache.cache_info().misses)
+
+    def test_drop(self):
+        """Test dropping a network evicts the universes that include it, but not the others."""
+        self.manager.get_universe_by_ids(self.network_ids)
+        self.manager.get_universe_by_ids([self.network_2.id])
+        self.manager.drop_network_by_id(self.network_1.id)
+        self.assertEqual(1, len(self.manager.universe_cache))
+
+        network_3 = self.manager.insert_graph(_make_graph('Universe 3', 'E', 'F'), use_tqdm=False)
+        universe = self.manager.get_universe_by_ids([self.network_2.id, network_3.id])
+        self.assertEqual(4, universe.number_of_nodes())
+
+    def test_directory(self):
+        """Test universes are stored in the cache directory and read by other managers."""
+        self.manager.universe_cache_directory = self.directory.name
+        universe = self.manager.get_universe_by_ids(self.network_ids)
+        self.assertEqual(1, len(os.listdir(self.directory.name)))
+
+        self.manager.universe_cache.clear()
+        with mock.patch.object(NetworkManager, 'get_graph_by_ids') as get_graph_by_ids:
+            from_disk = self.manager.get_universe_by_ids(self.network_ids)
+            get_graph_by_ids.assert_not_called()
+        self.assertEqual(set(universe), set(from_disk))
+        self.assertEqual(set(universe.edges(keys=True)), set(from_disk.edges(keys=True)))
+
+        self.manager.drop_network_by_id(self.network_2.id)
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    def test_missing(self):
+        """Test getting a universe for networks that don't exist fails like before and isn't cached."""
+        with self.assertRaises(AttributeError):
+            self.manager.get_universe_by_ids([self.network_1.id + 1000])
+        self.assertEqual(0, len(self.manager.universe_cache))
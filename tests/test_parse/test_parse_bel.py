@@ -5,6 +5,7 @@
 import logging
 import re
 import unittest
+from unittest import mock
 
 from pybel import BELGraph
 from pybel.constants import (
@@ -20,10 +21,12 @@ from pybel.dsl import (
     protein_fusion, reaction, rna, rna_fusion, secretion, translocation,
 )
 from pybel.dsl.namespaces import hgnc
-from pybel.exceptions import MalformedTranslocationWarning
+from pybel.exceptions import MalformedTranslocationWarning, MissingNamespaceNameWarning
 from pybel.language import Entity, activity_mapping
-from pybel.parser import BELParser
-from pybel.parser.parse_bel import modifier_po_to_dict
+from pybel.parser import BELParser, get_bel_parser
+from pybel.parser.parse_bel import (
+    _SIMPLE_FUNCTIONS, _SIMPLE_RELATIONS, modifier_po_to_dict, parse_result_to_dsl,
+)
 from tests.constants import TestTokenParserBase, assert_has_edge, assert_has_node, update_provenance
 
 logger = logging.getLogger(__name__)
@@ -2018,3 +2021,160 @@ class TestSemantics(unittest.TestCase):
 
         node = bioprocess(namespace=DIRTY, name='ABASD')
         self.assertIn(node, graph)
+
+
+class TestTermCache(unittest.TestCase):
+    """Test the cache of parsed terms in the BEL parser."""
+
+    def setUp(self):
+        """Build a BEL parser with a small term cache."""
+        self.graph = BELGraph()
+        self.parser = BELParser(self.graph, skip_validation=True, term_cache_size=2)
+        update_provenance(self.parser.control_parser)
+
+    def test_hits(self):
+        """Test that repeated terms are cached and give the same graph."""
+        statement = 'act(p(HGNC:AKT1), ma(kin)) -> p(HGNC:MAPT, pmod(Ph))'
+        self.parser.parseString(statement)
+        info = self.parser.get_term_cache_info()
+        self.assertEqual(2, info.misses)
+        self.assertEqual(2, info.currsize)
+
+        self.parser.parseString(statement)
+        self.assertLess(info.hits, self.parser.get_term_cache_info().hits)
+        self.assertEqual(info.misses, self.parser.get_term_cache_info().misses)
+        self.assertEqual(3, self.graph.number_of_nodes())
+        self.assertEqual(2, self.graph.number_of_edges())
+
+        graph = BELGraph()
+        parser = BELParser(graph, skip_validation=True, term_cache_size=0)
+        update_provenance(parser.control_parser)
+        parser.parseString(statement)
+        self.assertIsNone(parser.get_term_cache_info())
+        self.assertEqual(set(graph.edges(keys=True)), set(self.graph.edges(keys=True)))
+
+    def test_nodes(self):
+        """Test that the nodes made from cached terms are reused."""
+        statement = 'act(p(HGNC:AKT1), ma(kin)) -> p(HGNC:MAPT, pmod(Ph))'
+        self.parser.parseString(statement)
+        with mock.patch('pybel.parser.parse_bel.parse_result_to_dsl', wraps=parse_result_to_dsl) as mock_dsl:
+            self.parser.parseString(statement)
+        mock_dsl.assert_not_called()
+
+    def test_bounded(self):
+        """Test that the least recently used terms are evicted."""
+        for name in ('A', 'B', 'C', 'A'):
+            self.parser.parseString('p(HGNC:{})'.format(name))
+        info = self.parser.get_term_cache_info()
+        self.assertEqual(4, info.misses)
+        self.assertEqual(2, info.currsize)
+
+    def test_warnings_not_cached(self):
+        """Test that terms that raise warnings keep raising them."""
+        parser = BELParser(self.graph, skip_validation=True, disallow_unqualified_translocations=True)
+        for _ in range(2):
+            with self.assertRaises(MalformedTranslocationWarning):
+                parser.parseString('tloc(p(HGNC:AKT1))')
+        self.assertEqual(0, parser.get_term_cache_info().currsize)
+
+
+class TestFastPath(unittest.TestCase):
+    """Test the fast path for simple statements gives the same results as the full grammar."""
+
+    def _help_test_same(self, lines, **kwargs):
+        graphs, results = [], []
+        for use_fast_path in (False, True):
+            graph = BELGraph()
+            parser = BELParser(graph, use_fast_path=use_fast_path, **kwargs)
+            update_provenance(parser.control_parser)
+            rv = []
+            for line in lines:
+                try:
+                    rv.append(parser.parseString(line).asDict())
+                except Exception as e:
+                    rv.append((e.__class__, str(e)))
+            graphs.append(graph)
+            results.append(rv)
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(list(graphs[0]), list(graphs[1]))
+        self.assertEqual(graphs[0].number_of_edges(), graphs[1].number_of_edges())
+        for u, v, k, d in graphs[0].edges(keys=True, data=True):
+            self.assertEqual(d, graphs[1][u][v][k])
+
+    def test_all_functions_and_relations(self):
+        """Test every function and relation handled by the fast path."""
+        lines = [
+            '{}(HGNC:A{}) {} {}(GO:"x y")'.format(func, i, relation, target_func)
+            for i, func in enumerate(_SIMPLE_FUNCTIONS)
+            for relation in _SIMPLE_RELATIONS
+            for target_func in ('p', 'bp', 'complex')
+        ]
+        self._help_test_same(lines, skip_validation=True)
+
+    def test_warnings(self):
+        """Test that statements that raise warnings fall back to the full grammar."""
+        lines = [
+            'p(HGNC:AKT1) -> p(HGNC:AKT2)',
+            'p(HGNC:AKT1) -> p(HGNC:NOPE)',
+            'g(HGNC:AKT1) -> p(HGNC:AKT2)',
+            'bp(HGNC:AKT1) -> p(HGNC:AKT2)',
+            'p(HGNC:AKT1) -> p(NOPE:AKT2)',
+            'p(HGNC:AKT1) hasVariant p(HGNC:AKT2)',
+            'p(HGNC:AKT1)->p(HGNC:AKT2)',
+        ]
+        self._help_test_same(lines, namespace_to_term_to_encoding={
+            'HGNC': {('1', 'AKT1'): 'GRP', ('2', 'AKT2'): 'P'},
+        })
+
+
+class TestReusedParser(unittest.TestCase):
+    """Test reusing the grammar of a BEL parser for new graphs and terminologies."""
+
+    def test_get_bel_parser(self):
+        """Test the same parser is rebound to each graph."""
+        namespaces = {'HGNC': {('1', 'AKT1'): 'GRP'}}
+        graph = BELGraph()
+        with get_bel_parser(graph, namespace_to_term_to_encoding=namespaces, term_cache_size=8) as parser:
+            update_provenance(parser.control_parser)
+            parser.parseString('p(HGNC:AKT1) -> p(HGNC:AKT1, pmod(Ph))')
+        self.assertEqual(2, graph.number_of_nodes())
+        self.assertIsNone(parser.graph)
+        self.assertIsNone(parser.parser_kwargs['namespace_to_term_to_encoding'])
+        self.assertEqual({}, parser.concept_parser.namespace_to_name_to_encoding)
+
+        new_graph = BELGraph()
+        with get_bel_parser(new_graph, namespace_to_term_to_encoding={'HGNC': {('2', 'AKT2'): 'GRP'}},
+                            term_cache_size=8) as new_parser:
+            self.assertIs(parser, new_parser)
+            self.assertIs(new_graph, new_parser.graph)
+            self.assertIsNone(new_parser.control_parser.citation_db)
+            self.assertEqual(0, new_parser.get_term_cache_info().currsize)
+
+            update_provenance(new_parser.control_parser)
+            with self.assertRaises(MissingNamespaceNameWarning):
+                new_parser.parseString('p(HGNC:AKT1) -> p(HGNC:AKT2)')
+            new_parser.parseString('p(HGNC:AKT2) -> p(HGNC:AKT2, pmod(Ph))')
+        self.assertEqual(2, graph.number_of_nodes())
+        self.assertEqual(2, new_graph.number_of_nodes())
+
+        with get_bel_parser(BELGraph(), skip_validation=True, term_cache_size=8) as other_parser:
+            self.assertIsNot(parser, other_parser)
+        with self.assertRaises(ValueError):
+            parser.rebind()
+
+    def test_get_bel_parser_borrowed(self):
+        """Test a parser that's still in use isn't given out again."""
+        with get_bel_parser(BELGraph(), skip_validation=True) as parser:
+            with get_bel_parser(BELGraph(), skip_validation=True) as other_parser:
+                self.assertIsNot(parser, other_parser)
+                parser.parseString('SET Citation = {"PubMed", "1"}')
+                self.assertIsNone(other_parser.control_parser.citation_db)
+
+    def test_separate_control_parsers(self):
+        """Test that building another parser doesn't take over the citation handling of the first."""
+        first = BELParser(BELGraph(), skip_validation=True)
+        second = BELParser(BELGraph(), skip_validation=True)
+        first.parseString('SET Citation = {"PubMed", "1"}')
+        self.assertIsNotNone(first.control_parser.citation_db)
+        self.assertIsNone(second.control_parser.citation_db)
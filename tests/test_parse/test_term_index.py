@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for memory-mapped namespace term indexes."""
+
+import os
+import pickle
+import tempfile
+import unittest
+
+from pybel.exceptions import MissingNamespaceNameWarning
+from pybel.parser import ConceptParser
+from pybel.parser.term_index import TermIndex, get_term_index
+
+TERMS = {
+    ('HGNC:391', 'AKT1'): 'GRP',
+    ('HGNC:392', 'AKT2'): 'GRP',
+    (None, 'Ünicode'): 'A',
+    ('HGNC:11998', 'TP53'): 'GRP',
+}
+
+
+class TestTermIndex(unittest.TestCase):
+    """Test building and reading term indexes."""
+
+    def setUp(self):
+        """Build a term index in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.terms')
+        self.index = TermIndex.build(self.path, TERMS)
+
+    def tearDown(self):
+        """Close the term index and remove the temporary directory."""
+        self.index.close()
+        self.directory.cleanup()
+
+    def test_mapping(self):
+        """Test the term index has the same terms as the mapping it was built from."""
+        self.assertEqual(len(TERMS), len(self.index))
+        self.assertEqual(TERMS, dict(self.index.items()))
+        self.assertEqual(TERMS, dict(self.index))
+        self.assertEqual('GRP', self.index['HGNC:391', 'AKT1'])
+        self.assertNotIn(('HGNC:392', 'AKT1'), self.index)
+
+    def test_names(self):
+        """Test looking up encodings by name."""
+        self.assertEqual({name: encoding for (_, name), encoding in TERMS.items()}, dict(self.index.names))
+        self.assertEqual('A', self.index.names['Ünicode'])
+        self.assertIn('TP53', self.index.names)
+        self.assertNotIn('AKT3', self.index.names)
+        self.assertNotIn('', self.index.names)
+
+    def test_identifiers(self):
+        """Test looking up encodings by identifier, skipping terms without one."""
+        self.assertEqual(3, len(self.index.identifiers))
+        self.assertEqual(
+            {identifier: encoding for (identifier, _), encoding in TERMS.items() if identifier},
+            dict(self.index.identifiers),
+        )
+        self.assertNotIn('HGNC:1', self.index.identifiers)
+        self.assertNotIn('', self.index.identifiers)
+        with self.assertRaises(KeyError):
+            _ = self.index.identifiers['HGNC:1']
+
+    def test_empty(self):
+        """Test building a term index without any terms."""
+        index = TermIndex.build(os.path.join(self.directory.name, 'empty.terms'), {})
+        self.assertEqual(0, len(index))
+        self.assertNotIn('AKT1', index.names)
+        index.close()
+
+    def test_shared(self):
+        """Test term indexes are opened once per process and pickled by their path."""
+        path = os.path.join(self.directory.name, 'shared.terms')
+        index = get_term_index(path, lambda: TERMS)
+        self.assertIs(index, get_term_index(path, dict))
+        self.assertIs(index, pickle.loads(pickle.dumps(index)))
+
+    def test_parser(self):
+        """Test a concept parser validates names against a term index."""
+        parser = ConceptParser(namespace_to_term_to_encoding={'HGNC': self.index})
+        self.assertIs(self.index.names, parser.namespace_to_name_to_encoding['HGNC'])
+        result = parser.parseString('HGNC:AKT1')
+        self.assertEqual('AKT1', result['name'])
+        with self.assertRaises(MissingNamespaceNameWarning):
+            parser.parseString('HGNC:AKT3')
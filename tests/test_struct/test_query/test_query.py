@@ -4,20 +4,23 @@
 
 import logging
 import unittest
+from unittest import mock
 
 from pybel import BELGraph, Pipeline
-from pybel.dsl import Protein
+from pybel.dsl import ComplexAbundance, Hgvs, Protein
 from pybel.examples.egf_example import egf_graph, vcp
 from pybel.examples.homology_example import (
     homology_graph, mouse_csf1_protein, mouse_csf1_rna, mouse_mapk1_protein, mouse_mapk1_rna,
 )
 from pybel.examples.sialic_acid_example import (cd33_phosphorylated, dap12, shp1, shp2, sialic_acid_graph, syk, trem2)
+from pybel.manager import NetworkManager
 from pybel.struct import expand_node_neighborhood, expand_nodes_neighborhoods, get_subgraph_by_annotation_value
 from pybel.struct.mutation import collapse_to_genes, enrich_protein_and_rna_origins
 from pybel.struct.query import Query, QueryMissingNetworksError, Seeding
+from pybel.testing.cases import TemporaryCacheMixin
 from pybel.testing.generate import generate_random_graph
 from pybel.testing.mock_manager import MockQueryManager
-from pybel.testing.utils import n
+from pybel.testing.utils import make_dummy_annotations, n
 
 log = logging.getLogger(__name__)
 
@@ -305,3 +308,130 @@ class QueryTest(unittest.TestCase):
         self.assertIn(mouse_csf1_protein, result)
 
         self.assertEqual(2, result.number_of_edges())
+
+
+class TestPushDown(TemporaryCacheMixin):
+    """Test running seeds in the database gives the same results as running them on the universe."""
+
+    def setUp(self):
+        """Insert two networks that share a node."""
+        super().setUp()
+        self.a, self.b, self.c, self.d, self.e, self.f = (
+            Protein(namespace='HGNC', name=name)
+            for name in 'ABCDEF'
+        )
+
+        graph_1 = BELGraph(name='Push Down 1', version='1.0.0')
+        graph_1.namespace_pattern['HGNC'] = '.*'
+        graph_1.annotation_list['Species'] = {'9606', '10090'}
+        graph_1.add_increases(self.a, self.b, citation='1', evidence='1', annotations={'Species': '9606'})
+        graph_1.add_decreases(self.b, self.c, citation='2', evidence='2', annotations={'Species': '10090'})
+        graph_1.add_association(self.c, self.d, citation='3', evidence='3', annotations={'Species': '9606'})
+        graph_1.add_node_from_data(self.f)
+        make_dummy_annotations(self.manager, graph_1)
+
+        graph_2 = BELGraph(name='Push Down 2', version='1.0.0')
+        graph_2.namespace_pattern['HGNC'] = '.*'
+        graph_2.add_increases(self.d, self.e, citation='3', evidence='4')
+        graph_2.add_part_of(self.a, self.e)
+        # Adding these nodes also adds their hasVariant and partOf edges
+        self.complex = ComplexAbundance([self.a, Protein(namespace='HGNC', name='G')])
+        self.variant = Protein(namespace='HGNC', name='H', variants=[Hgvs('p.Ala1Thr')])
+        graph_2.add_increases(self.complex, self.variant, citation='5', evidence='5')
+
+        self.network_ids = [
+            self.manager.insert_graph(graph, use_tqdm=False).id
+            for graph in (graph_1, graph_2)
+        ]
+
+    def _help_test_push_down(self, query: Query) -> BELGraph:
+        self.assertTrue(query._can_push_down(self.manager))
+        with mock.patch.object(NetworkManager, 'get_universe_by_ids') as get_universe_by_ids:
+            pushed_down = query.run(self.manager)
+            get_universe_by_ids.assert_not_called()
+
+        expected = query.run(self.manager, push_down=False)
+        self.assertEqual(expected.graph, pushed_down.graph)
+        self.assertEqual(set(expected), set(pushed_down))
+        self.assertEqual(
+            {(u, v, k): d for u, v, k, d in expected.edges(keys=True, data=True)},
+            {(u, v, k): d for u, v, k, d in pushed_down.edges(keys=True, data=True)},
+        )
+        return pushed_down
+
+    def test_induction(self):
+        """Test inducing over nodes, including one without any edges."""
+        query = Query(self.network_ids)
+        query.append_seeding_induction([self.a, self.b, self.e, self.f])
+        result = self._help_test_push_down(query)
+        self.assertEqual(4, result.number_of_nodes())
+        self.assertEqual(2, result.number_of_edges())
+
+    def test_neighbors(self):
+        """Test seeding by the neighbors of nodes across both networks."""
+        query = Query(self.network_ids)
+        query.append_seeding_neighbors([self.d])
+        query.append_pipeline(collapse_to_genes)
+        result = self._help_test_push_down(query)
+        self.assertEqual({'HGNC': '.*'}, result.namespace_pattern)
+
+    def test_pubmed(self):
+        """Test seeding by citations."""
+        query = Query(self.network_ids)
+        query.seeding.append({'type': 'pubmed', 'data': ['1', '3']})
+        result = self._help_test_push_down(query)
+        self.assertEqual(4, result.number_of_edges())
+
+    def test_annotation(self):
+        """Test seeding by annotations stored in the edge store."""
+        query = Query(self.network_ids)
+        query.append_seeding_annotation('Species', {'9606'})
+        result = self._help_test_push_down(query)
+        self.assertEqual(3, result.number_of_edges())  # the association goes both ways
+
+    def test_implied_edges(self):
+        """Test the parents and members of seeded nodes aren't added with their edges unless they match the seeds."""
+        g, h = Protein(namespace='HGNC', name='G'), Protein(namespace='HGNC', name='H')
+
+        query = Query(self.network_ids)
+        query.append_seeding_induction([self.complex, g, self.variant])
+        result = self._help_test_push_down(query)
+        self.assertEqual({self.complex, g, self.variant}, set(result))
+        self.assertEqual(2, result.number_of_edges())
+
+        query = Query(self.network_ids)
+        query.append_seeding_neighbors([self.variant])
+        result = self._help_test_push_down(query)
+        self.assertEqual({self.complex, h, self.variant}, set(result))
+
+        query = Query(self.network_ids)
+        query.seeding.append({'type': 'pubmed', 'data': ['5']})
+        result = self._help_test_push_down(query)
+        self.assertEqual({self.complex, self.variant}, set(result))
+
+    def test_missing_nodes(self):
+        """Test seeding by nodes that aren't in the networks gives nothing."""
+        query = Query(self.network_ids[1:])
+        query.append_seeding_induction([self.b, self.c])
+        self.assertIsNone(self.manager.get_subgraph_by_seeding(query.network_ids, query.seeding))
+        self.assertIsNone(query.run(self.manager))
+
+    def test_fallback(self):
+        """Test seeds and pipelines that need the universe aren't run in the database."""
+        query = Query(self.network_ids)
+        query.append_seeding_sample(number_edges=2)
+        self.assertFalse(query._can_push_down(self.manager))
+
+        query = Query(self.network_ids)
+        query.append_seeding_annotation('Cell', {'Neuron'})
+        self.assertFalse(query._can_push_down(self.manager))
+
+        query = Query(self.network_ids)
+        query.append_seeding_neighbors([self.a])
+        query.append_pipeline(expand_nodes_neighborhoods, [self.b])
+        self.assertFalse(query._can_push_down(self.manager))
+        self.assertIn(self.c, query.run(self.manager))
+
+        query = Query(self.network_ids, pipeline=Pipeline.union([Pipeline.from_functions([collapse_to_genes])]))
+        query.append_seeding_neighbors([self.a])
+        self.assertTrue(query._can_push_down(self.manager))
@@ -11,8 +11,8 @@ from io import StringIO
 import pybel
 import pybel.examples
 from pybel import BELGraph
-from pybel.constants import CITATION_TYPE_PUBMED, IDENTIFIER, NAMESPACE
-from pybel.dsl import hgvs, protein
+from pybel.constants import CITATION_TYPE_PUBMED, IDENTIFIER, INCREASES, NAMESPACE, PART_OF
+from pybel.dsl import activity, hgvs, protein
 from pybel.io.api import InvalidExtensionError
 from pybel.testing.utils import n
 
@@ -228,6 +228,38 @@ class TestGetGraphProperties(unittest.TestCase):
 
         self.assertEqual(2, graph.number_of_nodes())
 
+    def test_add_qualified_edges(self):
+        """Test adding qualified edges in bulk gives the same graph as adding them one at a time."""
+        source, target = protein(namespace='TEST', name='YFG'), protein(namespace='TEST', name='YFG2', variants=hgvs('?'))
+        edges = [
+            (source, target, dict(relation=INCREASES, citation='1', evidence='e1', annotations={'Species': '9606'})),
+            (source, target, dict(relation=INCREASES, citation='1', evidence='e1', target_modifier=activity())),
+            (target, source, dict(relation=INCREASES, citation='2', evidence='e2')),
+        ]
+        expected = BELGraph()
+        expected_keys = [
+            expected.add_qualified_edge(u, v, **kwargs)
+            for u, v, kwargs in edges
+        ]
+
+        keys = self.graph.add_qualified_edges(edges + edges[:1])
+        self.assertEqual(expected_keys + expected_keys[:1], keys)
+        self.assertEqual(4, self.graph.number_of_edges())
+        self.assertEqual(set(expected.edges(keys=True)), set(self.graph.edges(keys=True)))
+        for u, v, key, data in expected.edges(keys=True, data=True):
+            self.assertEqual(data, self.graph[u][v][key])
+        self.assertIs(self.graph._succ[source][target], self.graph._pred[target][source])
+
+        self.assertEqual(keys[:1], self.graph.add_qualified_edges(edges[:1]))
+        self.assertEqual(4, self.graph.number_of_edges())
+
+    def test_add_unqualified_edges(self):
+        """Test adding unqualified edges in bulk."""
+        source, target = protein(namespace='TEST', name='YFG'), protein(namespace='TEST', name='YFG2')
+        keys = self.graph.add_unqualified_edges([(source, target, PART_OF), (source, target, PART_OF)])
+        self.assertEqual([self.graph.add_part_of(source, target)] * 2, keys)
+        self.assertEqual(1, self.graph.number_of_edges())
+
 
 class TestExtensionIO(unittest.TestCase):
     def test_io(self):
@@ -2,12 +2,21 @@
 
 """Tests for PyBEL utilities."""
 
+import hashlib
+import pickle
 import unittest
 
+from pybel.constants import INCREASES
+from pybel.dsl import Protein, activity
 from pybel.exceptions import PlaceholderAminoAcidWarning
+from pybel.language import CitationDict
 from pybel.parser.modifiers.constants import amino_acid
 from pybel.parser.utils import nest
-from pybel.utils import expand_dict, flatten_dict, tokenize_version
+from pybel.struct.graph import BELGraph
+from pybel.utils import (
+    EDGE_DIGESTS, canonicalize_edge, expand_dict, flatten_dict, get_default_edge_digest, hash_edge,
+    set_default_edge_digest, tokenize_version,
+)
 
 
 class TestTokenizeVersion(unittest.TestCase):
@@ -32,6 +41,54 @@ class TestTokenizeVersion(unittest.TestCase):
         self.assertEqual(version_tuple, tokenize_version(version_str))
 
 
+class TestHashEdge(unittest.TestCase):
+    """Test hashing edges."""
+
+    def setUp(self):
+        """Set up an edge."""
+        self.u = Protein('hgnc', name='AKT1', identifier='391')
+        self.v = Protein('hgnc', name='MAPK1')
+        self.data = BELGraph._build_attr(
+            relation=INCREASES,
+            citation=CitationDict(namespace='pubmed', identifier='1234'),
+            evidence='Some evidence',
+            target_modifier=activity('kin'),
+        )
+
+    def test_md5_compatible(self):
+        """Test the MD5 digest gives the same keys as previous versions."""
+        edge_tuple = (
+            self.u.as_bel(),
+            self.v.as_bel(),
+            'pubmed:1234',
+            'Some evidence',
+            canonicalize_edge(self.data),
+        )
+        expected = hashlib.md5(pickle.dumps(edge_tuple)).hexdigest()  # noqa: S303
+        self.assertEqual('md5', get_default_edge_digest())
+        self.assertEqual(expected, hash_edge(self.u, self.v, self.data))
+        self.assertEqual(expected, hash_edge(self.u, self.v, self.data, digest='md5'))
+
+    @unittest.skipUnless('xxh3' in EDGE_DIGESTS, 'xxhash is not installed')
+    def test_xxh3(self):
+        """Test the XXH3 digest."""
+        key = hash_edge(self.u, self.v, self.data, digest='xxh3')
+        self.assertNotEqual(hash_edge(self.u, self.v, self.data), key)
+        self.assertEqual(key, hash_edge(Protein('hgnc', name='AKT1', identifier='391'), self.v, self.data, 'xxh3'))
+        self.assertNotEqual(key, hash_edge(self.v, self.u, self.data, digest='xxh3'))
+
+        set_default_edge_digest('xxh3')
+        try:
+            self.assertEqual(key, hash_edge(self.u, self.v, self.data))
+        finally:
+            set_default_edge_digest('md5')
+
+    def test_invalid_digest(self):
+        """Test setting an invalid digest."""
+        with self.assertRaises(ValueError):
+            set_default_edge_digest('nope')
+
+
 class TestRandom(unittest.TestCase):
     def test_nest_failure(self):
         with self.assertRaises(ValueError):